@@ -0,0 +1,79 @@
+"""Benchmark the per-read cost of the decoded state guard.
+
+Usage::
+
+    $ python benchmarks/bench_get.py [--keys N] [--repeat N]
+
+Compares :meth:`get` of a decoded filesystem backend, whose guard is
+removed on decoding, against the previous guard, which wrapped ``get``
+with :func:`~pitstop.backends.base.requires_decoded` on every attribute
+access, and against a :class:`~pitstop.backends.base.DictBackend` with no
+guard at all.
+
+"""
+import argparse
+import dataclasses
+import json
+import os
+import tempfile
+
+import bench_json
+
+import pitstop.backends.base
+import pitstop.backends.fs
+import pitstop.encodings.json
+
+
+@dataclasses.dataclass
+class WrappingFilesystemBackend(pitstop.backends.fs.FilesystemBackend):
+    """A filesystem backend guarding reads as before."""
+
+    def __getattribute__(self, name):  # noqa: D105
+        attr = super().__getattribute__(name)
+        if name in ('get', 'get_many'):
+            return pitstop.backends.base.requires_decoded(attr)
+        return attr
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    document = {f'key{i}': i for i in range(args.keys)}
+    keys = list(document)
+    print(f'keys: {args.keys}, repeat: {args.repeat}')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.json')
+        with open(path, 'w') as f:
+            json.dump(document, f)
+        backends = {}
+        for label, cls in (
+            ('fs get (wrapped)', WrappingFilesystemBackend),
+            ('fs get', pitstop.backends.fs.FilesystemBackend),
+        ):
+            backend = cls(
+                pitstop.backends.fs.FilesystemBackendOptions(path=path),
+                priority=1,
+                name='fs',
+                encoding=pitstop.encodings.json.JSONEncoding.with_options()(),
+            )
+            backend.connect()
+            backend.decode()
+            backends[label] = backend
+        backends['dict get'] = pitstop.backends.base.DictBackend(
+            priority=1, name='dict', obj=document
+        )
+        for label, backend in backends.items():
+            elapsed = bench_json.best_of(
+                args.repeat, lambda: [backend.get(key) for key in keys]
+            )
+            print(f'{label:<20} {elapsed * 1e6 / args.keys:>9.0f} ns/key')
+        for backend in backends.values():
+            backend.cleanup()
+
+
+if __name__ == '__main__':
+    main()
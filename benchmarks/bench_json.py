@@ -0,0 +1,94 @@
+"""Benchmark JSON encodings on large documents.
+
+Usage::
+
+    $ python benchmarks/bench_json.py [--tenants N] [--repeat N]
+
+Compares decoding with :class:`~pitstop.encodings.json.JSONEncoding`
+against :class:`~pitstop.encodings.json.FastJSONEncoding` using each
+installed accelerated parser, and encoding with :func:`json.dumps`
+against :func:`pitstop.encodings.json.dumps`.
+
+"""
+import argparse
+import importlib
+import json
+import time
+import typing
+
+import pitstop.encodings.json
+
+
+def make_document(tenants: int) -> typing.Dict[str, typing.Any]:
+    """Generate a multi-tenant configuration document."""
+    return {
+        'tenants': {
+            f'tenant-{i}': {
+                'name': f'Tenant {i}',
+                'enabled': i % 3 != 0,
+                'limits': {'requests': i * 10, 'burst': 2.5, 'quota': None},
+                'db': {
+                    'host': f'db-{i % 16}.internal',
+                    'port': 5432,
+                    'replicas': [f'replica-{i}-{n}' for n in range(3)],
+                },
+                'features': {f'flag_{n}': bool((i + n) % 2) for n in range(8)},
+            }
+            for i in range(tenants)
+        }
+    }
+
+
+def best_of(repeat: int, func: typing.Callable[[], typing.Any]) -> float:
+    """Get the fastest of **repeat** runs of **func**, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    document = make_document(args.tenants)
+    data = json.dumps(document).encode()
+    print(f'document: {len(data) / 1e6:.1f} MB, repeat: {args.repeat}')
+
+    stdlib = pitstop.encodings.json.JSONEncoding.with_options()()
+    baseline = best_of(args.repeat, lambda: stdlib.decode(data))
+    print(f'{"decode json":<24} {baseline:>9.1f} ms')
+    for name in pitstop.encodings.json.DEFAULT_PARSERS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            print(f'{"decode " + name:<24} {"n/a":>9}')
+            continue
+        encoding = pitstop.encodings.json.FastJSONEncoding.with_options(
+            parsers=(name,)
+        )()
+        elapsed = best_of(args.repeat, lambda: encoding.decode(data))
+        print(
+            f'{"decode " + name:<24} {elapsed:>9.1f} ms '
+            f'({baseline / elapsed:.1f}x)'
+        )
+
+    baseline = best_of(args.repeat, lambda: json.dumps(document))
+    elapsed = best_of(
+        args.repeat, lambda: pitstop.encodings.json.dumps(document)
+    )
+    name = pitstop.encodings.json.json_parser().name
+    print(f'{"encode json":<24} {baseline:>9.1f} ms')
+    print(
+        f'{"encode " + name:<24} {elapsed:>9.1f} ms '
+        f'({baseline / elapsed:.1f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
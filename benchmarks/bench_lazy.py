@@ -0,0 +1,48 @@
+"""Benchmark lazy configuration views against resolving up front.
+
+Usage::
+
+    $ python benchmarks/bench_lazy.py [--sections N] [--keys N]
+
+Resolves a schema of **sections** top-level dictionaries of **keys**
+leaves each from a dictionary backend, and compares reading a single
+key after resolving every key against reading it, or every key of its
+section, from a new lazy view.
+
+"""
+import argparse
+
+import bench_json
+import bench_validation
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f'sections: {args.sections}, keys: {args.keys}, '
+        f'repeat: {args.repeat}'
+    )
+    strategy = bench_validation.make_strategy(
+        args.sections, args.keys, incremental=False
+    )
+    for label, func in (
+        ('resolve()', lambda: strategy.resolve()['section0']['key0']),
+        ('lazy().section0.key0', lambda: strategy.lazy().section0.key0),
+        (
+            'lazy().section0.to_dict()',
+            lambda: strategy.lazy().section0.to_dict(),
+        ),
+    ):
+        func()
+        elapsed = bench_json.best_of(args.repeat, func)
+        print(f'{label:<28} {elapsed:>9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark logging overhead on hot get paths.
+
+Usage::
+
+    $ python benchmarks/bench_logging.py [--keys N] [--repeat N]
+
+Logging is configured as by the ``pitstop`` CLI at its default ``WARN``
+level. Compares looking up every key of a decoded file without logging,
+with ``backend.get.succeeded`` events guarded by a
+:class:`~pitstop.log.HotLogger` as on the backends' get paths, and with
+the previous pattern of binding a logger and emitting events
+unconditionally. :meth:`get` of the filesystem and environment backends
+is timed for reference.
+
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import typing
+
+import bench_json
+import structlog
+
+import pitstop.backends.env
+import pitstop.backends.fs
+import pitstop.cli
+import pitstop.encodings.json
+import pitstop.log
+
+T_Lookup = typing.Callable[[str], typing.Any]
+
+logger = structlog.get_logger('pitstop.backends.fs')
+hot_logger = pitstop.log.HotLogger('pitstop.backends.fs')
+
+
+def plain(lookup: T_Lookup, key: str) -> typing.Any:
+    """Look up a key without logging."""
+    return lookup(key)
+
+
+def guarded(lookup: T_Lookup, key: str) -> typing.Any:
+    """Look up a key, emitting a guarded per-key event."""
+    value = lookup(key)
+    if hot_logger.sampled(logging.INFO):
+        logger.info('backend.get.succeeded', path=key)
+    return value
+
+
+def unguarded(lookup: T_Lookup, key: str) -> typing.Any:
+    """Look up a key, binding a logger and emitting an event regardless."""
+    log = logger.bind(path=key)
+    value = lookup(key)
+    log.info('backend.get.succeeded')
+    return value
+
+
+def report(label: str, elapsed: float, baseline: float, keys: int) -> None:
+    """Print the time per key, and its overhead over **baseline**."""
+    print(
+        f'{label:<24} {elapsed * 1e6 / keys:>9.0f} ns/key '
+        f'{(elapsed / baseline - 1) * 100:>+8.1f} %'
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pitstop.cli.configure_logging()
+    logging.getLogger().setLevel(logging.WARN)
+    document = {f'key{i}': i for i in range(args.keys)}
+    keys = list(document)
+    os.environ.update({f'PITSTOP_BENCH_{key}': '1' for key in keys})
+    print(f'keys: {args.keys}, repeat: {args.repeat}, level: WARN')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.json')
+        with open(path, 'w') as f:
+            json.dump(document, f)
+        fs = pitstop.backends.fs.FilesystemBackend(
+            pitstop.backends.fs.FilesystemBackendOptions(path=path),
+            priority=1,
+            name='fs',
+            encoding=pitstop.encodings.json.JSONEncoding.with_options()(),
+        )
+        fs.connect()
+        fs.decode()
+        env = pitstop.backends.env.EnvironmentBackend(
+            pitstop.backends.env.EnvironmentBackendOptions(
+                prefix='PITSTOP_BENCH_'
+            ),
+            priority=1,
+            name='env',
+        )
+        env.connect()
+        lookup = fs.index.lookup
+        baseline = 0.0
+        for label, func in (
+            ('lookup (no logging)', lambda: [plain(lookup, k) for k in keys]),
+            ('lookup (guarded)', lambda: [guarded(lookup, k) for k in keys]),
+            (
+                'lookup (unguarded)',
+                lambda: [unguarded(lookup, k) for k in keys],
+            ),
+            ('fs get', lambda: [fs.get(key) for key in keys]),
+            ('env get', lambda: [env.get(key) for key in keys]),
+        ):
+            elapsed = bench_json.best_of(args.repeat, func)
+            baseline = baseline or elapsed
+            report(label, elapsed, baseline, args.keys)
+        fs.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark partial resolution against resolving the complete schema.
+
+Usage::
+
+    $ python benchmarks/bench_partial.py [--sections N] [--keys N]
+
+Resolves a schema of **sections** top-level dictionaries of **keys**
+leaves each from a dictionary backend, and compares resolving every
+leaf against resolving a single section with ``prefix``, and a single
+leaf with ``paths``.
+
+"""
+import argparse
+
+import bench_json
+import bench_validation
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f'sections: {args.sections}, keys: {args.keys}, '
+        f'repeat: {args.repeat}'
+    )
+    strategy = bench_validation.make_strategy(
+        args.sections, args.keys, incremental=False
+    )
+    for label, kwargs in (
+        ('full', {}),
+        ('prefix=section0', {'prefix': 'section0'}),
+        ('paths=[section0.key0]', {'paths': ['section0.key0']}),
+    ):
+        strategy.resolve(**kwargs)
+        elapsed = bench_json.best_of(
+            args.repeat, lambda: strategy.resolve(**kwargs)
+        )
+        print(f'{label:<24} {elapsed:>9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark dotted key path access against glom.
+
+Usage::
+
+    $ python benchmarks/bench_paths.py [--depth N] [--width N] [--repeat N]
+
+Builds a document **width** keys wide at every level and **depth** levels
+deep, and compares reading every leaf with :func:`glom.glom` against
+:func:`pitstop.paths.get`, and building the document from its leaves
+with the previous, glom based :func:`~pitstop.utils.unglom` against
+:func:`pitstop.paths.assign`.
+
+"""
+import argparse
+import itertools
+import typing
+
+import bench_json
+import glom
+
+import pitstop.paths
+
+
+def glom_unglom(
+    d: typing.Dict[str, typing.Any], path: str, value: typing.Any
+) -> typing.Dict[str, typing.Any]:
+    """Assign a nested value as before, with :func:`glom.assign`."""
+    try:
+        return glom.assign(d, path, value)
+    except KeyError:
+        parent, child = path.rsplit('.', 1)
+        return glom_unglom(d, parent, {child: value})
+
+
+def build(
+    assign: typing.Callable[..., typing.Any], leaves: typing.List[str]
+) -> typing.Dict[str, typing.Any]:
+    """Build a document from its **leaves** with **assign**."""
+    document: typing.Dict[str, typing.Any] = {}
+    for path in leaves:
+        assign(document, path, path)
+    return document
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--width', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    keys = [f'key{i}' for i in range(args.width)]
+    leaves = [
+        '.'.join(path)
+        for path in itertools.product(keys, repeat=args.depth)
+    ]
+    document = build(pitstop.paths.assign, leaves)
+    print(
+        f'leaves: {len(leaves)}, depth: {args.depth}, repeat: {args.repeat}'
+    )
+    for label, func in (
+        ('glom.glom', lambda: [glom.glom(document, p) for p in leaves]),
+        (
+            'pitstop.paths.get',
+            lambda: [pitstop.paths.get(document, p) for p in leaves],
+        ),
+        ('unglom (glom.assign)', lambda: build(glom_unglom, leaves)),
+        ('pitstop.paths.assign', lambda: build(pitstop.paths.assign, leaves)),
+    ):
+        elapsed = bench_json.best_of(args.repeat, func)
+        print(f'{label:<24} {elapsed * 1e6 / len(leaves):>9.0f} ns/path')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark selective JSON decoding of schema-referenced keys.
+
+Usage::
+
+    $ python benchmarks/bench_selective.py [--tenants N] [--paths N]
+
+Compares the time and peak memory of decoding a multi-tenant document
+with a filesystem backend and reading a few keys from it, when decoding
+the whole document and when decoding only the subtrees containing those
+keys.
+
+Two peaks are reported for each case. The traced peak only counts
+Python allocations, and excludes the memory mapped file. The resident
+peak is the growth in maximum resident set size of a fresh process
+running the case once, read from ``/proc`` on Linux. It includes the
+pages of the memory mapped file, which the selective scanner reads in
+full: selective decoding avoids building the decoded document, but its
+resident peak does not fall below the file size.
+
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import typing
+
+import bench_json
+
+import pitstop.backends.fs
+import pitstop.encodings.json
+
+
+def read(
+    path: str,
+    encoding: pitstop.encodings.json.JSONEncoding,
+    paths: typing.List[str],
+    selective: bool,
+) -> None:
+    """Connect, decode and read **paths** from a filesystem backend."""
+    options = pitstop.backends.fs.FilesystemBackendOptions(path=path)
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=1, name='fs', encoding=encoding
+    )
+    backend.connect()
+    backend.decode(paths if selective else None)
+    assert len(backend.get_many(paths)) == len(paths)
+    backend.cleanup()
+
+
+def resident_peak(
+    path: str, name: str, paths: typing.List[str], selective: bool
+) -> float:
+    """Get the growth in maximum resident set size of a fresh process."""
+    output = subprocess.run(
+        [sys.executable, __file__, '--measure', path, name, str(selective)]
+        + paths,
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return float(output.splitlines()[-1])
+
+
+def max_resident() -> int:
+    """Get the maximum resident set size of this process, in bytes."""
+    # ru_maxrss is inherited from the parent across fork and exec.
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError('VmHWM not found')
+
+
+def measure(path: str, name: str, selective: str, *paths: str) -> None:
+    """Print the resident peak of a single case, in bytes."""
+    encoding = getattr(pitstop.encodings.json, name).with_options()()
+    before = max_resident()
+    read(path, encoding, list(paths), selective == 'True')
+    print(max_resident() - before)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    if sys.argv[1:2] == ['--measure']:
+        measure(*sys.argv[2:])
+        return
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=20000)
+    parser.add_argument('--paths', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data = json.dumps(bench_json.make_document(args.tenants)).encode()
+    step = max(args.tenants // args.paths, 1)
+    paths = [
+        f'tenants.tenant-{i}.db.host' for i in range(0, args.tenants, step)
+    ]
+    print(
+        f'document: {len(data) / 1e6:.1f} MB, '
+        f'paths: {len(paths)}, repeat: {args.repeat}'
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'config.json')
+        with open(path, 'wb') as f:
+            f.write(data)
+        for cls in (
+            pitstop.encodings.json.JSONEncoding,
+            pitstop.encodings.json.FastJSONEncoding,
+        ):
+            encoding = cls.with_options()()
+            for selective in (False, True):
+                label = 'selective' if selective else 'full'
+                elapsed = bench_json.best_of(
+                    args.repeat,
+                    lambda: read(path, encoding, paths, selective),
+                )
+                tracemalloc.start()
+                read(path, encoding, paths, selective)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                resident = resident_peak(path, cls.__name__, paths, selective)
+                print(
+                    f'{cls.__name__ + " " + label:<30} {elapsed:>9.1f} ms '
+                    f'{peak / 1e6:>9.1f} MB traced '
+                    f'{resident / 1e6:>9.1f} MB resident'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark cold-start time of the ``pitstop`` CLI.
+
+Usage::
+
+    $ python benchmarks/bench_startup.py [--repeat N] [config]
+
+Runs ``pitstop --version`` and ``pitstop resolve --no-cache`` in fresh
+interpreters, reporting the median and fastest wall-clock times. The
+meta-configuration defaults to this repository's ``pyproject.toml``.
+
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(argv: typing.List[str], repeat: int) -> typing.List[float]:
+    """Time **repeat** runs of a command, in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            argv,
+            check=True,
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('config', nargs='?', default='pyproject.toml')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    cli = [sys.executable, '-m', 'pitstop.cli']
+    for label, argv in (
+        ('python -c pass', [sys.executable, '-c', 'pass']),
+        ('pitstop --version', cli + ['--version']),
+        ('pitstop resolve', cli + ['resolve', '--no-cache', args.config]),
+    ):
+        timings = run(argv, args.repeat)
+        print(
+            f'{label:<20} median {statistics.median(timings):>7.1f} ms  '
+            f'min {min(timings):>7.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark incremental validation of resolved configuration.
+
+Usage::
+
+    $ python benchmarks/bench_validation.py [--sections N] [--keys N]
+
+Resolves a schema of **sections** top-level dictionaries of **keys**
+leaves each from a dictionary backend, and compares full validation
+against incremental validation, both when resolving again without
+changes and when refreshing after a single key changed.
+
+"""
+import argparse
+import typing
+
+import bench_json
+
+import pitstop.backends.base
+import pitstop.strategies.v1
+
+
+def make_strategy(
+    sections: int, keys: int, incremental: bool
+) -> pitstop.strategies.v1.VersionOneStrategy:
+    """Build a strategy with a dictionary backend holding every leaf."""
+    schema = {
+        f'section{i}': {
+            'type': 'dict',
+            'schema': {
+                f'key{n}': {'type': 'integer', 'min': 0} for n in range(keys)
+            },
+        }
+        for i in range(sections)
+    }
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options(
+        incremental_validation=incremental
+    )(schema=schema)
+    strategy.backends.add(
+        pitstop.backends.base.DictBackend(
+            priority=1,
+            name='dict',
+            obj={
+                f'section{i}.key{n}': n
+                for i in range(sections)
+                for n in range(keys)
+            },
+        )
+    )
+    return strategy
+
+
+def change_one(strategy: pitstop.strategies.v1.VersionOneStrategy) -> None:
+    """Change the value of one key, and refresh the strategy."""
+    backend = typing.cast(
+        pitstop.backends.base.DictBackend, strategy.backends[0]
+    )
+    obj = dict(backend.obj)
+    obj['section0.key0'] += 1
+    backend.obj = obj
+    strategy.refresh([backend])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f'sections: {args.sections}, keys: {args.keys}, '
+        f'repeat: {args.repeat}'
+    )
+    for incremental in (False, True):
+        label = 'incremental' if incremental else 'full'
+        strategy = make_strategy(args.sections, args.keys, incremental)
+        strategy.resolve()
+        resolve = bench_json.best_of(args.repeat, strategy.resolve)
+        refresh = bench_json.best_of(args.repeat, lambda: change_one(strategy))
+        print(
+            f'{label:<12} resolve {resolve:>9.1f} ms   '
+            f'refresh one key {refresh:>9.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark strategy construction with the compiled validator cache.
+
+Usage::
+
+    $ python benchmarks/bench_validators.py [--sections N] [--tenants N]
+
+Compares constructing a strategy per tenant, all with identical schemas,
+when building every validator from the schema against building them
+with :class:`~pitstop.validation.ValidatorCache`. Also compares
+constructing the first strategy in a new process, with and without
+compiled schemas persisted to disk.
+
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+import pitstop.strategies.v1
+import pitstop.validation
+
+
+def make_schema(sections: int) -> typing.Dict[str, typing.Any]:
+    """Generate a schema of **sections** dictionaries of ten leaves."""
+    return {
+        f'section{i}': {
+            'type': 'dict',
+            'schema': {
+                f'key{n}': {'type': 'integer', 'min': 0, 'default': n}
+                for n in range(10)
+            },
+        }
+        for i in range(sections)
+    }
+
+
+COLD_START = '''
+import json, sys, time
+import pitstop.strategies.v1, pitstop.validation
+schema = json.loads(sys.argv[1])
+pitstop.validation.validator_cache.directory = sys.argv[2] or None
+start = time.perf_counter()
+pitstop.strategies.v1.VersionOneStrategy.with_options()(schema=schema)
+print(time.perf_counter() - start)
+'''
+
+
+def cold_start(schema: typing.Dict[str, typing.Any], directory: str) -> float:
+    """Time constructing a strategy in a new process, in milliseconds."""
+    output = subprocess.check_output(
+        [sys.executable, '-c', COLD_START, json.dumps(schema), directory]
+    )
+    return float(output.splitlines()[-1]) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', type=int, default=50)
+    parser.add_argument('--tenants', type=int, default=100)
+    args = parser.parse_args()
+
+    schema = make_schema(args.sections)
+    print(f'sections: {args.sections}, tenants: {args.tenants}')
+    validator_class = pitstop.strategies.v1.Validator
+    for label, build in (
+        ('uncached', lambda s: validator_class(s)),
+        (
+            'cached',
+            lambda s: pitstop.validation.validator_cache.validator(
+                validator_class, s
+            ),
+        ),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.tenants):
+            build(json.loads(json.dumps(schema)))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'{label:<24} {elapsed / args.tenants:>9.2f} ms/strategy')
+    with tempfile.TemporaryDirectory() as directory:
+        cold_start(schema, directory)
+        for label, cache_dir in (
+            ('new process', ''),
+            ('new process (on disk)', directory),
+        ):
+            elapsed = min(cold_start(schema, cache_dir) for _ in range(3))
+            print(f'{label:<24} {elapsed:>9.2f} ms/strategy')
+
+
+if __name__ == '__main__':
+    main()
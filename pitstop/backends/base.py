@@ -1,6 +1,10 @@
 """Abstract bases for configuration backends."""
 import abc
+import asyncio
+import concurrent.futures
+import contextlib
 import dataclasses
+import functools
 import typing
 
 import structlog
@@ -12,8 +16,10 @@ import pitstop.types
 
 
 __all__ = (
+    'AsyncBaseObjectBackend',
     'BaseObjectBackend',
     'EncodingBackendMixin',
+    'ExecutorBackend',
     'requires_decoded',
     'T_BackendOptions',
 )
@@ -30,6 +36,11 @@ def requires_decoded(wrapped, instance, args, kwargs):
     return wrapped(*args, **kwargs)
 
 
+def _not_decoded(*args: typing.Any, **kwargs: typing.Any) -> typing.NoReturn:
+    """Stand in for the methods of an undecoded backend."""
+    raise pitstop.errors.NotDecodedError('Configuration not decoded')
+
+
 # NOTE(darvid): python/mypy#5374
 @dataclasses.dataclass  # type: ignore
 class BaseObjectBackend(abc.ABC):
@@ -58,6 +69,42 @@ class BaseObjectBackend(abc.ABC):
 
         """
 
+    def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Get multiple configuration keys.
+
+        Backends should override this method if they're able to read
+        several keys more efficiently than one :meth:`get` call at a
+        time.
+
+        Args:
+            paths: The paths or names of configuration keys.
+
+        Returns:
+            dict: A mapping of each key present in the backend to its
+                configuration value. Missing keys are omitted.
+
+        """
+        values = {}
+        for path in paths:
+            try:
+                values[path] = self.get(path)
+            except KeyError:
+                continue
+        return values
+
+    @contextlib.contextmanager
+    def resolving(self) -> typing.Iterator[None]:
+        """Provide a context for a single resolution pass.
+
+        Strategies enter this context for every backend while resolving
+        configuration, allowing backends to memoize reads for the
+        duration of a single pass. Noop by default.
+
+        """
+        yield
+
     def __del__(self):
         """Clean up backend connections or descriptors."""
         self.cleanup()
@@ -72,29 +119,146 @@ class ReloadableObjectBackend(abc.ABC):
     def reload(self):
         """Reload the backend."""
 
+    def sources(self) -> typing.Iterable[str]:
+        """Get the paths of files read by the backend.
+
+        Used to detect changes to the backend without reloading it.
+        Backends with no file sources are reloaded to detect changes.
+
+        """
+        return ()
+
+
+# NOTE(darvid): python/mypy#5374
+@dataclasses.dataclass  # type: ignore
+class AsyncBaseObjectBackend(abc.ABC):
+    """Abstract base class for an :mod:`asyncio` configuration backend."""
+
+    priority: int
+    name: str
+
+    async def cleanup(self) -> None:
+        """Clean up backend connections or descriptors."""
+
+    @abc.abstractmethod
+    async def connect(self) -> None:
+        """Connect to a backend."""
+
+    @abc.abstractmethod
+    async def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Get a configuration key.
+
+        Args:
+            key: The path or name of a configuration key.
+            default (:obj:`typing.Any`, optional): A default value.
+
+        Returns:
+            The configuration value.
+
+        """
+
+    async def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Get multiple configuration keys concurrently.
+
+        Args:
+            paths: The paths or names of configuration keys.
+
+        Returns:
+            dict: A mapping of each key present in the backend to its
+                configuration value. Missing keys are omitted.
+
+        """
+        paths = list(paths)
+        results = await asyncio.gather(
+            *(self.get(path) for path in paths), return_exceptions=True
+        )
+        values = {}
+        for path, result in zip(paths, results):
+            if isinstance(result, KeyError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            values[path] = result
+        return values
+
+    @contextlib.contextmanager
+    def resolving(self) -> typing.Iterator[None]:
+        """Provide a context for a single resolution pass.
+
+        See :meth:`BaseObjectBackend.resolving`.
+
+        """
+        yield
+
 
 @dataclasses.dataclass
 class EncodingBackendMixin:
-    """Mixin for backends that require deserialization in-memory."""
+    """Mixin for backends that require deserialization in-memory.
+
+    Until :attr:`obj` is decoded, :meth:`get` and :meth:`get_many` raise
+    :class:`~.errors.NotDecodedError`. The guard is an instance attribute
+    shadowing both methods, installed on creation and whenever
+    :attr:`obj` is reset, and removed whenever :attr:`obj` is assigned a
+    decoded document, so that reads of a decoded backend call its
+    methods directly.
+
+    """
+
+    _GUARDED: typing.ClassVar[typing.Tuple[str, ...]] = ('get', 'get_many')
 
     encoding: pitstop.encodings.base.BaseEncoding
-    s: str = ''
+    s: pitstop.types.T_Source = ''
     obj: typing.Optional[pitstop.types.T_StrAnyMapping] = dataclasses.field(
         init=False, default=None
     )
+    include: typing.Optional[typing.FrozenSet[str]] = dataclasses.field(
+        init=False, default=None
+    )
+
+    def decode(
+        self, include: typing.Optional[typing.Iterable[str]] = None
+    ) -> None:
+        """Decode configuration data to backend state.
+
+        Args:
+            include (:obj:`typing.Iterable`, optional): Key paths to
+                decode. If given, encodings supporting selective decoding
+                only decode the subtrees containing these paths, and
+                subsequent decodes (e.g. on reload) keep doing so.
 
-    def decode(self) -> None:
-        """Decode configuration data to backend state."""
+        """
+        if include is not None:
+            self.include = frozenset(include)
         logger.info(
-            'backend.decoding', encoding=self.encoding.__class__.__name__
+            'backend.decoding',
+            encoding=self.encoding.__class__.__name__,
+            selective=self.include is not None,
         )
-        self.obj = self.encoding.decode(self.s)
-
-    def __getattribute__(self, name):  # noqa: D105
-        attr = super().__getattribute__(name)
-        if name in ('get',):
-            return requires_decoded(attr)
-        return attr
+        if self.include is None:
+            self.obj = self.encoding.decode(self.s)
+        else:
+            self.obj = self.encoding.decode_selected(self.s, self.include)
+
+    def __new__(  # noqa: D102
+        cls, *args: typing.Any, **kwargs: typing.Any
+    ) -> 'EncodingBackendMixin':
+        self = super().__new__(cls)
+        for method in cls._GUARDED:
+            self.__dict__[method] = _not_decoded
+        return self
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:  # noqa: D105
+        super().__setattr__(name, value)
+        if name == 'obj':
+            state = self.__dict__
+            if value is None:
+                for method in self._GUARDED:
+                    state[method] = _not_decoded
+            else:
+                for method in self._GUARDED:
+                    state.pop(method, None)
 
 
 @dataclasses.dataclass
@@ -124,6 +288,104 @@ class DictBackend(BaseObjectBackend):
                 not provided.
 
         """
-        if default is not None:
-            return self.obj.get(key, default)
-        raise KeyError(key)
+        try:
+            return self.obj[key]
+        except KeyError:
+            if default is not None:
+                return default
+            raise
+
+    def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Get multiple configuration keys.
+
+        Args:
+            paths: The paths or names of configuration keys.
+
+        Returns:
+            dict: A mapping of each key present in :attr:`obj` to its
+                configuration value. Missing keys are omitted.
+
+        """
+        obj = self.obj
+        return {path: obj[path] for path in paths if path in obj}
+
+
+@dataclasses.dataclass
+class ExecutorBackend(AsyncBaseObjectBackend):
+    """Adapt a synchronous backend to :class:`AsyncBaseObjectBackend`.
+
+    Blocking calls to the wrapped **backend** are run in an executor, so
+    that they don't block the event loop.
+
+    Args:
+        backend (:class:`BaseObjectBackend`): The synchronous backend.
+        executor (:class:`concurrent.futures.Executor`, optional): The
+            executor to run calls in. Defaults to the event loop's
+            default executor.
+
+    """
+
+    backend: BaseObjectBackend
+    executor: typing.Optional[concurrent.futures.Executor] = None
+
+    @classmethod
+    def adapt(
+        cls,
+        backend: typing.Union[BaseObjectBackend, AsyncBaseObjectBackend],
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> AsyncBaseObjectBackend:
+        """Adapt **backend**, unless it's already asynchronous."""
+        if isinstance(backend, AsyncBaseObjectBackend):
+            return backend
+        return cls(
+            priority=backend.priority,
+            name=backend.name,
+            backend=backend,
+            executor=executor,
+        )
+
+    async def _run(self, fn: typing.Callable, *args) -> typing.Any:
+        """Run **fn** with **args** in :attr:`executor`."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(fn, *args)
+        )
+
+    async def cleanup(self) -> None:
+        """Clean up the wrapped backend."""
+        await self._run(self.backend.cleanup)
+
+    async def connect(
+        self,
+        decode: bool = True,
+        include: typing.Optional[typing.Iterable[str]] = None,
+    ) -> None:
+        """Connect the wrapped backend, decoding it if necessary.
+
+        Args:
+            decode (:obj:`bool`, optional): If ``True``, decodes the
+                configuration payload of backends that require decoding.
+                Defaults to ``True``.
+            include (:obj:`typing.Iterable`, optional): Key paths to
+                decode selectively (see :meth:`EncodingBackendMixin.decode`).
+
+        """
+        await self._run(self.backend.connect)
+        if decode and isinstance(self.backend, EncodingBackendMixin):
+            await self._run(self.backend.decode, include)
+
+    async def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Get a configuration key from the wrapped backend."""
+        return await self._run(self.backend.get, key, default)
+
+    async def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Get multiple configuration keys from the wrapped backend."""
+        return await self._run(self.backend.get_many, list(paths))
+
+    def resolving(self) -> typing.ContextManager[None]:
+        """Enter a resolution pass of the wrapped backend."""
+        return self.backend.resolving()
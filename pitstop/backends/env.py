@@ -1,43 +1,124 @@
 """Provides a process environment backend."""
 import dataclasses
+import logging
 import os
 import typing
 
 import structlog
 
 import pitstop.backends.base
+import pitstop.log
+import pitstop.types
 import pitstop.utils
 
 
 __all__ = ('EnvironmentBackend', 'EnvironmentBackendOptions')
 
 logger = structlog.get_logger()
+hot_logger = pitstop.log.HotLogger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class EnvironmentBackendOptions(pitstop.utils.OptionsBag):
     """Options for the environment backend.
 
     Args:
         prefix (str): If provided, all environment variables are
             prefixed with this value.
+        snapshot (bool): If ``True``, environment variables matching
+            **prefix** are captured on :meth:`~EnvironmentBackend.connect`
+            and :meth:`~EnvironmentBackend.reload`, and keys are read
+            from that snapshot rather than the live process environment.
+            Defaults to ``False``.
+        fold_case (bool): In snapshot mode, if no variable matches a key
+            exactly, match it case-insensitively. Defaults to ``True``.
 
     """
 
     prefix: str = dataclasses.field(default='')
+    snapshot: bool = dataclasses.field(default=False)
+    fold_case: bool = dataclasses.field(default=True)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Snapshot:
+    """Environment variables captured by :class:`EnvironmentBackend`.
+
+    Args:
+        exact (dict): Variable values by name, without prefix.
+        folded (dict): Variable values by case-folded name, without
+            prefix.
+
+    """
+
+    exact: typing.Dict[str, str]
+    folded: typing.Dict[str, str]
+
+    @classmethod
+    def capture(cls, prefix: str) -> '_Snapshot':
+        """Capture environment variables starting with **prefix**."""
+        exact = {}
+        folded = {}
+        n = len(prefix)
+        folded_prefix = prefix.casefold()
+        for name, value in os.environ.items():
+            if name.startswith(prefix):
+                exact[name[n:]] = value
+            if name.casefold().startswith(folded_prefix):
+                folded.setdefault(name[n:].casefold(), value)
+        return cls(exact=exact, folded=folded)
 
 
 @dataclasses.dataclass
 class EnvironmentBackend(
+    pitstop.backends.base.ReloadableObjectBackend,
     pitstop.backends.base.BaseObjectBackend,
     pitstop.utils.OptionsBagMixin[EnvironmentBackendOptions],
 ):
     """Access configuration from environment variables."""
 
+    _snapshot: typing.Optional[_Snapshot] = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+    _names: typing.Dict[str, str] = dataclasses.field(
+        init=False, default_factory=dict, repr=False
+    )
+
     def connect(self) -> None:
-        """Noop."""
+        """Capture a snapshot of the environment, if enabled."""
+        if self.options.snapshot:
+            self._snapshot = _Snapshot.capture(self.options.prefix)
         logger.info('backend.connected', pid=os.getpid())
 
+    def reload(self) -> bool:
+        """Capture a new snapshot of the environment, if enabled.
+
+        Returns:
+            bool: ``True`` if matching environment variables changed
+                since the last snapshot, otherwise ``False``.
+
+        """
+        if not self.options.snapshot:
+            return False
+        snapshot = _Snapshot.capture(self.options.prefix)
+        changed = self._snapshot is None or snapshot != self._snapshot
+        self._snapshot = snapshot
+        logger.info('reloaded', changed=changed)
+        return changed
+
+    def _lookup(self, key: str) -> typing.Optional[str]:
+        """Look up a key in the snapshot, or the process environment."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return os.getenv(self.options.prefix + key.replace('.', '_'))
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = key.replace('.', '_')
+        value = snapshot.exact.get(name)
+        if value is None and self.options.fold_case:
+            value = snapshot.folded.get(name.casefold())
+        return value
+
     def get(self, key: str, default: typing.Any = None) -> typing.Any:
         """Read a configuration key from the process environment.
 
@@ -59,12 +140,40 @@ class EnvironmentBackend(
                 and a default value is not provided.
 
         """
-        log = logger.bind(path=key)
-        value = os.getenv(self.options.prefix + key.replace('.', '_'))
+        value = self._lookup(key)
         if value is None:
             if default is not None:
                 return default
-            log.warn('backend.get.failed')
+            if hot_logger.sampled(logging.WARN):
+                logger.warn('backend.get.failed', path=key)
             raise KeyError(key)
-        log.info('backend.get.succeeded')
+        if hot_logger.sampled(logging.INFO):
+            logger.info('backend.get.succeeded', path=key)
         return value
+
+    def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read multiple configuration keys from the process environment.
+
+        In snapshot mode, all keys, e.g. every leaf of a schema subtree,
+        are answered from the snapshot without touching the process
+        environment.
+
+        Args:
+            paths: The key names.
+
+        Returns:
+            dict: A mapping of each key present in the environment to its
+                value. Missing keys are omitted.
+
+        """
+        lookup = self._lookup
+        values = {}
+        for path in paths:
+            value = lookup(path)
+            if value is not None:
+                values[path] = value
+        if hot_logger.enabled(logging.INFO):
+            logger.info('backend.get_many', found=len(values))
+        return values
@@ -1,17 +1,30 @@
 """Provides a local filesystem backend."""
+import codecs
+import collections.abc
 import dataclasses
+import hashlib
+import logging
+import mmap
+import os
 import typing
 
-import glom
 import structlog
 
 import pitstop.backends.base
+import pitstop.cache
+import pitstop.encodings.base
+import pitstop.log
+import pitstop.paths
+import pitstop.types
 import pitstop.utils
 
 
 __all__ = ('FilesystemBackend', 'FilesystemBackendOptions')
 
 logger = structlog.get_logger()
+hot_logger = pitstop.log.HotLogger(__name__)
+_MISSING = object()
+_CHUNK_SIZE = 64 * 1024
 
 
 @dataclasses.dataclass(frozen=True)  # type: ignore
@@ -22,17 +35,90 @@ class FilesystemBackendOptions(pitstop.utils.OptionsBag):
         path (str): The path to a configuration file.
         file_encoding (str, optional): The file encoding. Defaults to
             ``utf-8``.
-        enable_checksums (bool, optional): If ``True``, the checksum of
-            the file will be recorded on read, and compared against the
-            previous checksum on reloading, returning a :obj:`bool`
-            indicating whether or not the file was modified since last
-            read.
+        enable_checksums (bool, optional): If ``True``, the metadata
+            and SHA-256 digest of the file will be recorded on read. On
+            reloading, the file is only read again if its modification
+            time, size or inode changed, and only decoded again if its
+            digest changed, returning a :obj:`bool` indicating whether
+            or not the file was modified since last read.
+        mmap_threshold (int, optional): Files of at least this many
+            bytes are memory-mapped instead of read into memory. ``None``
+            disables memory mapping. Defaults to 1 MiB.
+        retain_source (bool, optional): If ``False``, the raw file
+            contents are released after decoding, keeping only the
+            decoded configuration in memory. Defaults to ``True``.
+        decode_cache (bool, optional): If ``True``, decoded documents
+            are cached on disk, keyed by the file's digest, and shared
+            with other processes decoding identical files. Requires
+            checksums. Defaults to ``False``.
+        decode_cache_dir (str, optional): The cache directory. Defaults
+            to :func:`~.cache.default_cache_dir`.
+        decode_cache_max_size (int, optional): The maximum size of the
+            decode cache in bytes. Defaults to 64 MiB.
+
+    UTF-8 encoded files are passed to the encoding as a buffer. Only the
+    ``json-fast`` encoding with ``orjson`` parses buffers without
+    building an intermediate :obj:`str` of the whole file; other
+    encodings decode buffers to text themselves. Files in other
+    encodings are decoded to text by the backend.
 
     """
 
     path: str
     file_encoding: str = dataclasses.field(default='utf-8')
     enable_checksums: bool = dataclasses.field(default=True)
+    mmap_threshold: typing.Optional[int] = dataclasses.field(
+        default=1024 * 1024
+    )
+    retain_source: bool = dataclasses.field(default=True)
+    decode_cache: bool = dataclasses.field(default=False)
+    decode_cache_dir: typing.Optional[str] = dataclasses.field(default=None)
+    decode_cache_max_size: int = dataclasses.field(default=64 * 1024 * 1024)
+
+
+@dataclasses.dataclass(frozen=True)
+class _KeyIndex:
+    """A flat index of dotted key paths of a decoded document.
+
+    Every mapping in the document, and every value within a mapping, is
+    indexed by its dotted path. Values are shared with the document, so
+    the index costs one dictionary entry per node. Sequences are not
+    indexed element-wise; paths into sequences fall back to
+    :func:`pitstop.paths.get`.
+
+    """
+
+    obj: typing.Any
+    paths: pitstop.types.T_StrAnyDict
+    has_sequences: bool
+
+    @classmethod
+    def build(cls, obj: typing.Any) -> '_KeyIndex':
+        """Index the document **obj**."""
+        paths: pitstop.types.T_StrAnyDict = {}
+        has_sequences = False
+        stack: typing.List[typing.Tuple[str, typing.Any]] = []
+        if isinstance(obj, collections.abc.Mapping):
+            stack.append(('', obj))
+        while stack:
+            parent, mapping = stack.pop()
+            for key, value in mapping.items():
+                path = f'{parent}.{key}' if parent else str(key)
+                paths[path] = value
+                if isinstance(value, collections.abc.Mapping):
+                    stack.append((path, value))
+                elif isinstance(value, (list, tuple)):
+                    has_sequences = True
+        return cls(obj=obj, paths=paths, has_sequences=has_sequences)
+
+    def lookup(self, path: str) -> typing.Any:
+        """Look up a key **path**, returning a sentinel if missing."""
+        try:
+            return self.paths[path]
+        except KeyError:
+            if not self.has_sequences:
+                return _MISSING
+        return pitstop.paths.get(self.obj, path, default=_MISSING)
 
 
 # See python/mypy#5681
@@ -45,33 +131,125 @@ class FilesystemBackend(
 ):
     """Access configuration from a local file."""
 
-    fp: typing.Optional[typing.TextIO] = dataclasses.field(
+    fp: typing.Optional[typing.BinaryIO] = dataclasses.field(
+        init=False, default=None
+    )
+    checksum: str = dataclasses.field(init=False, default='')
+    signature: pitstop.utils.T_StatSignature = dataclasses.field(
         init=False, default=None
     )
-    checksum: int = dataclasses.field(init=False, default=0)
+    _index: typing.Optional[_KeyIndex] = dataclasses.field(
+        init=False, default=None, repr=False
+    )
+
+    @property
+    def index(self) -> _KeyIndex:
+        """Get a flat index of keys in the decoded configuration.
+
+        The index is built on first access after decoding, and swapped
+        for a new index in a single assignment when :attr:`obj` changes.
+
+        """
+        index = self._index
+        obj = self.obj
+        if index is None or index.obj is not obj:
+            index = self._index = _KeyIndex.build(obj)
+            logger.debug('backend.indexed', keys=len(index.paths))
+        return index
 
     def cleanup(self) -> None:
-        """Close the file descriptor."""
+        """Close the file descriptor, and unmap the file if mapped."""
         logger.debug('backend.cleanup')
+        if isinstance(self.s, mmap.mmap):
+            self.release_source()
         if self.fp is not None:
             self.fp.close()
             self.fp = None
-            self.checksum = 0
+            self.checksum = ''
+            self.signature = None
 
     def connect(self) -> None:
-        """Open a file descriptor and read into memory."""
-        self.fp = open(
-            self.options.path, mode='r', encoding=self.options.file_encoding
-        )
-        self.s = self.fp.read()
+        """Open a file descriptor and read or map into memory."""
+        fp = self.fp = open(self.options.path, mode='rb')
+        st = os.fstat(fp.fileno())
+        digest = hashlib.sha256() if self.options.enable_checksums else None
+        threshold = self.options.mmap_threshold
+        source: pitstop.types.T_Source
+        if threshold is not None and st.st_size and st.st_size >= threshold:
+            source = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            if digest is not None:
+                digest.update(source)
+        else:
+            chunks = []
+            for chunk in iter(lambda: fp.read(_CHUNK_SIZE), b''):
+                if digest is not None:
+                    digest.update(chunk)
+                chunks.append(chunk)
+            source = b''.join(chunks)
+        if codecs.lookup(self.options.file_encoding).name != 'utf-8':
+            text = pitstop.encodings.base.decode_text(
+                source, self.options.file_encoding
+            )
+            if isinstance(source, mmap.mmap):
+                source.close()
+            source = text
+        self.s = source
         log = logger.bind(
-            path=self.options.path, length=f'{len(self.s)/1000:.1f}K'
+            path=self.options.path,
+            length=f'{len(source)/1000:.1f}K',
+            mapped=isinstance(source, mmap.mmap),
         )
-        if self.options.enable_checksums:
-            self.checksum = hash(self.s)
+        if digest is not None:
+            self.checksum = digest.hexdigest()
+            self.signature = (st.st_mtime_ns, st.st_size, st.st_ino)
             log = log.bind(checksum=self.checksum)
         log.info('backend.connected')
 
+    @property
+    def decode_cache(self) -> typing.Optional[pitstop.cache.DecodeCache]:
+        """Get the decode cache, if enabled."""
+        if not (self.options.decode_cache and self.options.enable_checksums):
+            return None
+        return pitstop.cache.DecodeCache(
+            directory=self.options.decode_cache_dir
+            or pitstop.cache.default_cache_dir(),
+            max_size=self.options.decode_cache_max_size,
+        )
+
+    def decode(
+        self, include: typing.Optional[typing.Iterable[str]] = None
+    ) -> None:
+        """Decode the file, releasing its contents unless retained.
+
+        With the decode cache enabled, a document previously decoded
+        from identical file contents is loaded from the cache instead.
+
+        """
+        cache = self.decode_cache
+        if cache is None or not self.checksum:
+            super().decode(include)
+        else:
+            if include is not None:
+                self.include = frozenset(include)
+            key = cache.key(self.checksum, self.encoding, self.include)
+            obj = cache.load(key)
+            if obj is None:
+                super().decode()
+                try:
+                    cache.store(key, self.obj)
+                except OSError as e:
+                    logger.warn('backend.decode_cache.failed', error=e)
+            else:
+                self.obj = obj
+        if not self.options.retain_source:
+            self.release_source()
+
+    def release_source(self) -> None:
+        """Release the raw file contents, unmapping the file if mapped."""
+        if isinstance(self.s, mmap.mmap):
+            self.s.close()
+        self.s = b''
+
     def get(self, key: str, default: typing.Any = None) -> typing.Any:
         """Read a configuration key from the decoded configuration file.
 
@@ -83,31 +261,74 @@ class FilesystemBackend(
             The configuration value, or **default** if key not present.
 
         """
-        log = logger.bind(path=key)
-        try:
-            value = glom.glom(self.obj, key)
-            log.info('backend.get.succeeded')
-            return value
-        except glom.PathAccessError:
+        value = self.index.lookup(key)
+        if value is _MISSING:
             if default is not None:
                 return default
-            log.warn('backend.get.failed')
+            if hot_logger.sampled(logging.WARN):
+                logger.warn('backend.get.failed', path=key)
             raise KeyError(key)
+        if hot_logger.sampled(logging.INFO):
+            logger.info('backend.get.succeeded', path=key)
+        return value
+
+    def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read multiple configuration keys from the decoded file.
+
+        Args:
+            paths: The key names.
+
+        Returns:
+            dict: A mapping of each key present in the file to its value.
+                Missing keys are omitted.
+
+        """
+        lookup = self.index.lookup
+        values = {}
+        for path in paths:
+            value = lookup(path)
+            if value is not _MISSING:
+                values[path] = value
+        if hot_logger.enabled(logging.INFO):
+            logger.info('backend.get_many', found=len(values))
+        return values
+
+    def sources(self) -> typing.Iterable[str]:
+        """Get the configuration file path."""
+        return (self.options.path,)
 
     def reload(self) -> bool:
         """Reload the configuration file.
 
+        With checksums enabled, the file is only read again if its
+        modification time, size or inode changed since last read. If the
+        backend was decoded, and the file's digest changed or checksums
+        are disabled, the file is decoded again, replacing the decoded
+        configuration and key index.
+
         Returns:
             bool: ``True`` if the file was changed since last read,
                 otherwise ``False``.
 
         """
+        if (
+            self.options.enable_checksums
+            and self.signature is not None
+            and pitstop.utils.stat_signature(self.options.path)
+            == self.signature
+        ):
+            logger.debug('reloaded', path=self.options.path, changed=False)
+            return False
         checksum = self.checksum
+        decoded = self.obj is not None
         self.cleanup()
         self.connect()
-        logger.info(
-            'reloaded',
-            path=self.options.path,
-            changed=self.checksum != checksum,
-        )
-        return self.checksum != checksum
+        changed = self.checksum != checksum
+        logger.info('reloaded', path=self.options.path, changed=changed)
+        if decoded and (changed or not self.options.enable_checksums):
+            self.decode()
+        elif decoded and not self.options.retain_source:
+            self.release_source()
+        return changed
@@ -1,19 +1,42 @@
 """Provides a HashiCorp Vault secrets key-value backend."""
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import dataclasses
+import datetime
+import functools
+import logging
+import threading
+import time
 import typing
 
-import hvac
 import structlog
 import wrapt
 
 import pitstop.backends.base
 import pitstop.errors
+import pitstop.log
+import pitstop.types
 import pitstop.utils
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import hvac
 
-__all__ = ('requires_client', 'VaultBackend', 'VaultBackendOptions')
+__all__ = (
+    'AsyncVaultBackend',
+    'requires_client',
+    'SecretCache',
+    'VaultBackend',
+    'VaultBackendOptions',
+)
 
 logger = structlog.get_logger()
+hot_logger = pitstop.log.HotLogger(__name__)
+
+T_Memo = typing.Dict[
+    typing.Tuple[int, str], typing.Optional[pitstop.types.T_StrAnyMapping]
+]
 
 
 @wrapt.decorator
@@ -26,7 +49,7 @@ def requires_client(wrapped, instance, args, kwargs):
     return wrapped(*args, **kwargs)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class VaultBackendOptions(pitstop.utils.OptionsBag):
     """Options for the Vault backend.
 
@@ -38,6 +61,21 @@ class VaultBackendOptions(pitstop.utils.OptionsBag):
             to ``2``.
         mount_point (str, optional): Mount point used by all Vault KV
             reads. Defaults to ``secret/``.
+        cache_ttl (float, optional): If provided, secrets are cached
+            in-process for this many seconds. Defaults to ``None``
+            (caching disabled).
+        cache_max_size (int, optional): Maximum number of cached
+            secrets, evicting the least recently used. Defaults to
+            ``256``.
+        cache_negative_ttl (float, optional): Seconds to cache missing
+            secrets for. Defaults to **cache_ttl**.
+        cache_stale_ttl (float, optional): Seconds past expiry during
+            which a stale secret is served while it is refreshed in the
+            background. Defaults to ``0`` (disabled).
+        cache_respect_leases (bool, optional): If ``True``, secrets are
+            never cached for longer than their lease duration, or past
+            the KV v2 ``deletion_time`` of their version. Defaults to
+            ``True``.
 
     """
 
@@ -53,6 +91,215 @@ class VaultBackendOptions(pitstop.utils.OptionsBag):
     namespace: typing.Optional[str] = dataclasses.field(default=None)
     kv_version: int = dataclasses.field(default=2)
     mount_point: str = dataclasses.field(default='secret/')
+    cache_ttl: typing.Optional[float] = dataclasses.field(default=None)
+    cache_max_size: int = dataclasses.field(default=256)
+    cache_negative_ttl: typing.Optional[float] = dataclasses.field(
+        default=None
+    )
+    cache_stale_ttl: float = dataclasses.field(default=0)
+    cache_respect_leases: bool = dataclasses.field(default=True)
+
+
+@dataclasses.dataclass
+class _CacheEntry:
+    """A secret held by :class:`SecretCache`."""
+
+    secret: typing.Optional[pitstop.types.T_StrAnyMapping]
+    expires: float
+    stale_until: float
+    refreshing: bool = False
+
+
+@dataclasses.dataclass
+class SecretCache:
+    """A thread-safe LRU cache of secrets with per-entry expiry.
+
+    Args:
+        ttl (float): Seconds to cache secrets for.
+        max_size (int, optional): Maximum number of cached secrets.
+        negative_ttl (float, optional): Seconds to cache missing
+            secrets for. Defaults to **ttl**.
+        stale_ttl (float, optional): Seconds past expiry during which
+            stale secrets are served while refreshed in the background.
+
+    Attributes:
+        hits (int): Reads served from fresh entries.
+        stale_hits (int): Reads served from stale entries.
+        misses (int): Reads that had to load the secret.
+
+    """
+
+    ttl: float
+    max_size: int = 256
+    negative_ttl: typing.Optional[float] = None
+    stale_ttl: float = 0
+    hits: int = dataclasses.field(default=0, init=False)
+    stale_hits: int = dataclasses.field(default=0, init=False)
+    misses: int = dataclasses.field(default=0, init=False)
+    _entries: typing.MutableMapping[
+        typing.Hashable, _CacheEntry
+    ] = dataclasses.field(
+        default_factory=collections.OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def get(
+        self,
+        key: typing.Hashable,
+        load: typing.Callable[
+            [],
+            typing.Tuple[
+                typing.Optional[pitstop.types.T_StrAnyMapping],
+                typing.Optional[float],
+            ],
+        ],
+    ) -> typing.Optional[pitstop.types.T_StrAnyMapping]:
+        """Get a cached secret, loading it on a miss.
+
+        Args:
+            key: The cache key.
+            load: A callable returning the secret (or ``None`` if
+                missing), and an optional maximum TTL in seconds.
+
+        Returns:
+            The secret, or ``None`` if missing.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)  # type: ignore
+                if now < entry.expires:
+                    self.hits += 1
+                    return entry.secret
+                if now < entry.stale_until:
+                    self.stale_hits += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(
+                            target=self._refresh, args=(key, load), daemon=True
+                        ).start()
+                    return entry.secret
+            self.misses += 1
+        secret, max_ttl = load()
+        self.put(key, secret, max_ttl)
+        return secret
+
+    def put(
+        self,
+        key: typing.Hashable,
+        secret: typing.Optional[pitstop.types.T_StrAnyMapping],
+        max_ttl: typing.Optional[float] = None,
+    ) -> None:
+        """Cache a secret, or the absence of one if **secret** is ``None``.
+
+        Args:
+            key: The cache key.
+            secret: The secret data, or ``None``.
+            max_ttl (float, optional): Cap the entry TTL to this many
+                seconds, e.g. the lease duration of the secret. Stale
+                entries are never served past it either.
+
+        """
+        ttl = self.ttl
+        if secret is None and self.negative_ttl is not None:
+            ttl = self.negative_ttl
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        now = time.monotonic()
+        expires = now + ttl
+        stale_until = expires + self.stale_ttl
+        if max_ttl is not None:
+            stale_until = min(stale_until, now + max_ttl)
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                secret=secret, expires=expires, stale_until=stale_until
+            )
+            self._entries.move_to_end(key)  # type: ignore
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)  # type: ignore
+
+    def clear(self) -> None:
+        """Evict all cached secrets."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Get cache hit and miss counters."""
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+        }
+
+    def _refresh(self, key: typing.Hashable, load: typing.Callable) -> None:
+        """Reload a stale secret in the background."""
+        try:
+            secret, max_ttl = load()
+        except Exception:
+            logger.exception('backend.cache.refresh.failed', key=key)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+        self.put(key, secret, max_ttl)
+
+
+def _group_by_parent(
+    paths: typing.Iterable[str]
+) -> typing.Dict[str, typing.List[typing.Tuple[str, str]]]:
+    """Group key **paths** by the path of the secret holding them.
+
+    Returns:
+        dict: A mapping of secret paths to lists of ``(key, path)``
+            tuples, where ``key`` is the key within the secret.
+
+    """
+    siblings: typing.Dict[
+        str, typing.List[typing.Tuple[str, str]]
+    ] = collections.defaultdict(list)
+    for path in paths:
+        parent, sep, key = path.replace('.', '/').rpartition('/')
+        if sep:
+            siblings[parent].append((key, path))
+    return siblings
+
+
+def _pick(
+    secret: typing.Optional[pitstop.types.T_StrAnyMapping],
+    keys: typing.Iterable[typing.Tuple[str, str]],
+    values: pitstop.types.T_StrAnyDict,
+) -> None:
+    """Copy **keys** present in **secret** to **values**."""
+    if secret is None:
+        return
+    for key, path in keys:
+        if key in secret:
+            values[path] = secret[key]
+
+
+def _seconds_until(timestamp: str) -> typing.Optional[float]:
+    """Get the seconds remaining until an RFC 3339 **timestamp**."""
+    if not timestamp:
+        return None
+    # Vault timestamps have nanosecond precision, which datetime doesn't
+    # support, so truncate fractional seconds to microseconds.
+    seconds, _, fraction = timestamp.rstrip('Z').partition('.')
+    if fraction:
+        seconds = f'{seconds}.{fraction[:6]}'
+    try:
+        then = datetime.datetime.fromisoformat(seconds)
+    except ValueError:
+        return None
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((then - now).total_seconds(), 0)
 
 
 @dataclasses.dataclass
@@ -62,12 +309,20 @@ class VaultBackend(
 ):
     """Access secrets from a Vault KV store."""
 
-    client: typing.Optional[hvac.Client] = dataclasses.field(
+    client: typing.Optional['hvac.Client'] = dataclasses.field(
+        init=False, default=None
+    )
+    _local: threading.local = dataclasses.field(
+        init=False, default_factory=threading.local, repr=False, compare=False
+    )
+    cache: typing.Optional[SecretCache] = dataclasses.field(
         init=False, default=None
     )
 
     def connect(self) -> None:
         """Connect to Vault."""
+        import hvac
+
         self.client = hvac.Client(
             url=self.options.addr,
             token=self.options.token,
@@ -77,8 +332,20 @@ class VaultBackend(
             allow_redirects=self.options.allow_redirects,
             namespace=self.options.namespace,
         )
+        if self.options.cache_ttl is not None:
+            self.cache = SecretCache(
+                ttl=self.options.cache_ttl,
+                max_size=self.options.cache_max_size,
+                negative_ttl=self.options.cache_negative_ttl,
+                stale_ttl=self.options.cache_stale_ttl,
+            )
         logger.info('backend.connected')
 
+    @property
+    def cache_stats(self) -> typing.Dict[str, int]:
+        """Get secret cache hit and miss counters, if caching."""
+        return self.cache.stats() if self.cache is not None else {}
+
     def get(self, key: str, default: typing.Any = None) -> typing.Any:
         """Read a secret from Vault secrets KV store.
 
@@ -96,45 +363,290 @@ class VaultBackend(
             The secret value, or **default** if none exists.
 
         Raises:
-            KeyError: If the environment variable does not exist,
-                and a default value is not provided.
+            KeyError: If the secret does not exist, and a default value
+                is not provided.
 
         """
-        log = logger.bind(path=key)
-        key = key.replace('.', '/')
-        if self.options.kv_version == 1:
-            value = self.get_v1(key)
-        else:
-            value = self.get_v2(key)
-        if value is None:
-            return default
-        log.info('backend.get.succeeded')
+        try:
+            if self.options.kv_version == 1:
+                value = self.get_v1(key.replace('.', '/'))
+            else:
+                value = self.get_v2(key.replace('.', '/'))
+        except KeyError:
+            if default is not None:
+                return default
+            raise
+        if hot_logger.sampled(logging.INFO):
+            logger.info('backend.get.succeeded', path=key)
         return value
 
+    def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read multiple secrets from Vault secrets KV store.
+
+        Keys are grouped by their parent path, so that each secret is
+        read from Vault once, no matter how many of its keys are
+        requested.
+
+        Args:
+            paths: The key names.
+
+        Returns:
+            dict: A mapping of each key present in Vault to its secret
+                value. Missing keys are omitted.
+
+        """
+        siblings = _group_by_parent(paths)
+        values: pitstop.types.T_StrAnyDict = {}
+        for parent, keys in siblings.items():
+            _pick(self.read_secret(parent), keys, values)
+        if hot_logger.enabled(logging.INFO):
+            logger.info(
+                'backend.get_many', found=len(values), secrets=len(siblings)
+            )
+        return values
+
+    @property
+    def memo(self) -> typing.Optional[T_Memo]:
+        """Get the secrets memoized by this thread's resolution pass."""
+        return getattr(self._local, 'memo', None)
+
+    @contextlib.contextmanager
+    def resolving(self) -> typing.Iterator[T_Memo]:
+        """Memoize secrets read by this thread until the context exits.
+
+        Each thread resolves with its own memo, and nested contexts
+        share the memo of the outermost one.
+
+        Yields:
+            dict: The memo, which may be passed to :meth:`read_secret`
+                to share it with other threads.
+
+        """
+        memo = self.memo
+        if memo is not None:
+            yield memo
+            return
+        memo = self._local.memo = {}
+        try:
+            yield memo
+        finally:
+            self._local.memo = None
+
     @requires_client
+    def read_secret(
+        self,
+        path: str,
+        kv_version: typing.Optional[int] = None,
+        memo: typing.Optional[T_Memo] = None,
+    ) -> typing.Optional[pitstop.types.T_StrAnyMapping]:
+        """Read the key-value data of the secret at **path**.
+
+        While resolving, secrets are memoized, so each secret is read at
+        most once per resolution. Secrets are also served from
+        :attr:`cache`, if caching is enabled with **cache_ttl**.
+
+        Args:
+            path (str): The secret path, relative to :attr:`mount_point`.
+            kv_version (int, optional): The KV engine version. Defaults
+                to :attr:`kv_version` from backend options.
+            memo (:obj:`dict`, optional): The memo of a resolution pass
+                (see :meth:`resolving`). Defaults to the memo of this
+                thread's pass, if resolving.
+
+        Returns:
+            dict: The secret data, or ``None`` if no secret exists at
+                **path**.
+
+        """
+        if kv_version is None:
+            kv_version = self.options.kv_version
+        if memo is None:
+            memo = self.memo
+        if memo is not None and (kv_version, path) in memo:
+            return memo[kv_version, path]
+        if self.cache is not None:
+            secret = self.cache.get(
+                (kv_version, path), lambda: self._fetch(path, kv_version)
+            )
+        else:
+            secret, _ = self._fetch(path, kv_version)
+        if memo is not None:
+            memo[kv_version, path] = secret
+        return secret
+
+    def _fetch(
+        self, path: str, kv_version: int
+    ) -> typing.Tuple[
+        typing.Optional[pitstop.types.T_StrAnyMapping], typing.Optional[float]
+    ]:
+        """Read a secret from Vault.
+
+        Returns:
+            tuple: The secret data (``None`` if missing), and the
+                maximum number of seconds it may be cached for, if
+                limited by a lease or KV v2 metadata.
+
+        """
+        import hvac.exceptions
+
+        kv = self.client.secrets.kv  # type: ignore
+        max_ttl = None
+        try:
+            if kv_version == 1:
+                result = kv.v1.read_secret(
+                    path=path, mount_point=self.options.mount_point
+                )
+                secret = result['data']
+            else:
+                result = kv.v2.read_secret_version(
+                    path, mount_point=self.options.mount_point
+                )
+                secret = result['data']['data']
+                if self.options.cache_respect_leases:
+                    max_ttl = _seconds_until(
+                        (result['data'].get('metadata') or {}).get(
+                            'deletion_time', ''
+                        )
+                    )
+        except hvac.exceptions.InvalidPath:
+            logger.warn('backend.read.failed', path=path)
+            return None, None
+        lease_duration = result.get('lease_duration')
+        if self.options.cache_respect_leases and lease_duration:
+            if max_ttl is None or lease_duration < max_ttl:
+                max_ttl = lease_duration
+        return secret, max_ttl
+
     def get_v1(self, path: str) -> typing.Any:
         """Read a secret from the KV v1 engine."""
-        log = logger.bind(path=path)
-        parent, key = path.rsplit('/', 1)
-        result = self.client.secrets.kv.v1.read_secret(  # type: ignore
-            path=parent, mount_point=self.options.mount_point
-        )
-        try:
-            return result['data'][key]
-        except KeyError:
-            log.warn('backend.get.failed')
-            raise KeyError(path)
+        return self._get_secret_key(path, kv_version=1)
 
-    @requires_client
     def get_v2(self, path: str) -> typing.Any:
         """Read a secret from the KV v2 engine."""
-        log = logger.bind(path=path)
-        parent, key = path.rsplit('/', 1)
-        result = self.client.secrets.kv.v2.read_secret_version(  # type: ignore
-            parent, mount_point=self.options.mount_point
+        return self._get_secret_key(path, kv_version=2)
+
+    def _get_secret_key(self, path: str, kv_version: int) -> typing.Any:
+        """Read a single key of a secret, given a ``parent/key`` path."""
+        parent, _, key = path.rpartition('/')
+        secret = self.read_secret(parent, kv_version) if parent else None
+        try:
+            return secret[key]  # type: ignore
+        except (KeyError, TypeError):
+            if hot_logger.sampled(logging.WARN):
+                logger.warn('backend.get.failed', path=path)
+            raise KeyError(path)
+
+
+@dataclasses.dataclass
+class AsyncVaultBackend(
+    pitstop.backends.base.AsyncBaseObjectBackend,
+    pitstop.utils.OptionsBagMixin[VaultBackendOptions],
+):
+    """Access secrets from a Vault KV store with :mod:`asyncio`.
+
+    Since :mod:`hvac` is synchronous, secrets are read by a
+    :class:`VaultBackend` in an executor. Concurrent reads of the same
+    secret share a single request to Vault.
+
+    Args:
+        executor (:class:`concurrent.futures.Executor`, optional): The
+            executor to read secrets in. Defaults to the event loop's
+            default executor.
+
+    """
+
+    executor: typing.Optional[concurrent.futures.Executor] = None
+    backend: typing.Optional[VaultBackend] = dataclasses.field(
+        init=False, default=None
+    )
+    _inflight: typing.Dict[str, asyncio.Future] = dataclasses.field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    async def _run(self, fn: typing.Callable, *args) -> typing.Any:
+        """Run **fn** with **args** in :attr:`executor`."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(fn, *args)
+        )
+
+    async def connect(self) -> None:
+        """Connect to Vault."""
+        self.backend = VaultBackend(  # type: ignore
+            priority=self.priority, name=self.name, options=self.options
         )
+        await self._run(self.backend.connect)
+
+    @property
+    def cache_stats(self) -> typing.Dict[str, int]:
+        """Get secret cache hit and miss counters, if caching."""
+        return self.backend.cache_stats if self.backend is not None else {}
+
+    async def read_secret(
+        self, path: str
+    ) -> typing.Optional[pitstop.types.T_StrAnyMapping]:
+        """Read the key-value data of the secret at **path**.
+
+        See :meth:`VaultBackend.read_secret`.
+
+        """
+        if self.backend is None:
+            raise pitstop.errors.NotConnectedError(
+                'Backend not connected to Vault'
+            )
+        future = self._inflight.get(path)
+        if future is None:
+            # Executor threads share the memo of the event loop's pass.
+            future = asyncio.ensure_future(
+                self._run(
+                    self.backend.read_secret, path, None, self.backend.memo
+                )
+            )
+            self._inflight[path] = future
+            future.add_done_callback(
+                lambda _: self._inflight.pop(path, None)
+            )
+        return await asyncio.shield(future)
+
+    async def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Read a secret from Vault secrets KV store.
+
+        See :meth:`VaultBackend.get`.
+
+        """
+        values = await self.get_many([key])
         try:
-            return result['data']['data'][key]
+            return values[key]
         except KeyError:
-            log.warn('backend.get.failed')
-            raise KeyError(path)
+            if default is not None:
+                return default
+            if hot_logger.sampled(logging.WARN):
+                logger.warn('backend.get.failed', path=key)
+            raise
+
+    async def get_many(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read multiple secrets from Vault secrets KV store.
+
+        Secrets are read concurrently, once per parent path.
+
+        See :meth:`VaultBackend.get_many`.
+
+        """
+        siblings = _group_by_parent(paths)
+        secrets = await asyncio.gather(
+            *(self.read_secret(parent) for parent in siblings)
+        )
+        values: pitstop.types.T_StrAnyDict = {}
+        for secret, keys in zip(secrets, siblings.values()):
+            _pick(secret, keys, values)
+        return values
+
+    def resolving(self) -> typing.ContextManager[None]:
+        """Memoize secrets read from Vault until the context exits."""
+        if self.backend is None:
+            return contextlib.nullcontext()
+        return self.backend.resolving()
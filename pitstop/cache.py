@@ -0,0 +1,326 @@
+"""Provides on-disk caches shared between pitstop processes."""
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import typing
+
+import structlog
+
+import pitstop
+import pitstop.schema
+import pitstop.types
+import pitstop.utils
+
+
+__all__ = ('atomic_write', 'DecodeCache', 'default_cache_dir', 'SnapshotCache')
+
+logger = structlog.get_logger()
+
+
+def default_cache_dir() -> str:
+    """Get the default pitstop cache directory.
+
+    Uses ``$PITSTOP_CACHE_DIR`` if set, otherwise ``pitstop`` under
+    ``$XDG_CACHE_HOME`` or ``~/.cache``.
+
+    """
+    path = os.environ.get('PITSTOP_CACHE_DIR')
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(base, 'pitstop')
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write **data** to **path** atomically.
+
+    Data is written to a temporary file in the same directory, which
+    then replaces **path**, so that concurrent readers see either the
+    previous or the complete new file.
+
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _env_keys(
+    config: pitstop.types.T_StrAnyMapping,
+    include: typing.Optional[typing.Sequence[str]] = None,
+) -> typing.FrozenSet[str]:
+    """Get the case-folded variable names ``env`` backends may read.
+
+    Names are unprefixed. Keys are read from schema leaves and from
+    **include** paths, with periods converted to underscores.
+
+    """
+    paths = set(pitstop.schema.SchemaIndex(config.get('schema', {})))
+    paths.update(include or ())
+    return frozenset(path.replace('.', '_').casefold() for path in paths)
+
+
+@dataclasses.dataclass
+class SnapshotCache:
+    """An on-disk cache of resolved configuration documents.
+
+    Snapshots are keyed by everything a resolved document depends on:
+    the meta-configuration file (and therefore the schema), the strategy,
+    the size and modification time of files read by ``fs`` backends, and
+    environment variables that ``env`` backends map to schema keys or
+    included key paths. Snapshots depending
+    on ``vault`` backends expire after **vault_max_age** seconds.
+    Meta-configurations with any other backend drivers are never cached.
+
+    Snapshots are stored as plain JSON, including any secrets, readable
+    by their owner only.
+
+    Args:
+        directory (str): The cache directory.
+        vault_max_age (float, optional): Seconds that snapshots
+            including Vault backends may be served for. Defaults to
+            ``0`` (never cache Vault backed configuration).
+
+    """
+
+    directory: str
+    vault_max_age: float = 0
+
+    @property
+    def snapshots_dir(self) -> str:
+        """Get the directory holding snapshot files."""
+        return os.path.join(self.directory, 'snapshots')
+
+    def key(
+        self,
+        path: str,
+        config: pitstop.types.T_StrAnyMapping,
+        strategy_name: typing.Optional[str] = None,
+        include: typing.Optional[typing.Sequence[str]] = None,
+    ) -> typing.Optional[typing.Tuple[str, typing.Optional[float]]]:
+        """Compute the cache key of a meta-configuration.
+
+        Args:
+            path (str): The meta-configuration file path.
+            config (:obj:`dict`): The parsed meta-configuration.
+            strategy_name (str, optional): The strategy name.
+            include (:obj:`typing.Sequence`, optional): Key paths, if
+                resolved partially.
+
+        Returns:
+            tuple: The cache key, and the maximum age of a snapshot in
+                seconds (or ``None`` if unlimited), or ``None`` if the
+                meta-configuration can't be cached.
+
+        """
+        digest = hashlib.sha256()
+
+        def update(*parts: typing.Any) -> None:
+            digest.update(json.dumps(parts, default=str).encode())
+            digest.update(b'\0')
+
+        with open(path, 'rb') as f:
+            update(pitstop.__version__, strategy_name, os.path.abspath(path))
+            digest.update(f.read())
+        if include is not None:
+            update('include', list(include))
+        max_age: typing.Optional[float] = None
+        env_keys: typing.Optional[typing.FrozenSet[str]] = None
+        for backend in config.get('backends', []):
+            driver = backend.get('driver')
+            options = backend.get('options', {})
+            if driver == 'fs':
+                fs_path = os.path.abspath(options['path'])
+                signature = pitstop.utils.stat_signature(fs_path)
+                if signature is None:
+                    return None
+                update(driver, fs_path, *signature)
+            elif driver == 'env':
+                if env_keys is None:
+                    env_keys = _env_keys(config, include)
+                prefix = options.get('prefix', '').casefold()
+                variables = []
+                for name, value in os.environ.items():
+                    folded = name.casefold()
+                    if (
+                        folded.startswith(prefix)
+                        and folded[len(prefix):] in env_keys
+                    ):
+                        variables.append((name, value))
+                update(driver, prefix, sorted(variables))
+            elif driver == 'vault' and self.vault_max_age > 0:
+                update(driver, options)
+                max_age = self.vault_max_age
+            else:
+                logger.debug('cache.uncacheable', driver=driver)
+                return None
+        return digest.hexdigest(), max_age
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.snapshots_dir, f'{key}.json')
+
+    def load(
+        self, key: str, max_age: typing.Optional[float] = None
+    ) -> typing.Optional[pitstop.types.T_StrAnyMapping]:
+        """Load a snapshot, if cached and not older than **max_age**."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            logger.debug('cache.miss', key=key)
+            return None
+        if max_age is not None and time.time() - entry['created'] > max_age:
+            logger.debug('cache.expired', key=key)
+            return None
+        logger.debug('cache.hit', key=key)
+        return entry['document']
+
+    def store(self, key: str, document: pitstop.types.T_StrAnyMapping) -> None:
+        """Store a resolved configuration **document** under **key**."""
+        entry = {'created': time.time(), 'document': document}
+        os.makedirs(self.snapshots_dir, mode=0o700, exist_ok=True)
+        os.chmod(self.snapshots_dir, 0o700)
+        atomic_write(self._path(key), json.dumps(entry).encode())
+
+    def clear(self) -> None:
+        """Remove all cached snapshots."""
+        try:
+            names = os.listdir(self.snapshots_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            try:
+                os.unlink(os.path.join(self.snapshots_dir, name))
+            except FileNotFoundError:
+                pass
+        logger.info('cache.cleared', directory=self.snapshots_dir)
+
+
+@dataclasses.dataclass
+class DecodeCache:
+    """An on-disk, content-addressed cache of decoded documents.
+
+    Decoded documents are pickled, and keyed by the digest of the raw
+    document, the encoding and its options, and the pitstop version, so
+    that processes decoding identical files share a single entry. Files
+    are written atomically, and entries that can't be read are treated
+    as missing, so any number of processes may use the cache at once.
+    When the cache grows beyond **max_size** bytes, the least recently
+    used entries are removed.
+
+    Entries are unpickled, so the cache directory must only be writable
+    by trusted users. Directories are created with mode ``0700``.
+
+    Args:
+        directory (str): The cache directory.
+        max_size (int, optional): The maximum total size of entries in
+            bytes. Defaults to 64 MiB.
+
+    """
+
+    directory: str
+    max_size: int = 64 * 1024 * 1024
+
+    @property
+    def decoded_dir(self) -> str:
+        """Get the directory holding decoded documents."""
+        return os.path.join(self.directory, 'decoded')
+
+    def key(
+        self,
+        digest: str,
+        encoding: typing.Any,
+        include: typing.Optional[typing.Iterable[str]] = None,
+    ) -> str:
+        """Compute the cache key of a decoded document.
+
+        Args:
+            digest (str): The digest of the raw document.
+            encoding: The encoding instance.
+            include (:obj:`typing.Iterable`, optional): Key paths, if
+                decoded selectively.
+
+        """
+        cls = type(encoding)
+        parts = (
+            pitstop.__version__,
+            f'{cls.__module__}.{cls.__qualname__}',
+            repr(getattr(encoding, 'options', None)),
+            digest,
+            sorted(include) if include is not None else None,
+        )
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.decoded_dir, f'{key}.pickle')
+
+    def load(self, key: str) -> typing.Any:
+        """Load a decoded document, or ``None`` if not cached."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                obj = pickle.load(f)
+        except Exception as e:
+            # Truncated or outdated entries can fail to unpickle with
+            # almost any error, e.g. if a pickled class was moved.
+            logger.debug('cache.decoded.miss', key=key, error=e)
+            return None
+        try:
+            os.utime(path)
+        except OSError as e:
+            logger.debug('cache.decoded.touch_failed', key=key, error=e)
+        logger.debug('cache.decoded.hit', key=key)
+        return obj
+
+    def store(self, key: str, obj: typing.Any) -> None:
+        """Store a decoded document **obj** under **key**."""
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            logger.debug('cache.decoded.too_large', key=key, size=len(data))
+            return
+        atomic_write(self._path(key), data)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries beyond the maximum size."""
+        entries = []
+        try:
+            names = os.listdir(self.decoded_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not name.endswith('.pickle'):
+                continue
+            path = os.path.join(self.decoded_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.debug('cache.decoded.evicted', path=path)
+            if total <= self.max_size:
+                break
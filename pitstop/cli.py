@@ -1,39 +1,59 @@
-"""A CLI utility that aggregates configuration sources into a JSON object."""
-import json
+"""A CLI utility that aggregates configuration sources into a JSON object.
+
+Modules needed only by individual commands are imported when the command
+runs, keeping startup fast for ``--version``, ``--help`` and the like.
+
+"""
 import logging
 import os
 import typing
 
 import cleo
 import structlog
-import toml
 
 import pitstop
-import pitstop.backends.base
-import pitstop.strategies
-import pitstop.strategies.base
 import pitstop.types
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pitstop.strategies.base
+
 
-__all__ = ('app', 'main')
+__all__ = ('app', 'configure_logging', 'main')
 
 app = cleo.Application("pitstop", pitstop.__version__, complete=True)
 
 
-def load_strategy(
-    path: str, strategy_name: typing.Optional[str] = None
-) -> pitstop.strategies.base.BaseStrategy:
-    """Load a configuration strategy from a pitstop configuration file."""
+def load_config(path: str) -> pitstop.types.T_StrAnyMapping:
+    """Load a pitstop configuration file."""
+    import toml
+
     filename = os.path.basename(path)
     with open(path, 'r') as f:
         config = toml.loads(f.read())
     if filename == 'pyproject.toml':
         config = config['tool']['pitstop']
-    return pitstop.strategies.strategy_factory(config, strategy_name)
+    return config
 
 
-def main() -> None:
-    """``pitstop`` entrypoint."""
+def load_strategy(
+    path: str, strategy_name: typing.Optional[str] = None
+) -> 'pitstop.strategies.base.BaseStrategy':
+    """Load a configuration strategy from a pitstop configuration file."""
+    import pitstop.strategies
+
+    return pitstop.strategies.strategy_factory(
+        load_config(path), strategy_name
+    )
+
+
+def configure_logging() -> None:
+    """Configure :mod:`structlog` to log through the standard library.
+
+    Events are rendered to stderr, filtered by the levels of standard
+    library loggers, which also guard per-key events (see
+    :mod:`pitstop.log`).
+
+    """
     shared_processors = [
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -59,7 +79,13 @@ def main() -> None:
     handler.setFormatter(formatter)
     root_logger = logging.getLogger()
     root_logger.addHandler(handler)
+
+
+def main() -> None:
+    """``pitstop`` entrypoint."""
+    configure_logging()
     app.add(ResolveCommand())
+    app.add(ServeCommand())
     app.run()
 
 
@@ -94,20 +120,122 @@ class ResolveCommand(BaseCommand):
         {config? : pitstop configuration file}
         {--s|strategy=v1 : pitstop strategy version}
         {--c|compact : enable compact output}
+        {--p|path=* : key paths to resolve (multiple values allowed)}
+        {--prefix= : key path prefix to resolve}
+        {--cache : cache resolved configuration on disk}
+        {--invalidate-cache : clear the resolved configuration cache}
+        {--cache-dir= : resolved configuration cache directory}
+        {--cache-validators : persist compiled schemas to the cache directory}
+        {--vault-max-age=0 : seconds to cache Vault backed configuration}
 
     """
 
-    def handle(self) -> None:  # noqa: D102
+    def handle(self) -> typing.Optional[int]:  # noqa: D102
+        import pitstop.cache
+        import pitstop.strategies
+        import pitstop.validation
+
         super().handle()
-        config = self.argument('config')
-        strategy = self.option('strategy')
-        if config is None:
-            config = 'pyproject.toml'
-        strategy = load_strategy(config, strategy_name=strategy)
-        config = strategy.resolve()
+        try:
+            vault_max_age = float(self.option('vault-max-age'))
+            if not vault_max_age >= 0:
+                raise ValueError(vault_max_age)
+        except ValueError:
+            self.line_error(
+                '--vault-max-age must be a non-negative number of seconds',
+                style='error',
+            )
+            return 1
+        path = self.argument('config')
+        strategy_name = self.option('strategy')
+        if path is None:
+            path = 'pyproject.toml'
+        config = load_config(path)
+        paths = self.option('path') or None
+        prefix = self.option('prefix')
+        include = None
+        if paths is not None or prefix is not None:
+            include = list(paths or ())
+            if prefix is not None:
+                include.append(prefix)
+        cache = pitstop.cache.SnapshotCache(
+            directory=self.option('cache-dir')
+            or pitstop.cache.default_cache_dir(),
+            vault_max_age=vault_max_age,
+        )
+        if self.option('invalidate-cache'):
+            cache.clear()
+        if self.option('cache-validators'):
+            pitstop.validation.validator_cache.directory = cache.directory
+        key = None
+        if self.option('cache'):
+            key = cache.key(path, config, strategy_name, include=include)
+        if key is not None:
+            document = cache.load(*key)
+            if document is not None:
+                self.write_document(document)
+                return None
+        strategy = pitstop.strategies.strategy_factory(config, strategy_name)
+        document = strategy.resolve(paths=paths, prefix=prefix)
+        if key is not None:
+            cache.store(key[0], document)
+        self.write_document(document)
+        return None
+
+    def write_document(self, config: pitstop.types.T_StrAnyMapping) -> None:
+        """Write a resolved configuration object as JSON."""
+        import pitstop.encodings.json
+
         self.line(
-            json.dumps(config, indent=None if self.option('compact') else 4)
+            pitstop.encodings.json.dumps(
+                config, indent=None if self.option('compact') else 2
+            )
+        )
+
+
+class ServeCommand(BaseCommand):
+    """
+    Serve resolved configuration over a Unix domain socket.
+
+    serve
+        {config? : pitstop configuration file}
+        {--s|strategy=v1 : pitstop strategy version}
+        {--socket= : socket path}
+        {--reload-interval=1 : seconds between checking backends for changes}
+
+    """
+
+    def handle(self) -> typing.Optional[int]:  # noqa: D102
+        import pitstop.server
+
+        super().handle()
+        try:
+            reload_interval = float(self.option('reload-interval'))
+            if not reload_interval >= 0:
+                raise ValueError(reload_interval)
+        except ValueError:
+            self.line_error(
+                '--reload-interval must be a non-negative number of seconds',
+                style='error',
+            )
+            return 1
+        path = self.argument('config')
+        if path is None:
+            path = 'pyproject.toml'
+        strategy = load_strategy(path, strategy_name=self.option('strategy'))
+        server = pitstop.server.Server(
+            strategy,
+            socket_path=self.option('socket'),
+            reload_interval=reload_interval,
         )
+        self.line(f'Listening on {server.socket_path}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return None
 
 
 if __name__ == '__main__':
@@ -0,0 +1,111 @@
+"""A minimal client for the ``pitstop serve`` daemon.
+
+This module only depends on the standard library, so that shell
+scripts can read configuration from a running daemon without paying
+the startup cost of the ``pitstop`` CLI::
+
+    $ python -m pitstop.client get db.host
+    localhost
+
+Requests and responses are single lines of UTF-8 text. Requests are
+``RESOLVE``, ``GET <path>`` or ``PING``. Responses are ``OK <json>`` or
+``ERR <json>``, with the error message encoded as a JSON string.
+
+"""
+import json
+import os
+import socket
+import sys
+import typing
+
+
+__all__ = ('ClientError', 'default_socket_path', 'main', 'request')
+
+USAGE = 'usage: pitstop-client [-s SOCKET] resolve|ping|get PATH\n'
+
+
+class ClientError(Exception):
+    """Indicates an error response from the daemon."""
+
+
+def default_socket_path() -> str:
+    """Get the default daemon socket path.
+
+    Uses ``$PITSTOP_SOCKET`` if set, otherwise ``pitstop.sock`` under
+    ``$XDG_RUNTIME_DIR``, falling back to a per-user path in ``/tmp``.
+
+    """
+    path = os.environ.get('PITSTOP_SOCKET')
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'pitstop.sock')
+    return f'/tmp/pitstop-{os.getuid()}.sock'
+
+
+def request(
+    command: str,
+    socket_path: typing.Optional[str] = None,
+    timeout: typing.Optional[float] = 5,
+) -> typing.Any:
+    """Send a single request to the daemon.
+
+    Args:
+        command (str): The request line, e.g. ``GET db.host``.
+        socket_path (str, optional): The daemon socket path. Defaults to
+            :func:`default_socket_path`.
+        timeout (float, optional): Socket timeout in seconds.
+
+    Returns:
+        The decoded JSON response payload.
+
+    Raises:
+        ClientError: If the daemon responded with an error.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(command.encode() + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline().decode().rstrip('\n')
+    status, _, payload = line.partition(' ')
+    if status != 'OK':
+        if not payload:
+            raise ClientError('No response from daemon')
+        raise ClientError(json.loads(payload))
+    return json.loads(payload)
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """``pitstop-client`` entrypoint.
+
+    String values are written as-is, everything else as JSON.
+
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    socket_path = None
+    if len(args) >= 2 and args[0] in ('-s', '--socket'):
+        socket_path, args = args[1], args[2:]
+    if args[:1] == ['get'] and len(args) == 2:
+        command = f'GET {args[1]}'
+    elif args in (['resolve'], ['ping']):
+        command = args[0].upper()
+    else:
+        sys.stderr.write(USAGE)
+        return 2
+    try:
+        value = request(command, socket_path)
+    except (ClientError, OSError) as e:
+        sys.stderr.write(f'pitstop-client: {e}\n')
+        return 1
+    if isinstance(value, str):
+        sys.stdout.write(value + '\n')
+    else:
+        sys.stdout.write(json.dumps(value) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
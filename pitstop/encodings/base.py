@@ -1,11 +1,23 @@
 """Abstract bases for encoding providers."""
 import abc
 import dataclasses
+import typing
 
 import pitstop.types
 
 
-__all__ = ('BaseEncoding',)
+__all__ = ('BaseEncoding', 'decode_text')
+
+
+def decode_text(s: pitstop.types.T_Source, encoding: str = 'utf-8') -> str:
+    """Get the text of a string, or of a buffer **s** in **encoding**.
+
+    Buffers are copied into a new :obj:`str` of their whole contents.
+
+    """
+    if isinstance(s, str):
+        return s
+    return str(s, encoding)
 
 
 # NOTE(darvid): python/mypy#5374
@@ -14,8 +26,26 @@ class BaseEncoding(abc.ABC):
     """Abstract base class for an encoding."""
 
     @abc.abstractmethod
-    def decode(self, s: str) -> pitstop.types.T_StrAnyMapping:
-        """Decode the given string **s** to an object."""
+    def decode(
+        self, s: pitstop.types.T_Source
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode the given string or buffer **s** to an object.
+
+        Encodings must accept :obj:`str` as well as :obj:`bytes` and
+        other buffers, such as :class:`mmap.mmap` objects.
+
+        """
+
+    def decode_selected(
+        self, s: pitstop.types.T_Source, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode only the subtrees of **s** containing key **paths**.
+
+        Encodings that can skip over unneeded parts of their input
+        override this method. By default, **s** is decoded in full.
+
+        """
+        return self.decode(s)
 
     @abc.abstractmethod
     def encode(self, o: pitstop.types.T_StrAnyMapping) -> str:
@@ -1,13 +1,329 @@
 """Provides JSON encoding support."""
+import codecs
 import dataclasses
+import functools
+import importlib
 import json
+import json.decoder
+import re
+import typing
+
+import structlog
 
 import pitstop.encodings.base
+import pitstop.paths
 import pitstop.types
 import pitstop.utils
 
 
-__all__ = ('JSONEncoding', 'JSONEncodingOptions')
+__all__ = (
+    'FastJSONEncoding',
+    'FastJSONEncodingOptions',
+    'JSONEncoding',
+    'JSONEncodingOptions',
+    'JSONParser',
+    'dumps',
+    'json_parser',
+)
+
+logger = structlog.get_logger()
+
+DEFAULT_PARSERS = ('orjson', 'ujson', 'simdjson')
+
+
+@dataclasses.dataclass(frozen=True)
+class JSONParser:
+    """A JSON implementation.
+
+    Args:
+        name (str): The module name.
+        loads (callable): Decodes :obj:`str`, :obj:`bytes` or
+            :obj:`bytearray`.
+        dumps (callable): Encodes an object to :obj:`str`, taking an
+            ``indent`` keyword argument, without any whitespace unless
+            indented. Raises :exc:`ValueError` for unsupported
+            indentation, and :exc:`TypeError`, :exc:`ValueError` or
+            :exc:`OverflowError` for unsupported objects.
+        buffers (bool): Whether **loads** accepts other buffers, such as
+            :obj:`memoryview`, without copying.
+
+    """
+
+    name: str
+    loads: typing.Callable[[typing.Any], typing.Any]
+    dumps: typing.Callable[..., str]
+    buffers: bool = False
+
+
+def _stdlib_dumps(o: typing.Any, indent: typing.Optional[int] = None) -> str:
+    if indent is None:
+        return json.dumps(o, separators=(',', ':'))
+    return json.dumps(o, indent=indent)
+
+
+def _orjson(module: typing.Any) -> JSONParser:
+    def dumps(o: typing.Any, indent: typing.Optional[int] = None) -> str:
+        option = module.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= module.OPT_INDENT_2
+        elif indent is not None:
+            raise ValueError(f'Unsupported indentation {indent}')
+        return module.dumps(o, option=option).decode()
+
+    return JSONParser('orjson', module.loads, dumps, buffers=True)
+
+
+def _ujson(module: typing.Any) -> JSONParser:
+    def dumps(o: typing.Any, indent: typing.Optional[int] = None) -> str:
+        return module.dumps(
+            o, indent=indent or 0, escape_forward_slashes=False
+        )
+
+    return JSONParser('ujson', module.loads, dumps)
+
+
+def _simdjson(module: typing.Any) -> JSONParser:
+    return JSONParser('simdjson', module.loads, _stdlib_dumps)
+
+
+_PARSER_FACTORIES = {
+    'orjson': _orjson,
+    'ujson': _ujson,
+    'simdjson': _simdjson,
+}
+STDLIB_PARSER = JSONParser('json', json.loads, _stdlib_dumps)
+
+
+@functools.lru_cache(maxsize=None)
+def json_parser(names: typing.Tuple[str, ...] = DEFAULT_PARSERS) -> JSONParser:
+    """Get the first installed JSON implementation of **names**.
+
+    Supports ``orjson``, ``ujson`` and ``simdjson`` (``pysimdjson``),
+    falling back to :mod:`json` from the standard library.
+
+    """
+    for name in names:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        logger.debug('encoding.json.parser', parser=name)
+        return _PARSER_FACTORIES[name](module)
+    return STDLIB_PARSER
+
+
+def dumps(o: typing.Any, indent: typing.Optional[int] = None) -> str:
+    """Encode **o** to JSON, using the fastest available implementation.
+
+    Output is compact, without any whitespace, unless **indent** is
+    given. Falls back to :mod:`json` from the standard library if the
+    fastest implementation does not support the requested **indent**,
+    or **o**, e.g. integers too large for 64 bits. ``orjson`` only
+    supports an **indent** of ``2``.
+
+    """
+    try:
+        return json_parser().dumps(o, indent=indent)
+    except (TypeError, ValueError, OverflowError):
+        return _stdlib_dumps(o, indent=indent)
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == 'utf-8'
+
+
+T_LoadsAt = typing.Callable[[typing.Any, int], typing.Tuple[typing.Any, int]]
+
+_ALL = object()
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_SCALAR = r'[^\s,\]}]+'
+# Everything up to the next bracket outside of a string, and the bracket.
+_BRACKET = r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])'
+_WHITESPACE = r'[ \t\n\r]*'
+_DECODER = json.JSONDecoder()
+
+
+@dataclasses.dataclass(frozen=True)
+class _Syntax:
+    """Patterns and tokens for scanning JSON text, or UTF-8 buffers."""
+
+    string: typing.Pattern
+    scalar: typing.Pattern
+    bracket: typing.Pattern
+    whitespace: typing.Pattern
+    quote: typing.Any
+    colon: typing.Any
+    comma: typing.Any
+    open_object: typing.Any
+    close_object: typing.Any
+    openers: typing.Any
+
+    @classmethod
+    def compile(cls, kind: type) -> '_Syntax':
+        """Compile the patterns and tokens for **kind**, str or bytes."""
+
+        def convert(s: str) -> typing.Any:
+            return s if kind is str else s.encode()
+
+        def pattern(s: str) -> typing.Pattern:
+            return re.compile(convert(s), re.DOTALL)
+
+        return cls(
+            pattern(_STRING),
+            pattern(_SCALAR),
+            pattern(_BRACKET),
+            pattern(_WHITESPACE),
+            *map(convert, ('"', ':', ',', '{', '}', '{[')),
+        )
+
+
+_TEXT = _Syntax.compile(str)
+_BUFFER = _Syntax.compile(bytes)
+
+
+def _syntax(s: typing.Any) -> _Syntax:
+    return _TEXT if isinstance(s, str) else _BUFFER
+
+
+def _error(msg: str, s: typing.Any, idx: int) -> json.JSONDecodeError:
+    """Get an error at **idx** of **s**, with positions counted in text."""
+    if not isinstance(s, str):
+        # Only the text before the error is decoded, to count lines.
+        s = str(s[:idx], 'utf-8', 'replace')
+        idx = len(s)
+    return json.JSONDecodeError(msg, s, idx)
+
+
+def _scan_key(s: typing.Any, idx: int) -> typing.Tuple[str, int]:
+    """Decode the object key at **idx**, returning it and its end."""
+    if isinstance(s, str):
+        return json.decoder.scanstring(s, idx + 1)
+    match = _BUFFER.string.match(s, idx)
+    if match is None:
+        raise _error('Unterminated string', s, idx)
+    key, _ = json.decoder.scanstring(str(match.group(), 'utf-8'), 1)
+    return key, match.end()
+
+
+def _loads_at(s: typing.Any, idx: int) -> typing.Tuple[typing.Any, int]:
+    """Decode the JSON value at **idx**, returning it and its end."""
+    if isinstance(s, str):
+        return _DECODER.raw_decode(s, idx)
+    end = _skip(s, idx)
+    return json.loads(bytes(s[idx:end])), end
+
+
+def _path_trie(paths: typing.Iterable[str]) -> pitstop.types.T_StrAnyDict:
+    """Build a trie of dotted key **paths**, marking leaves with ``_ALL``."""
+    trie: pitstop.types.T_StrAnyDict = {}
+    for path in paths:
+        node = trie
+        *parents, leaf = pitstop.paths.parse(path)
+        for key in parents:
+            node = node.setdefault(key, {})
+            if node is _ALL:
+                break
+        else:
+            node[leaf] = _ALL
+    return trie
+
+
+def _skip(s: typing.Any, idx: int) -> int:
+    """Find the end of the JSON value at **idx**, without decoding it.
+
+    Skipped values are only checked for balanced brackets and strings.
+
+    """
+    syntax = _syntax(s)
+    char = s[idx:idx + 1]
+    if char == syntax.quote:
+        match = syntax.string.match(s, idx)
+    elif char and char in syntax.openers:
+        depth = 1
+        pos = idx + 1
+        match_bracket = syntax.bracket.match
+        while True:
+            match = match_bracket(s, pos)
+            if match is None:
+                raise _error('Unterminated value', s, idx)
+            pos = match.end()
+            if match.group(1) in syntax.openers:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+    else:
+        match = syntax.scalar.match(s, idx)
+    if match is None:
+        raise _error('Expecting value', s, idx)
+    return match.end()
+
+
+def _select_object(
+    s: typing.Any,
+    idx: int,
+    node: pitstop.types.T_StrAnyDict,
+    loads_at: T_LoadsAt,
+) -> typing.Tuple[pitstop.types.T_StrAnyDict, int]:
+    """Decode the keys in **node** from the JSON object at **idx**."""
+    syntax = _syntax(s)
+    whitespace = syntax.whitespace.match
+    result = {}
+    idx = whitespace(s, idx + 1).end()
+    if s[idx:idx + 1] == syntax.close_object:
+        return result, idx + 1
+    while True:
+        if s[idx:idx + 1] != syntax.quote:
+            raise _error(
+                'Expecting property name enclosed in double quotes', s, idx
+            )
+        key, idx = _scan_key(s, idx)
+        idx = whitespace(s, idx).end()
+        if s[idx:idx + 1] != syntax.colon:
+            raise _error("Expecting ':' delimiter", s, idx)
+        idx = whitespace(s, idx + 1).end()
+        child = node.get(key)
+        if child is None:
+            idx = _skip(s, idx)
+        elif child is not _ALL and s[idx:idx + 1] == syntax.open_object:
+            result[key], idx = _select_object(s, idx, child, loads_at)
+        else:
+            result[key], idx = loads_at(s, idx)
+        idx = whitespace(s, idx).end()
+        char = s[idx:idx + 1]
+        if char == syntax.close_object:
+            return result, idx + 1
+        if char != syntax.comma:
+            raise _error("Expecting ',' delimiter", s, idx)
+        idx = whitespace(s, idx + 1).end()
+
+
+def _select(
+    s: typing.Any,
+    paths: typing.Iterable[str],
+    loads_at: T_LoadsAt = _loads_at,
+) -> typing.Any:
+    """Decode the subtrees of the JSON document **s** containing **paths**.
+
+    **s** is either text, or a UTF-8 buffer such as a memory map, which
+    is scanned in place with :obj:`bytes` patterns. Objects along each
+    path are scanned key by key, and values not on any path are skipped
+    over without being decoded. Values at the end of a path, and arrays
+    along a path, are decoded in full by **loads_at**, which returns the
+    value at an index of **s**, and the index where it ends.
+
+    """
+    syntax = _syntax(s)
+    idx = syntax.whitespace.match(s, 0).end()
+    if s[idx:idx + 1] == syntax.open_object:
+        value, idx = _select_object(s, idx, _path_trie(paths), loads_at)
+    else:
+        value, idx = loads_at(s, idx)
+    idx = syntax.whitespace.match(s, idx).end()
+    if idx != len(s):
+        raise _error('Extra data', s, idx)
+    return value
 
 
 @dataclasses.dataclass(frozen=True)
@@ -30,10 +346,117 @@ class JSONEncoding(
 ):
     """JSON encoding utilizing :mod:`json` from the standard library."""
 
-    def decode(self, s: str) -> pitstop.types.T_StrAnyMapping:
-        """Decode the given JSON encoded string **s** to an object."""
-        return json.loads(s, encoding=self.options.encoding)
+    def decode(
+        self, s: pitstop.types.T_Source
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode the given JSON encoded string or buffer **s**.
+
+        :func:`json.loads` only parses text, and decodes :obj:`bytes`
+        to a :obj:`str` internally, so buffers are decoded to text in
+        full before parsing.
+
+        """
+        if isinstance(s, (bytes, bytearray)) and _is_utf8(
+            self.options.encoding
+        ):
+            return json.loads(s)
+        return json.loads(
+            pitstop.encodings.base.decode_text(s, self.options.encoding)
+        )
+
+    def decode_selected(
+        self, s: pitstop.types.T_Source, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode only the subtrees of **s** containing key **paths**.
+
+        The document is scanned incrementally, and objects and values
+        not on any of the key paths are skipped without being decoded.
+        UTF-8 buffers are scanned in place, without decoding them to
+        text; buffers in other encodings are decoded to text first.
+
+        """
+        if not _is_utf8(self.options.encoding):
+            s = pitstop.encodings.base.decode_text(s, self.options.encoding)
+        return _select(s, paths)
 
     def encode(self, o: pitstop.types.T_StrAnyMapping) -> str:
         """Encode the given object **o** to a JSON encoded string."""
         return json.dumps(o)
+
+
+@dataclasses.dataclass(frozen=True)
+class FastJSONEncodingOptions(JSONEncodingOptions):
+    """Fast JSON encoding options.
+
+    Args:
+        parsers (tuple, optional): JSON implementations to use, in order
+            of preference, if installed. Defaults to ``orjson``,
+            ``ujson`` and ``simdjson``.
+
+    """
+
+    parsers: typing.Tuple[str, ...] = DEFAULT_PARSERS
+
+
+@dataclasses.dataclass
+class FastJSONEncoding(
+    pitstop.encodings.base.BaseEncoding,
+    pitstop.utils.OptionsBagMixin[FastJSONEncodingOptions],
+):
+    """JSON encoding utilizing an accelerated parser, if installed.
+
+    UTF-8 buffers, including memory maps, are parsed directly by
+    ``orjson``, without decoding them to text first. Other parsers are
+    given :obj:`bytes`, copying other buffers. Falls back to :mod:`json`
+    from the standard library if none of the preferred parsers are
+    installed.
+
+    """
+
+    @property
+    def parser(self) -> JSONParser:
+        """Get the JSON implementation in use."""
+        return json_parser(tuple(self.options.parsers))
+
+    def decode(
+        self, s: pitstop.types.T_Source
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode the given JSON encoded string or buffer **s**."""
+        parser = self.parser
+        if isinstance(s, str):
+            return parser.loads(s)
+        if not _is_utf8(self.options.encoding):
+            return parser.loads(
+                pitstop.encodings.base.decode_text(s, self.options.encoding)
+            )
+        if isinstance(s, (bytes, bytearray)):
+            return parser.loads(s)
+        if parser.buffers:
+            with memoryview(s) as view:  # type: ignore
+                return parser.loads(view)
+        return parser.loads(bytes(s))
+
+    def decode_selected(
+        self, s: pitstop.types.T_Source, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode only the subtrees of **s** containing key **paths**.
+
+        Subtrees are located with the same scanner as
+        :meth:`JSONEncoding.decode_selected`, and decoded with the
+        accelerated parser.
+
+        """
+        loads = self.parser.loads
+
+        def loads_at(s: typing.Any, idx: int) -> typing.Tuple[typing.Any, int]:
+            end = _skip(s, idx)
+            value = s[idx:end]
+            return loads(value if isinstance(s, str) else bytes(value)), end
+
+        if not _is_utf8(self.options.encoding):
+            s = pitstop.encodings.base.decode_text(s, self.options.encoding)
+        return _select(s, paths, loads_at)
+
+    def encode(self, o: pitstop.types.T_StrAnyMapping) -> str:
+        """Encode the given object **o** to a JSON encoded string."""
+        return self.parser.dumps(o)
@@ -23,9 +23,16 @@ class TOMLEncoding(
 ):
     """TOML encoding."""
 
-    def decode(self, s: str) -> pitstop.types.T_StrAnyMapping:
-        """Decode the given TOML encoded string **s** to an object."""
-        return toml.loads(s)
+    def decode(
+        self, s: pitstop.types.T_Source
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Decode the given TOML encoded string or UTF-8 buffer **s**.
+
+        :mod:`toml` only parses text, so buffers are decoded to a
+        :obj:`str` in full first.
+
+        """
+        return toml.loads(pitstop.encodings.base.decode_text(s))
 
     def encode(self, o: pitstop.types.T_StrAnyMapping) -> str:
         """Encode the given object **o** to a TOML encoded string."""
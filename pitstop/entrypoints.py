@@ -0,0 +1,69 @@
+"""Provides a memoized registry of installed plugins.
+
+Backends, encodings and strategies are discovered through entry points
+in the ``pitstop.backends``, ``pitstop.encodings`` and
+``pitstop.strategies`` groups. Installed distributions are only scanned
+once per process, and loaded plugins are cached, so that looking up the
+driver of every backend in a meta-configuration, or validating
+``isentrypoint`` rules, doesn't scan them again.
+
+"""
+import functools
+import typing
+
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:  # pragma: no cover
+    import importlib_metadata  # type: ignore
+
+import pitstop.errors
+
+
+__all__ = ('clear', 'load', 'names')
+
+
+@functools.lru_cache(maxsize=None)
+def _entrypoints() -> typing.Any:
+    return importlib_metadata.entry_points()
+
+
+@functools.lru_cache(maxsize=None)
+def _group(group: str) -> typing.Dict[str, typing.Any]:
+    entrypoints = _entrypoints()
+    if hasattr(entrypoints, 'select'):
+        selected = entrypoints.select(group=group)
+    else:
+        selected = entrypoints.get(group, ())
+    registry: typing.Dict[str, typing.Any] = {}
+    for entrypoint in selected:
+        registry.setdefault(entrypoint.name, entrypoint)
+    return registry
+
+
+def names(group: str) -> typing.FrozenSet[str]:
+    """Get the names of all entry points in a **group**."""
+    return frozenset(_group(group))
+
+
+@functools.lru_cache(maxsize=None)
+def load(group: str, name: str) -> typing.Any:
+    """Load the entry point **name** in a **group**.
+
+    Raises:
+        EntrypointError: If no such entry point is installed.
+
+    """
+    try:
+        entrypoint = _group(group)[name]
+    except KeyError:
+        raise pitstop.errors.EntrypointError(
+            f'No entry point named {name!r} in {group}'
+        ) from None
+    return entrypoint.load()
+
+
+def clear() -> None:
+    """Forget discovered entry points, e.g. after installing plugins."""
+    _entrypoints.cache_clear()
+    _group.cache_clear()
+    load.cache_clear()
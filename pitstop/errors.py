@@ -5,6 +5,25 @@ class PitstopError(Exception):
     """Generic base for all API specific errors."""
 
 
+class BackendErrors(PitstopError):
+    """Aggregates errors raised by one or more backends.
+
+    Args:
+        errors (dict): A mapping of backend names to exceptions.
+
+    """
+
+    def __init__(self, errors):  # noqa: D107
+        self.errors = errors
+        super().__init__(
+            ', '.join(f'{name}: {error!r}' for name, error in errors.items())
+        )
+
+
+class EntrypointError(PitstopError):
+    """Indicates a missing plugin entry point."""
+
+
 class NotConnectedError(PitstopError):
     """Indicates a backend connection failure."""
 
@@ -0,0 +1,202 @@
+"""Provides a lazy, read-only view of resolved configuration.
+
+Keys are resolved the first time they are read, rather than resolving
+every key up front, so that backends are never read for keys, e.g.
+secrets, an application doesn't use.
+
+    >>> import pitstop.backends.base, pitstop.strategies.v1
+    >>> strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+    ...     schema={
+    ...         'db': {
+    ...             'type': 'dict',
+    ...             'schema': {
+    ...                 'host': {'type': 'string', 'default': 'localhost'},
+    ...                 'port': {'type': 'integer', 'coerce': int},
+    ...             },
+    ...         },
+    ...     },
+    ... )
+    >>> strategy.backends.add(
+    ...     pitstop.backends.base.DictBackend(
+    ...         priority=1, name='dict', obj={'db.port': '5432'}
+    ...     )
+    ... )
+    >>> config = strategy.lazy()
+    >>> config.db.port
+    5432
+    >>> config['db']['host']
+    'localhost'
+
+"""
+import collections.abc
+import threading
+import typing
+
+import pitstop.paths
+import pitstop.types
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pitstop.strategies.v1
+
+
+__all__ = ('LazyConfig',)
+
+_MISSING = object()
+
+
+class _State:
+    """Values resolved through a :class:`LazyConfig` and its subviews."""
+
+    __slots__ = ('strategy', 'values', 'views', 'lock')
+
+    def __init__(  # noqa: D107
+        self, strategy: 'pitstop.strategies.v1.VersionOneStrategy'
+    ) -> None:
+        self.strategy = strategy
+        self.values: pitstop.types.T_StrAnyDict = {}
+        self.views: typing.Dict[str, 'LazyConfig'] = {}
+        self.lock = threading.Lock()
+
+    def resolve(self, paths: typing.List[str]) -> None:
+        """Resolve leaf **paths** in one batch, memoizing their values.
+
+        Values are read from the normalized document, so that they are
+        validated and coerced like resolved configuration, along with
+        any keys their cross-field rules refer to (see
+        :meth:`.VersionOneStrategy.select`).
+
+        """
+        document = self.strategy.resolve(paths=paths)
+        with self.lock:
+            for path in paths:
+                self.values[path] = pitstop.paths.get(document, path, None)
+
+
+class LazyConfig(collections.abc.Mapping):
+    """A lazy, read-only mapping view of resolved configuration.
+
+    Views map the fields of a schema level to values of leaves, and to
+    views of nested fields, which are also accessible as attributes.
+    Reading a leaf resolves and validates it, and :meth:`items`,
+    :meth:`values`, :meth:`load` and :meth:`to_dict` resolve all
+    remaining leaves of a view in a single batch. Resolved values are
+    memoized, and never read again, so create a new view with
+    :meth:`.VersionOneStrategy.lazy` to observe changes.
+
+    Fields named like :class:`~collections.abc.Mapping` methods, e.g.
+    ``items``, or starting with an underscore are only accessible as
+    items.
+
+    Args:
+        strategy (:class:`~.strategies.v1.VersionOneStrategy`): The
+            strategy to resolve configuration with.
+
+    """
+
+    __slots__ = ('_state', '_prefix', '_children')
+
+    def __init__(  # noqa: D107
+        self, strategy: 'pitstop.strategies.v1.VersionOneStrategy'
+    ) -> None:
+        self._init(_State(strategy), '')
+
+    def _init(self, state: _State, prefix: str) -> None:
+        object.__setattr__(self, '_state', state)
+        object.__setattr__(self, '_prefix', prefix)
+        object.__setattr__(self, '_children', None)
+
+    @classmethod
+    def _subview(cls, state: _State, prefix: str) -> 'LazyConfig':
+        """Create a view of the field at **prefix**, sharing **state**."""
+        view = cls.__new__(cls)
+        view._init(state, prefix)
+        return view
+
+    @property
+    def _fields(self) -> typing.Dict[str, bool]:
+        """Get the fields of this view, mapped to whether they're leaves."""
+        children = self._children
+        if children is None:
+            index = self._state.strategy.schema_index
+            children = index.children(self._prefix)
+            object.__setattr__(self, '_children', children)
+        return children
+
+    def _path(self, name: str) -> str:
+        return f'{self._prefix}.{name}' if self._prefix else name
+
+    def __getitem__(self, name: str) -> typing.Any:  # noqa: D105
+        is_leaf = self._fields[name]
+        path = self._path(name)
+        state = self._state
+        if not is_leaf:
+            view = state.views.get(path)
+            if view is None:
+                with state.lock:
+                    view = state.views.setdefault(
+                        path, self._subview(state, path)
+                    )
+            return view
+        value = state.values.get(path, _MISSING)
+        if value is _MISSING:
+            state.resolve([path])
+            value = state.values[path]
+        return value
+
+    def __getattr__(self, name: str) -> typing.Any:  # noqa: D105
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:  # noqa: D105
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __iter__(self) -> typing.Iterator[str]:  # noqa: D105
+        return iter(self._fields)
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._fields)
+
+    def __contains__(self, name: object) -> bool:  # noqa: D105
+        return name in self._fields
+
+    def __dir__(self) -> typing.Iterable[str]:  # noqa: D105
+        return [*super().__dir__(), *self._fields]
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f'<{type(self).__name__} {self._prefix!r}>'
+
+    def load(self) -> 'LazyConfig':
+        """Resolve all leaves of this view that weren't read yet.
+
+        Leaves are resolved in a single batch.
+
+        Returns:
+            LazyConfig: This view.
+
+        """
+        state = self._state
+        paths = [
+            leaf.path
+            for leaf in state.strategy.schema_index.under(self._prefix)
+            if leaf.path not in state.values
+        ]
+        if paths:
+            state.resolve(paths)
+        return self
+
+    def items(self) -> typing.ItemsView[str, typing.Any]:  # noqa: D102
+        return super(LazyConfig, self.load()).items()
+
+    def values(self) -> typing.ValuesView[typing.Any]:  # noqa: D102
+        return super(LazyConfig, self.load()).values()
+
+    def to_dict(self) -> pitstop.types.T_StrAnyDict:
+        """Resolve this view into a nested :obj:`dict`."""
+        return {
+            name: value.to_dict() if isinstance(value, LazyConfig) else value
+            for name, value in self.items()
+        }
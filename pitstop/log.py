@@ -0,0 +1,100 @@
+"""Provides logging helpers for hot paths.
+
+Events emitted for every key read, e.g. ``backend.get.succeeded``, are
+guarded by a :class:`HotLogger`, so that no logger is bound and no event
+payload is built unless the event's level is enabled. Levels are those
+of the standard library logger named after the emitting module, e.g.
+``pitstop.backends.fs``, as configured by the ``pitstop`` CLI. When
+configuring :mod:`structlog` without the standard library integration,
+enable per-key events with e.g.
+``logging.getLogger('pitstop').setLevel(logging.DEBUG)``.
+
+Per-key events can be sampled by setting ``$PITSTOP_LOG_SAMPLE_RATE``,
+or calling :func:`set_sample_rate`, to the fraction of events to emit.
+Invalid values of ``$PITSTOP_LOG_SAMPLE_RATE`` are logged and ignored.
+
+"""
+import logging
+import os
+import random
+
+import structlog
+
+
+__all__ = ('HotLogger', 'sample_rate', 'set_sample_rate')
+
+logger = structlog.get_logger()
+_sample_rate = 1.0
+
+
+def sample_rate() -> float:
+    """Get the fraction of per-key events emitted."""
+    return _sample_rate
+
+
+def set_sample_rate(rate: float) -> None:
+    """Set the fraction of per-key events emitted.
+
+    Args:
+        rate (float): A fraction between ``0`` (none) and ``1`` (all).
+
+    Raises:
+        ValueError: If **rate** is out of range.
+
+    """
+    global _sample_rate
+    if not 0 <= rate <= 1:
+        raise ValueError(f'Sample rate must be between 0 and 1, not {rate}')
+    _sample_rate = rate
+
+
+def _load_sample_rate() -> None:
+    """Set the sample rate from ``$PITSTOP_LOG_SAMPLE_RATE``, if valid."""
+    value = os.environ.get('PITSTOP_LOG_SAMPLE_RATE')
+    if not value:
+        return
+    try:
+        set_sample_rate(float(value))
+    except ValueError:
+        logger.warning('log.sample_rate.invalid', value=value)
+        set_sample_rate(1)
+
+
+_load_sample_rate()
+
+
+class HotLogger:
+    """Guard events emitted on hot paths by their level.
+
+    Checking a level costs a single cached lookup on the standard library
+    logger, so guarded events cost close to nothing when disabled::
+
+        hot = pitstop.log.HotLogger(__name__)
+
+        if hot.sampled(logging.DEBUG):
+            logger.debug('strategy.get', bpo=[b.name for b in backends])
+
+    Args:
+        name (str): The logger name, usually the module's ``__name__``.
+
+    """
+
+    __slots__ = ('_logger',)
+
+    def __init__(self, name: str) -> None:  # noqa: D107
+        self._logger = logging.getLogger(name)
+
+    def enabled(self, level: int) -> bool:
+        """Check whether events of **level** are enabled."""
+        return self._logger.isEnabledFor(level)
+
+    def sampled(self, level: int) -> bool:
+        """Check whether a per-key event of **level** should be emitted.
+
+        Like :meth:`enabled`, additionally sampling events at the
+        configured :func:`sample_rate`.
+
+        """
+        if not self._logger.isEnabledFor(level):
+            return False
+        return _sample_rate >= 1 or random.random() < _sample_rate
@@ -0,0 +1,127 @@
+"""Provides access to nested values by dotted key paths.
+
+Paths such as ``db.replicas.0.host`` are parsed once into tuples of keys,
+and cached. Mappings are indexed by key, sequences by integer index, and
+other objects by attribute, like :func:`glom.glom` string paths.
+
+    >>> document = {'db': {'replicas': [{'host': 'localhost'}]}}
+    >>> get(document, 'db.replicas.0.host')
+    'localhost'
+    >>> assign({}, 'db.primary.host', 'localhost')
+    {'db': {'primary': {'host': 'localhost'}}}
+
+"""
+import collections.abc
+import functools
+import typing
+
+import pitstop.types
+
+
+__all__ = ('assign', 'get', 'parse')
+
+_RAISE = object()
+
+
+@functools.lru_cache(maxsize=8192)
+def parse(path: str) -> typing.Tuple[str, ...]:
+    """Parse a dotted key **path** into a tuple of keys."""
+    return tuple(path.split('.'))
+
+
+def _child(node: typing.Any, key: str) -> typing.Any:
+    """Get the child **key** of a **node** that isn't a mapping."""
+    if isinstance(node, collections.abc.Mapping):
+        raise KeyError(key)
+    if isinstance(node, collections.abc.Sequence) and not isinstance(
+        node, (str, bytes)
+    ):
+        try:
+            return node[int(key)]
+        except (IndexError, ValueError):
+            raise KeyError(key)
+    try:
+        return getattr(node, key)
+    except AttributeError:
+        raise KeyError(key)
+
+
+def get(
+    target: typing.Any, path: str, default: typing.Any = _RAISE
+) -> typing.Any:
+    """Get the value at a dotted key **path** of **target**.
+
+    Args:
+        target: A nested structure, usually a :obj:`dict`.
+        path (str): The key path.
+        default (:obj:`typing.Any`, optional): A value to return if the
+            path does not exist.
+
+    Raises:
+        KeyError: If the path does not exist, and a default value is not
+            provided.
+
+    """
+    node = target
+    try:
+        for key in parse(path):
+            try:
+                node = node[key]
+            except (KeyError, IndexError, TypeError):
+                node = _child(node, key)
+    except KeyError:
+        if default is _RAISE:
+            raise KeyError(path)
+        return default
+    return node
+
+
+def assign(target: typing.Any, path: str, value: typing.Any) -> typing.Any:
+    """Assign **value** to a dotted key **path** of **target**.
+
+    Missing intermediate keys of mappings are created as dictionaries.
+
+        >>> assign({'foo': {'spam': 1}}, 'foo.bar.baz', 2)
+        {'foo': {'spam': 1, 'bar': {'baz': 2}}}
+
+    Args:
+        target: A nested structure, usually a :obj:`dict`.
+        path (str): The key path.
+        value: Any value.
+
+    Returns:
+        The original, now mutated **target**.
+
+    Raises:
+        KeyError: If an intermediate sequence index or attribute does not
+            exist.
+
+    """
+    *parents, last = parse(path)
+    node = target
+    for key in parents:
+        try:
+            node = node[key]
+        except KeyError:
+            if not isinstance(node, collections.abc.MutableMapping):
+                raise KeyError(path)
+            child: pitstop.types.T_StrAnyDict = {}
+            node[key] = child
+            node = child
+        except (IndexError, TypeError):
+            try:
+                node = _child(node, key)
+            except KeyError:
+                raise KeyError(path)
+    if type(node) is dict or isinstance(
+        node, collections.abc.MutableMapping
+    ):
+        node[last] = value
+    elif isinstance(node, collections.abc.MutableSequence):
+        try:
+            node[int(last)] = value
+        except (IndexError, ValueError):
+            raise KeyError(path)
+    else:
+        setattr(node, last, value)
+    return target
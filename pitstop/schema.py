@@ -0,0 +1,191 @@
+"""Provides an index of :mod:`cerberus` schema leaves."""
+import collections.abc
+import dataclasses
+import typing
+
+import sortedcontainers
+
+import pitstop.paths
+import pitstop.types
+import pitstop.utils
+
+
+__all__ = ('SchemaIndex', 'SchemaLeaf')
+
+
+@dataclasses.dataclass(frozen=True)
+class SchemaLeaf:
+    """A leaf of a :mod:`cerberus` schema.
+
+    Args:
+        path (str): The dotted key path of the leaf.
+        position (int): The position of the leaf in schema order.
+        schema: The schema node (rules) of the leaf.
+        default: The ``default`` rule of the leaf, or ``None``.
+        type: The ``type`` rule of the leaf, or ``None``.
+
+    """
+
+    path: str
+    position: int
+    schema: typing.Any
+    default: typing.Any = None
+    type: typing.Any = None
+
+
+class SchemaIndex(collections.abc.Mapping):
+    """A read-only mapping of leaf paths to :class:`SchemaLeaf` objects.
+
+    The schema is walked once on construction, so that default values,
+    leaf membership and prefix queries don't rescan the schema tree.
+
+        >>> index = SchemaIndex({
+        ...     'db': {
+        ...         'type': 'dict',
+        ...         'schema': {
+        ...             'host': {'type': 'string', 'default': 'localhost'},
+        ...             'port': {'type': 'integer'},
+        ...         },
+        ...     },
+        ... })
+        >>> index.default('db.host')
+        'localhost'
+        >>> [leaf.path for leaf in index.under('db')]
+        ['db.host', 'db.port']
+        >>> index.subschema(['db.port'])
+        {'db': {'type': 'dict', 'schema': {'port': {'type': 'integer'}}}}
+
+    Args:
+        schema (:obj:`dict`): A :mod:`cerberus` schema.
+
+    """
+
+    def __init__(  # noqa: D107
+        self, schema: pitstop.types.T_StrAnyMapping
+    ) -> None:
+        self.schema = schema
+        self._leaves: typing.Dict[str, SchemaLeaf] = {}
+        for position, (path, node) in enumerate(
+            pitstop.utils.schema_leaves(schema)
+        ):
+            if isinstance(node, collections.abc.Mapping):
+                default, type_ = node.get('default'), node.get('type')
+            else:
+                default = type_ = None
+            self._leaves[path] = SchemaLeaf(
+                path=path,
+                position=position,
+                schema=node,
+                default=default,
+                type=type_,
+            )
+        self._paths = sortedcontainers.SortedList(self._leaves)
+        self._children: typing.Dict[str, typing.Dict[str, bool]] = {}
+
+    def __getitem__(self, path: str) -> SchemaLeaf:  # noqa: D105
+        return self._leaves[path]
+
+    def __iter__(self) -> typing.Iterator[str]:  # noqa: D105
+        return iter(self._leaves)
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._leaves)
+
+    def __contains__(self, path: object) -> bool:  # noqa: D105
+        return path in self._leaves
+
+    def default(self, path: str) -> typing.Any:
+        """Get the default value of the leaf at **path**.
+
+        Returns:
+            The default value, or ``None`` if not set in the schema.
+
+        Raises:
+            KeyError: If **path** is not a leaf of the schema.
+
+        """
+        return self._leaves[path].default
+
+    def under(self, prefix: str) -> typing.List[SchemaLeaf]:
+        """Find all leaves at or under a key path **prefix**.
+
+        Args:
+            prefix (str): A dotted key path. An empty string matches
+                all leaves.
+
+        Returns:
+            list: Matching leaves, in schema order.
+
+        """
+        if not prefix:
+            return list(self._leaves.values())
+        # Paths beneath ``prefix`` sort between ``prefix.`` and
+        # ``prefix/``, since ``/`` immediately follows ``.`` in ASCII.
+        paths = list(
+            self._paths.irange(
+                f'{prefix}.', f'{prefix}/', inclusive=(True, False)
+            )
+        )
+        if prefix in self._leaves:
+            paths.append(prefix)
+        leaves = [self._leaves[path] for path in paths]
+        leaves.sort(key=lambda leaf: leaf.position)
+        return leaves
+
+    def children(self, prefix: str) -> typing.Dict[str, bool]:
+        """Find the fields directly beneath a key path **prefix**.
+
+        Results are memoized, and must be treated as read-only.
+
+        Args:
+            prefix (str): A dotted key path. An empty string matches
+                top-level fields.
+
+        Returns:
+            dict: A mapping of field names, in schema order, to whether
+                the field is a leaf.
+
+        """
+        children = self._children.get(prefix)
+        if children is None:
+            children = {}
+            start = len(prefix) + 1 if prefix else 0
+            for leaf in self.under(prefix):
+                name = pitstop.paths.parse(leaf.path[start:])[0]
+                if name not in children:
+                    path = f'{prefix}.{name}' if prefix else name
+                    children[name] = path in self._leaves
+            self._children[prefix] = children
+        return children
+
+    def subschema(
+        self, paths: typing.Iterable[str]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Build a schema of only the leaves at **paths**.
+
+        Leaves keep their rules, and so do the fields containing them,
+        with their ``schema`` rules pruned to the selected leaves.
+
+        Args:
+            paths (:obj:`typing.Iterable`): Leaf paths, in the order of
+                fields in the new schema.
+
+        Returns:
+            dict: A :mod:`cerberus` schema.
+
+        Raises:
+            KeyError: If a path is not a leaf of the schema.
+
+        """
+        subschema: pitstop.types.T_StrAnyDict = {}
+        for path in paths:
+            leaf = self._leaves[path]
+            *parents, name = pitstop.paths.parse(path)
+            source, target = self.schema, subschema
+            for parent in parents:
+                rules = source[parent]
+                if parent not in target:
+                    target[parent] = {**rules, 'schema': {}}
+                source, target = rules['schema'], target[parent]['schema']
+            target[name] = leaf.schema
+        return subschema
@@ -0,0 +1,187 @@
+"""Provides a daemon serving resolved configuration over a Unix socket.
+
+See :mod:`pitstop.client` for the wire protocol.
+
+"""
+import errno
+import os
+import socket
+import socketserver
+import stat
+import typing
+
+import structlog
+
+import pitstop.client
+import pitstop.encodings.json
+import pitstop.paths
+import pitstop.strategies.base
+import pitstop.types
+import pitstop.watch
+
+
+__all__ = ('Server',)
+
+logger = structlog.get_logger()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline delimited requests until the client disconnects."""
+
+    server: 'Server'
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            command, _, arg = line.decode().strip().partition(' ')
+            try:
+                payload = self.server.dispatch(command.upper(), arg)
+                response = b'OK ' + payload
+            except Exception as e:
+                logger.warn('server.request.failed', command=command, error=e)
+                # Encode the message, so that newlines can't end the reply.
+                message = f'{type(e).__name__}: {e}'
+                response = b'ERR ' + pitstop.encodings.json.dumps(
+                    message
+                ).encode()
+            self.wfile.write(response + b'\n')
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve configuration resolved by a strategy over a Unix socket.
+
+    The strategy is resolved once on startup. Backends are watched for
+    changes with a :class:`~.watch.Watcher`, and affected configuration
+    keys are resolved again whenever any of them changed.
+
+    Args:
+        strategy (:class:`~.strategies.base.BaseStrategy`): A connected
+            strategy.
+        socket_path (str, optional): The socket path. Defaults to
+            :func:`~.client.default_socket_path`.
+        reload_interval (float, optional): Seconds between checking
+            backends for changes. ``0`` disables reloading.
+
+    The socket is only accessible by its owner. A stale socket left
+    behind at **socket_path** is replaced, but any other file, or the
+    socket of a running server, is left alone.
+
+    Raises:
+        TypeError: If **strategy** is an :mod:`asyncio` strategy.
+        FileExistsError: If **socket_path** exists but isn't a socket.
+        OSError: If another server is listening on **socket_path**.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(  # noqa: D107
+        self,
+        strategy: pitstop.strategies.base.BaseStrategy,
+        socket_path: typing.Optional[str] = None,
+        reload_interval: float = 1,
+    ) -> None:
+        if isinstance(strategy, pitstop.strategies.base.AsyncBaseStrategy):
+            raise TypeError('Serving requires a synchronous strategy')
+        self.strategy = strategy
+        self.socket_path = socket_path or pitstop.client.default_socket_path()
+        self.reload_interval = reload_interval
+        document = strategy.resolve()
+        self._current: typing.Tuple[pitstop.types.T_StrAnyMapping, bytes] = (
+            document,
+            pitstop.encodings.json.dumps(document).encode(),
+        )
+        self.watcher = pitstop.watch.Watcher(
+            strategy, interval=reload_interval or 1
+        )
+        strategy.on_change(self._on_change)  # type: ignore
+        self._bound = False
+        super().__init__(self.socket_path, _RequestHandler)
+
+    @property
+    def document(self) -> pitstop.types.T_StrAnyMapping:
+        """Get the resolved configuration being served."""
+        return self._current[0]
+
+    def server_bind(self) -> None:
+        """Bind the socket, replacing a stale one, for its owner only."""
+        self._remove_stale_socket()
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        self._bound = True
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(
+                errno.EEXIST, 'Not a socket', self.socket_path
+            )
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            logger.info('server.stale_socket', socket=self.socket_path)
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise OSError(
+            errno.EADDRINUSE,
+            'Another server is listening',
+            self.socket_path,
+        )
+
+    def dispatch(self, command: str, arg: str) -> bytes:
+        """Answer a request, returning the encoded response payload."""
+        document, encoded = self._current
+        if command == 'RESOLVE':
+            return encoded
+        if command == 'GET':
+            value = pitstop.paths.get(document, arg)
+            return pitstop.encodings.json.dumps(value).encode()
+        if command == 'PING':
+            return b'"pong"'
+        raise ValueError(f'Unknown command {command!r}')
+
+    def refresh(self) -> bool:
+        """Reload changed backends, resolving affected keys again.
+
+        Returns:
+            bool: ``True`` if any configuration value changed.
+
+        """
+        return bool(self.watcher.check())
+
+    def _on_change(
+        self,
+        changed: typing.AbstractSet[str],
+        snapshot: pitstop.types.T_StrAnyMapping,
+    ) -> None:
+        # Replace a single tuple, so that readers never see a mismatch
+        # between the document and its encoding.
+        encoded = pitstop.encodings.json.dumps(snapshot).encode()
+        self._current = (snapshot, encoded)
+        logger.info('server.reloaded', changed=len(changed))
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Serve requests, and watch backends for changes, until shutdown."""
+        if self.reload_interval > 0:
+            self.watcher.start()
+        logger.info('server.listening', socket=self.socket_path)
+        super().serve_forever(poll_interval)
+
+    def server_close(self) -> None:
+        """Stop watching, close and remove the socket."""
+        self.watcher.stop()
+        super().server_close()
+        if not self._bound:
+            return
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
@@ -7,9 +7,8 @@ appropriate backend(s).
 """
 import typing
 
-import glom
-import stevedore
-
+import pitstop.backends.base
+import pitstop.entrypoints
 import pitstop.strategies.base
 import pitstop.types
 
@@ -21,37 +20,39 @@ def strategy_factory(
     config: pitstop.types.T_StrAnyMapping,
     strategy_name: typing.Optional[str] = None,
 ) -> 'pitstop.strategies.base.BaseStrategy':
-    """Initialize a strategy from a configuration object."""
+    """Initialize a strategy from a configuration object.
+
+    Strategy, backend and encoding drivers are looked up by name in the
+    :mod:`~pitstop.entrypoints` registry.
+
+    """
+    strategy_config = config.get('strategy') or {}
     if strategy_name is None:
-        strategy_name = f'v{glom.glom(config, "strategy.version", default=1)}'
-    strategy_mgr = stevedore.driver.DriverManager(
-        namespace='pitstop.strategies', name=strategy_name
+        strategy_name = f'v{strategy_config.get("version", 1)}'
+    strategy_cls = pitstop.entrypoints.load(
+        'pitstop.strategies', strategy_name
     )
-    strategy = strategy_mgr.driver.with_options(
-        **glom.glom(config, 'strategy.options', default={})
+    strategy = strategy_cls.with_options(
+        **strategy_config.get('options', {})
     )(
         schema=config['schema'],
-        bpo_map=glom.glom(
-            config, 'strategy.backend_priority_overrides', default={}
-        ),
+        bpo_map=strategy_config.get('backend_priority_overrides') or {},
     )
     for backend_cfg in config.get('backends', []):
-        backend_mgr = stevedore.driver.DriverManager(
-            namespace='pitstop.backends', name=backend_cfg['driver']
+        backend_cls = pitstop.entrypoints.load(
+            'pitstop.backends', backend_cfg['driver']
         )
-        driver = backend_mgr.driver.with_options(**backend_cfg['options'])
+        driver = backend_cls.with_options(**backend_cfg['options'])
         priority = backend_cfg.get('priority', -1)
         name = backend_cfg.get('name', backend_cfg['driver'])
-        if issubclass(
-            backend_mgr.driver, pitstop.backends.base.EncodingBackendMixin
-        ):
-            encoding = stevedore.driver.DriverManager(
-                namespace='pitstop.encodings', name=backend_cfg["encoding"]
-            ).driver.with_options()
+        if issubclass(backend_cls, pitstop.backends.base.EncodingBackendMixin):
+            encoding = pitstop.entrypoints.load(
+                'pitstop.encodings', backend_cfg['encoding']
+            ).with_options()
             strategy.backends.add(
                 driver(priority=priority, name=name, encoding=encoding())
             )
         else:
             strategy.backends.add(driver(priority=priority, name=name))
-    strategy.connect_all()
+    strategy.connect_all(**strategy_config.get('connect', {}))
     return strategy
@@ -1,25 +1,33 @@
 """Abstract bases for configuration strategies."""
 import abc
+import concurrent.futures as concurrent_futures
+import contextlib
 import dataclasses
+import threading
+import time
 import typing
 
 import sortedcontainers
 import structlog
 
 import pitstop.backends.base
+import pitstop.errors
+import pitstop.schema
 import pitstop.types
-import pitstop.utils
 
 
-__all__ = ('BaseStrategy',)
+__all__ = ('AbstractStrategy', 'AsyncBaseStrategy', 'BaseStrategy')
 
 logger = structlog.get_logger()
 
 
 # NOTE(darvid): python/mypy#5374
 @dataclasses.dataclass  # type: ignore
-class BaseStrategy(abc.ABC):
-    """Abstract base class for a configuration loading strategy.
+class AbstractStrategy(abc.ABC):
+    """State and helpers shared by synchronous and asyncio strategies.
+
+    Strategies derive from :class:`BaseStrategy`, or from
+    :class:`AsyncBaseStrategy` for :mod:`asyncio`.
 
     Args:
         schema (:obj:`dict`): A :mod:`cerberus` schema.
@@ -41,26 +49,158 @@ class BaseStrategy(abc.ABC):
         default_factory=dict
     )
 
-    _defaults_cache: pitstop.types.T_StrAnyDict = dataclasses.field(
-        default_factory=dict, init=False, repr=False
-    )
+    _schema_index: typing.Optional[
+        pitstop.schema.SchemaIndex
+    ] = dataclasses.field(default=None, init=False, repr=False)
+
+    @property
+    def schema_index(self) -> pitstop.schema.SchemaIndex:
+        """Get a :class:`~.schema.SchemaIndex` of the current schema.
+
+        The index is built on first access, and rebuilt whenever
+        :attr:`schema` is replaced.
+
+        """
+        index = self._schema_index
+        if index is None or index.schema is not self.schema:
+            index = self._schema_index = pitstop.schema.SchemaIndex(
+                self.schema
+            )
+        return index
+
+    @staticmethod
+    def _backend_keys(
+        backends: typing.Sequence[pitstop.backends.base.BaseObjectBackend],
+    ) -> typing.List[str]:
+        """Key **backends** by name, adding positions to shared names."""
+        names = [backend.name for backend in backends]
+        return [
+            name if names.count(name) == 1 else f'{name}[{index}]'
+            for index, name in enumerate(names)
+        ]
+
+    @staticmethod
+    def _connect_backend(
+        backend: pitstop.backends.base.BaseObjectBackend,
+        decode: bool,
+        include: typing.Optional[typing.Iterable[str]] = None,
+        timed_out: typing.Optional[threading.Event] = None,
+    ) -> None:
+        """Connect a single backend, decoding it if **decode** is set.
+
+        If **timed_out** is set once connected, the backend is cleaned
+        up rather than decoded.
+
+        """
+        backend.connect()
+        if timed_out is not None and timed_out.is_set():
+            logger.warn('connect.timed_out', backend=backend.name)
+            backend.cleanup()
+            return
+        if decode and isinstance(
+            backend, pitstop.backends.base.EncodingBackendMixin
+        ):
+            backend.decode(include)
+
+    @contextlib.contextmanager
+    def resolving(self) -> typing.Iterator[None]:
+        """Provide a context for a single resolution pass.
+
+        Enters :meth:`~.backends.base.BaseObjectBackend.resolving` for
+        every backend, so that reads within the context may be memoized
+        by backends, e.g. to avoid reading the same Vault secret twice.
+
+        """
+        with contextlib.ExitStack() as stack:
+            for backend in self.backends:
+                stack.enter_context(backend.resolving())
+            yield
+
+    def _get_schema_default(self, path: str) -> typing.Any:
+        """Get the default value for a key from current :attr:`schema`.
+
+        Args:
+            path (str): The key path.
 
-    def connect_all(self, decode: bool = True) -> None:
+        Returns:
+            The default value or ``None`` is not set in the schema.
+
+        Raises:
+            KeyError: If the key does not exist in the schema.
+
+        """
+        return self.schema_index.default(path)
+
+
+# NOTE(darvid): python/mypy#5374
+@dataclasses.dataclass  # type: ignore
+class BaseStrategy(AbstractStrategy):
+    """Abstract base class for a configuration loading strategy.
+
+    See :class:`AbstractStrategy` for arguments.
+
+    """
+
+    def connect_all(
+        self,
+        decode: bool = True,
+        concurrent: bool = False,
+        timeout: typing.Optional[float] = None,
+        max_workers: typing.Optional[int] = None,
+        selective: bool = False,
+    ) -> None:
         """Initialize all backends.
 
         Args:
             decode (:obj:`bool`, optional): If ``True``, decodes
                 configuration payloads from any backends that require
                 decoding. Defaults to ``True``.
+            concurrent (:obj:`bool`, optional): If ``True``, backends
+                are connected and decoded concurrently in a thread pool,
+                and errors from all backends are raised together.
+                Defaults to ``False``.
+            timeout (:obj:`float`, optional): When connecting
+                concurrently, the number of seconds to wait for each
+                backend, from when it starts connecting. Backends still
+                waiting for a thread once every thread is held by a
+                timed out backend time out as well. Timed out backends
+                may finish connecting in the background, after which
+                they are cleaned up rather than decoded. Defaults to
+                ``None`` (no timeout).
+            max_workers (:obj:`int`, optional): When connecting
+                concurrently, the maximum number of threads. Defaults to
+                one thread per backend.
+            selective (:obj:`bool`, optional): If ``True``, backends
+                only decode the parts of their configuration payloads
+                containing keys in the schema, where supported by their
+                encoding. Keys outside the schema can't be read from
+                such backends. Defaults to ``False``.
+
+        Raises:
+            BackendErrors: When connecting concurrently, if any backend
+                failed or timed out. Errors are keyed by backend name,
+                or by name and position (e.g. ``fs[1]``) if several
+                backends share a name.
 
         """
-        logger.debug('connect.all')
-        for backend in self.backends:
-            backend.connect()
-            if decode and isinstance(
-                backend, pitstop.backends.base.EncodingBackendMixin
-            ):
-                backend.decode()
+        logger.debug('connect.all', concurrent=concurrent)
+        include = list(self.schema_index) if selective else None
+        if not concurrent:
+            for backend in self.backends:
+                self._connect_backend(backend, decode, include)
+            return
+        backends = list(self.backends)
+        if not backends:
+            return
+        errors = _ConcurrentConnect(
+            strategy=self,
+            backends=backends,
+            workers=max_workers or len(backends),
+            timeout=timeout,
+        ).run(decode, include)
+        if errors:
+            logger.error('connect.all.failed', backends=sorted(errors))
+            raise pitstop.errors.BackendErrors(errors)
 
     @abc.abstractmethod
     def get(self, path: str, default: typing.Any) -> typing.Any:
@@ -84,31 +224,147 @@ class BaseStrategy(abc.ABC):
     def resolve(self) -> pitstop.types.T_StrAnyMapping:
         """Resolve a complete configuration object based on schema."""
 
-    def _get_schema_default(
-        self, path: str, use_cache: bool = True
-    ) -> typing.Any:
-        """Get the default value for a key from current :attr:`schema`.
 
-        Args:
-            path (str): The key path.
-            use_cache (bool, optional): If ``True``, default values from
-                the schema are memoized to instance state. Defaults to
-                ``True``.
+# NOTE(darvid): python/mypy#5374
+@dataclasses.dataclass  # type: ignore
+class AsyncBaseStrategy(AbstractStrategy):
+    """Abstract base class for an :mod:`asyncio` configuration strategy.
 
-        Returns:
-            The default value or ``None`` is not set in the schema.
+    See :class:`AbstractStrategy` for arguments.
 
-        Raises:
-            KeyError: If the key does not exist in the schema.
+    """
+
+    @abc.abstractmethod
+    async def connect_all(
+        self,
+        decode: bool = True,
+        timeout: typing.Optional[float] = None,
+        selective: bool = False,
+    ) -> None:
+        """Initialize all backends concurrently.
+
+        See :meth:`BaseStrategy.connect_all`.
+
+        """
+
+    @abc.abstractmethod
+    async def get(self, path: str, default: typing.Any) -> typing.Any:
+        """Read a configuration key **path**.
+
+        See :meth:`BaseStrategy.get`.
+
+        """
+
+    @abc.abstractmethod
+    async def resolve(self) -> pitstop.types.T_StrAnyMapping:
+        """Resolve a complete configuration object based on schema."""
+
+
+@dataclasses.dataclass
+class _ConcurrentConnect:
+    """Connects backends in a thread pool, timing out each backend.
+
+    See :meth:`BaseStrategy.connect_all`.
+
+    """
+
+    strategy: AbstractStrategy
+    backends: typing.List[pitstop.backends.base.BaseObjectBackend]
+    workers: int
+    timeout: typing.Optional[float] = None
+    errors: typing.Dict[str, BaseException] = dataclasses.field(
+        default_factory=dict
+    )
+    _started: typing.Dict[int, float] = dataclasses.field(
+        default_factory=dict
+    )
+    _stuck: int = 0
+    _lock: threading.Lock = dataclasses.field(  # type: ignore
+        default_factory=threading.Lock
+    )
+
+    def run(
+        self, decode: bool, include: typing.Optional[typing.Iterable[str]]
+    ) -> typing.Dict[str, BaseException]:
+        """Connect all backends, returning errors keyed by backend."""
+        timed_out = [threading.Event() for _ in self.backends]
+        keys = self.strategy._backend_keys(self.backends)
+
+        def connect(index: int) -> None:
+            self._started[index] = time.monotonic()
+            self.strategy._connect_backend(
+                self.backends[index], decode, include, timed_out[index]
+            )
+
+        executor = concurrent_futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='pitstop-connect'
+        )
+        try:
+            futures = {
+                executor.submit(connect, index): index
+                for index in range(len(self.backends))
+            }
+            pending = set(futures)
+            while pending:
+                wait = self._expire(futures, pending, timed_out, keys)
+                done, pending = concurrent_futures.wait(
+                    pending,
+                    timeout=wait,
+                    return_when=concurrent_futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        self.errors[keys[futures[future]]] = error
+        finally:
+            executor.shutdown(wait=False)
+        return self.errors
+
+    def _expire(
+        self,
+        futures: typing.Dict[concurrent_futures.Future, int],
+        pending: typing.Set[concurrent_futures.Future],
+        timed_out: typing.List[threading.Event],
+        keys: typing.List[str],
+    ) -> typing.Optional[float]:
+        """Time out pending backends, and get the seconds to wait next.
+
+        Timed out futures are removed from **pending**.
 
         """
-        if path in self._defaults_cache:
-            return self._defaults_cache[path]
-        for leaf, schema in pitstop.utils.schema_leaves(self.schema):
-            if leaf != path:
+        if self.timeout is None:
+            return None
+        now = time.monotonic()
+        deadlines = []
+        for future in list(pending):
+            index = futures[future]
+            start = self._started.get(index)
+            if start is None:
                 continue
-            default = schema.get('default')
-            if default is not None:
-                self._defaults_cache[path] = default
-            return default
-        raise KeyError(path)
+            if now < start + self.timeout:
+                deadlines.append(start + self.timeout)
+                continue
+            timed_out[index].set()
+            pending.discard(future)
+            with self._lock:
+                self._stuck += 1
+            future.add_done_callback(self._release)
+            self.errors[keys[index]] = concurrent_futures.TimeoutError(
+                f'Backend did not connect within {self.timeout} seconds'
+            )
+        if self._stuck >= self.workers:
+            for future in list(pending):
+                if future.cancel():
+                    pending.discard(future)
+                    self.errors[
+                        keys[futures[future]]
+                    ] = concurrent_futures.TimeoutError(
+                        'Backend did not start connecting, as all threads '
+                        'are held by timed out backends'
+                    )
+        return max(min(deadlines, default=now + self.timeout) - now, 0)
+
+    def _release(self, future: concurrent_futures.Future) -> None:
+        """Count the thread of a timed out backend as free once it's done."""
+        with self._lock:
+            self._stuck -= 1
@@ -1,63 +1,671 @@
 """Provides the version 1 configuration loading strategy."""
+import asyncio
+import collections
+import concurrent.futures
 import dataclasses
+import functools
+import logging
+import sys
+import threading
+import types
 import typing
 
-import cerberus
-import glom
-import pkg_resources
 import structlog
 
+import pitstop.backends.base
+import pitstop.entrypoints
 import pitstop.errors
+import pitstop.lazy
+import pitstop.log
+import pitstop.paths
+import pitstop.schema
 import pitstop.strategies.base
 import pitstop.types
 import pitstop.utils
+import pitstop.validation
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import cerberus
 
-__all__ = ('Validator', 'VersionOneStrategy', 'VersionOneStrategyOptions')
+__all__ = (  # noqa: F822
+    'AsyncVersionOneStrategy',
+    'BaseVersionOneStrategy',
+    'PlanEntry',
+    'ResolutionPlan',
+    'Validator',
+    'VersionOneStrategy',
+    'VersionOneStrategyOptions',
+)
 
 logger = structlog.get_logger()
+hot_logger = pitstop.log.HotLogger(__name__)
+_MISSING = object()
 
 
-class Validator(cerberus.Validator):
-    """A :mod:`cerberus` validator."""
+@functools.lru_cache(maxsize=None)
+def _validator_class() -> typing.Type['cerberus.Validator']:
+    """Define :class:`Validator`, importing :mod:`cerberus` on first use."""
+    import cerberus
 
-    def _validate_isentrypoint(self, isentrypoint, field, value):
-        """Validate an entrypoint with `pkg_resources`.
+    class Validator(cerberus.Validator):
+        """A :mod:`cerberus` validator."""
 
-        The rule's arguments are validated against this schema:
+        def _validate_isentrypoint(self, isentrypoint, field, value):
+            """Validate an entrypoint with the entrypoint registry.
+
+            The rule's arguments are validated against this schema:
+
+            {'type': 'string'}
+            """
+            names = pitstop.entrypoints.names(isentrypoint)
+            if value.lower() not in {name.lower() for name in names}:
+                self._error(
+                    field, f'Must be a valid entrypoint in {isentrypoint}'
+                )
+
+    Validator.__module__ = __name__
+    Validator.__qualname__ = 'Validator'
+    return Validator
+
+
+class _Module(types.ModuleType):
+    """This module, defining :class:`Validator` on first access."""
+
+    # Module level __getattr__ (PEP 562) requires Python 3.7.
+    @property
+    def Validator(self) -> typing.Type['cerberus.Validator']:  # noqa: N802
+        """Get the :mod:`cerberus` validator class."""
+        return _validator_class()
 
-        {'type': 'string'}
-        """
-        entrypoints = pkg_resources.iter_entry_points(isentrypoint)
-        if value.lower() not in (e.name.lower() for e in entrypoints):
-            self._error(field, f'Must be a valid entrypoint in {isentrypoint}')
+
+sys.modules[__name__].__class__ = _Module
 
 
 @dataclasses.dataclass(frozen=True)
-class VersionOneStrategyOptions(pitstop.utils.OptionsBag):
-    """V1 strategy options."""
+class PlanEntry:
+    """A configuration key compiled into a :class:`ResolutionPlan`.
+
+    Args:
+        path (str): The key path.
+        backends (tuple): Backends to read **path** from, in order of
+            precedence, with backend priority overrides applied.
+        default (:obj:`typing.Any`): The schema default value, or
+            ``None`` if not set in the schema.
+        in_schema (bool): ``False`` if **path** is not a leaf of the
+            schema, in which case reading a missing key raises a
+            :class:`KeyError` rather than returning **default**.
+
+    """
+
+    path: str
+    backends: typing.Tuple[pitstop.backends.base.BaseObjectBackend, ...]
+    default: typing.Any = None
+    in_schema: bool = True
+
+
+T_Selection = typing.Tuple[
+    typing.Tuple[PlanEntry, ...],
+    pitstop.types.T_StrAnyMapping,
+    typing.Optional[typing.Tuple[str, ...]],
+]
 
 
 @dataclasses.dataclass
-class VersionOneStrategy(
-    pitstop.strategies.base.BaseStrategy,
+class ResolutionPlan:
+    """A schema and backend priority overrides, compiled for resolving.
+
+    Plans are built once per combination of schema, backend priority
+    overrides and backends, so that resolving configuration does not
+    need to walk the schema or sort backends for every key.
+
+    Args:
+        schema (:obj:`dict`): The schema the plan was compiled from.
+        bpo_map (:obj:`dict`): The backend priority overrides the plan
+            was compiled from.
+        backends (tuple): The backends the plan was compiled from.
+        entries (tuple): A :class:`PlanEntry` for each schema leaf.
+        lookup (:obj:`dict`): A mapping of key paths to entries,
+            including entries for any paths outside of the schema that
+            were read through :meth:`VersionOneStrategy.get`.
+        selections (:obj:`collections.OrderedDict`): A mapping of key
+            path selections to their entries, subschema and selected
+            leaves, memoized by :meth:`VersionOneStrategy.select`.
+        max_selections (int, optional): The maximum number of memoized
+            selections. The least recently used selections are
+            discarded first. Defaults to ``128``.
+
+    """
+
+    schema: pitstop.types.T_StrAnyMapping
+    bpo_map: pitstop.types.PriorityOverridesMap
+    backends: typing.Tuple[pitstop.backends.base.BaseObjectBackend, ...]
+    entries: typing.Tuple[PlanEntry, ...] = ()
+    lookup: typing.Dict[str, PlanEntry] = dataclasses.field(
+        default_factory=dict
+    )
+    selections: typing.Dict[
+        typing.Tuple[str, ...], T_Selection
+    ] = dataclasses.field(default_factory=collections.OrderedDict)
+    max_selections: int = 128
+
+    def is_current(self, strategy: 'BaseVersionOneStrategy') -> bool:
+        """Check whether the plan is still valid for **strategy**."""
+        return (
+            self.schema is strategy.schema
+            and self.bpo_map is strategy.bpo_map
+            and len(self.backends) == len(strategy.backends)
+            and all(a is b for a, b in zip(self.backends, strategy.backends))
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class _Resolution:
+    """Configuration values read by a strategy, and the resolved document."""
+
+    values: pitstop.types.T_StrAnyMapping
+    document: pitstop.types.T_StrAnyMapping
+
+
+T_ChangeCallback = typing.Callable[
+    [typing.AbstractSet[str], pitstop.types.T_StrAnyMapping], None
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class VersionOneStrategyOptions(pitstop.utils.OptionsBag):
+    """V1 strategy options.
+
+    Args:
+        incremental_validation (bool, optional): If ``True``, resolved
+            configuration is validated incrementally, only validating
+            top-level schema fields again if their values changed since
+            the previous resolution (see
+            :class:`~.validation.IncrementalValidator`). If ``False``,
+            the complete document is validated on every resolution.
+            Defaults to ``True``.
+
+    """
+
+    incremental_validation: bool = dataclasses.field(default=True)
+
+
+# NOTE(darvid): python/mypy#5374
+@dataclasses.dataclass  # type: ignore
+class BaseVersionOneStrategy(
+    pitstop.strategies.base.AbstractStrategy,
     pitstop.utils.OptionsBagMixin[VersionOneStrategyOptions],
 ):
-    """V1 configuration loading strategy.
+    """Plans, validation and snapshots shared by V1 strategies.
 
-    This is a naive strategy that simply maintains a sorted list of
-    configuration backends by priority.
+    Backends are read by :class:`VersionOneStrategy`, or by
+    :class:`AsyncVersionOneStrategy` for :mod:`asyncio`.
 
     """
 
-    validator: cerberus.Validator = dataclasses.field(init=False)
+    validator: 'cerberus.Validator' = dataclasses.field(init=False)
+    _plan: typing.Optional[ResolutionPlan] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+    _incremental_validator: typing.Optional[
+        pitstop.validation.IncrementalValidator
+    ] = dataclasses.field(default=None, init=False, repr=False)
+    _resolution: typing.Optional[_Resolution] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _callbacks: typing.List[T_ChangeCallback] = dataclasses.field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _lock: threading.RLock = dataclasses.field(  # type: ignore
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(
-        self, validator: typing.Optional[cerberus.Validator] = None
+        self, validator: typing.Optional['cerberus.Validator'] = None
     ) -> None:  # noqa: D105
         if self.options is None:
             self.options = VersionOneStrategyOptions()
-        self.validator = Validator(self.schema)
+        self.validator = self._build_validator(self.schema)
+
+    @staticmethod
+    def _build_validator(
+        schema: pitstop.types.T_StrAnyMapping, frozen: bool = False
+    ) -> 'cerberus.Validator':
+        """Build a :class:`Validator` with the process-wide cache.
+
+        Pass **frozen** for schemas that are never changed in place,
+        e.g. the subschemas of selections. See
+        :class:`~.validation.ValidatorCache`.
+
+        """
+        return pitstop.validation.validator_cache.validator(
+            _validator_class(), schema, frozen=frozen
+        )
+
+    @property
+    def plan(self) -> ResolutionPlan:
+        """Get the current :class:`ResolutionPlan`.
+
+        The plan is compiled on first access, and recompiled whenever
+        :attr:`schema`, :attr:`bpo_map` or :attr:`backends` are replaced
+        or backends are added or removed. Call :meth:`invalidate_plan`
+        after mutating the schema or priority overrides in place.
+
+        """
+        plan = self._plan
+        if plan is None or not plan.is_current(self):
+            plan = self._plan = self._compile_plan()
+        return plan
+
+    @property
+    def incremental_validator(self) -> pitstop.validation.IncrementalValidator:
+        """Get an :class:`~.validation.IncrementalValidator` of the schema.
+
+        The validator is built on first access, and rebuilt whenever
+        :attr:`schema` is replaced.
+
+        """
+        validator = self._incremental_validator
+        if validator is None or validator.schema is not self.schema:
+            validator = self._incremental_validator = (
+                pitstop.validation.IncrementalValidator(
+                    self.schema, self._build_validator
+                )
+            )
+        return validator
+
+    def invalidate_plan(self) -> None:
+        """Discard the current :class:`ResolutionPlan`."""
+        self._plan = None
+
+    def plan_entry(self, path: str) -> PlanEntry:
+        """Get the :class:`PlanEntry` for a key **path**.
+
+        Paths outside of the schema are compiled on first read and
+        memoized to the current plan.
+
+        """
+        plan = self.plan
+        entry = plan.lookup.get(path)
+        if entry is None:
+            try:
+                default = self._get_schema_default(path)
+                in_schema = True
+            except KeyError:
+                default, in_schema = None, False
+            entry = plan.lookup[path] = PlanEntry(
+                path=path,
+                backends=self._backend_order(path, plan.backends),
+                default=default,
+                in_schema=in_schema,
+            )
+        return entry
+
+    def _backend_order(
+        self,
+        path: str,
+        backends: typing.Sequence[pitstop.backends.base.BaseObjectBackend],
+    ) -> typing.Tuple[pitstop.backends.base.BaseObjectBackend, ...]:
+        """Order **backends** for **path**, applying priority overrides."""
+        try:
+            bpo = pitstop.paths.get(self.bpo_map, path)
+        except KeyError:
+            return tuple(backends)
+        return tuple(
+            sorted(
+                (b for b in backends if b.name in bpo),
+                key=lambda b: bpo.index(b.name),
+            )
+        )
+
+    def _compile_plan(self) -> ResolutionPlan:
+        """Compile :attr:`schema` and :attr:`bpo_map` into a plan."""
+        backends = tuple(self.backends)
+        entries = tuple(
+            PlanEntry(
+                path=leaf.path,
+                backends=self._backend_order(leaf.path, backends),
+                default=leaf.default,
+            )
+            for leaf in self.schema_index.values()
+        )
+        logger.debug('strategy.plan.compiled', leaves=len(entries))
+        return ResolutionPlan(
+            schema=self.schema,
+            bpo_map=self.bpo_map,
+            backends=backends,
+            entries=entries,
+            lookup={entry.path: entry for entry in entries},
+        )
+
+    def select(
+        self,
+        paths: typing.Optional[typing.Iterable[str]] = None,
+        prefix: typing.Optional[str] = None,
+    ) -> T_Selection:
+        """Select schema leaves at or under key **paths** or a **prefix**.
+
+        Leaves referred to by cross-field rules (``dependencies`` and
+        ``excludes``) of selected leaves, or of the fields containing
+        them, are resolved and validated with the selection, so that
+        these rules can be checked. Recently used selections are
+        memoized to the current plan.
+
+        Args:
+            paths (:obj:`typing.Iterable`, optional): Key paths of leaves
+                or of fields containing leaves.
+            prefix (str, optional): A key path, selected like **paths**.
+
+        Returns:
+            tuple: Plan entries of the leaves to resolve in schema order,
+                a schema of only those leaves (see
+                :meth:`~.schema.SchemaIndex.subschema`), and the paths of
+                the selected leaves, or ``None`` if no other leaves are
+                resolved.
+
+        Raises:
+            KeyError: If a path selects no leaves of the schema.
+
+        """
+        selected = tuple(paths or ())
+        if prefix is not None:
+            selected += (prefix,)
+        plan = self.plan
+        selections = plan.selections
+        with self._lock:
+            selection = selections.get(selected)
+            if selection is not None:
+                selections.move_to_end(selected)  # type: ignore
+        if selection is None:
+            index = self.schema_index
+            leaves: typing.Dict[str, pitstop.schema.SchemaLeaf] = {}
+            for path in selected:
+                found = index.under(path)
+                if not found:
+                    raise KeyError(path)
+                leaves.update((leaf.path, leaf) for leaf in found)
+            requested = tuple(
+                sorted(leaves, key=lambda path: leaves[path].position)
+            )
+            pending = list(requested)
+            while pending:
+                for reference in pitstop.validation._referenced_paths(
+                    self.schema, pending.pop()
+                ):
+                    for leaf in index.under(reference):
+                        if leaf.path not in leaves:
+                            leaves[leaf.path] = leaf
+                            pending.append(leaf.path)
+            ordered = sorted(leaves, key=lambda path: leaves[path].position)
+            selection = (
+                tuple(plan.lookup[path] for path in ordered),
+                index.subschema(ordered),
+                requested if len(ordered) > len(requested) else None,
+            )
+            with self._lock:
+                selections[selected] = selection
+                while len(selections) > plan.max_selections:
+                    selections.popitem(last=False)  # type: ignore
+            logger.debug(
+                'strategy.selected',
+                paths=selected,
+                leaves=len(requested),
+                referenced=len(ordered) - len(requested),
+            )
+        return selection
+
+    @staticmethod
+    def _get_entry_default(
+        entry: PlanEntry, default: typing.Any = None
+    ) -> typing.Any:
+        """Get the value of a plan **entry** missing from all backends."""
+        if default is not None:
+            return default
+        if not entry.in_schema:
+            raise KeyError(entry.path)
+        return entry.default
+
+    @staticmethod
+    def _batch_rounds(
+        entries: typing.Iterable[PlanEntry], values: pitstop.types.T_StrAnyDict
+    ) -> typing.Iterator[
+        typing.List[typing.Tuple[typing.Any, typing.List[str]]]
+    ]:
+        """Generate rounds of per-backend batches of unresolved keys.
+
+        Round ``n`` batches each unresolved key under the ``n``-th
+        backend in its order of precedence. Callers must add the values
+        read for each round to **values** before advancing to the next.
+
+        Yields:
+            list: ``(backend, paths)`` tuples.
+
+        """
+        unresolved = list(entries)
+        depth = 0
+        while unresolved:
+            batches: typing.Dict[
+                int, typing.Tuple[typing.Any, typing.List[str]]
+            ] = {}
+            for entry in unresolved:
+                if depth < len(entry.backends):
+                    backend = entry.backends[depth]
+                    batches.setdefault(id(backend), (backend, []))[1].append(
+                        entry.path
+                    )
+            if not batches:
+                return
+            if hot_logger.enabled(logging.DEBUG):
+                for backend, paths in batches.values():
+                    logger.debug(
+                        'strategy.get_many',
+                        backend=backend.name,
+                        keys=len(paths),
+                    )
+            yield list(batches.values())
+            unresolved = [e for e in unresolved if e.path not in values]
+            depth += 1
+
+    def _build_document(
+        self,
+        entries: typing.Iterable[PlanEntry],
+        values: pitstop.types.T_StrAnyMapping,
+        allow_missing: bool = True,
+        schema: typing.Optional[pitstop.types.T_StrAnyMapping] = None,
+        keep: typing.Optional[typing.Iterable[str]] = None,
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Expand and validate values read for plan **entries**.
+
+        If a **schema** is given, e.g. a subschema of selected leaves,
+        the document is validated against it rather than :attr:`schema`,
+        and only the leaves at **keep**, if given, are returned. The
+        **schema** must not be changed in place afterwards.
+
+        """
+        leaves: pitstop.types.T_StrAnyDict = {}
+        for entry in entries:
+            try:
+                leaves[entry.path] = values[entry.path]
+            except KeyError:
+                if entry.default is None and not allow_missing:
+                    raise
+                leaves[entry.path] = entry.default
+        document: pitstop.types.T_StrAnyDict = {}
+        if schema is not None:
+            validator = self._build_validator(schema, frozen=True)
+            for path, value in leaves.items():
+                pitstop.paths.assign(document, path, value)
+            if not validator.validate(document):
+                raise pitstop.errors.ValidationError(validator.errors)
+            if keep is None:
+                return validator.document
+            kept: pitstop.types.T_StrAnyDict = {}
+            for path in keep:
+                value = pitstop.paths.get(validator.document, path, _MISSING)
+                if value is not _MISSING:
+                    pitstop.paths.assign(kept, path, value)
+            return kept
+        with self._lock:
+            if self.options.incremental_validation:
+                return self.incremental_validator.validate(leaves)
+            for path, value in leaves.items():
+                pitstop.paths.assign(document, path, value)
+            valid = self.validator.validate(document)
+            if not valid:
+                raise pitstop.errors.ValidationError(self.validator.errors)
+            return self.validator.document
+
+    @property
+    def snapshot(self) -> typing.Optional[pitstop.types.T_StrAnyMapping]:
+        """Get the most recently resolved configuration, if any.
+
+        The snapshot is replaced by a single assignment on every
+        :meth:`resolve` and :meth:`refresh`, so readers in other threads
+        never observe a partially updated configuration. Snapshots must
+        be treated as read-only.
+
+        """
+        resolution = self._resolution
+        return resolution.document if resolution is not None else None
+
+    def on_change(self, callback: T_ChangeCallback) -> T_ChangeCallback:
+        """Register a **callback** for configuration changes.
+
+        Callbacks are called by :meth:`refresh` with the set of changed
+        key paths and the new snapshot. May be used as a decorator.
+
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def _affected_entries(
+        self,
+        backends: typing.Iterable[pitstop.backends.base.BaseObjectBackend],
+    ) -> typing.List[PlanEntry]:
+        """Find plan entries that may be read from **backends**."""
+        ids = {id(backend) for backend in backends}
+        return [
+            entry
+            for entry in self.plan.entries
+            if any(id(backend) in ids for backend in entry.backends)
+        ]
+
+    def _apply_refresh(
+        self,
+        previous: _Resolution,
+        affected: typing.List[PlanEntry],
+        fresh: pitstop.types.T_StrAnyMapping,
+    ) -> typing.Set[str]:
+        """Replace **previous** with **fresh** values of **affected** keys.
+
+        Returns:
+            set: Key paths whose values changed.
+
+        """
+        values = dict(previous.values)
+        changed = set()
+        for entry in affected:
+            old = values.pop(entry.path, _MISSING)
+            new = fresh.get(entry.path, _MISSING)
+            if new is not _MISSING:
+                values[entry.path] = new
+            if old != new:
+                changed.add(entry.path)
+        if changed:
+            document = self._build_document(self.plan.entries, values)
+            self._resolution = _Resolution(values=values, document=document)
+        return changed
+
+    def _notify(
+        self,
+        changed: typing.Set[str],
+        snapshot: typing.Optional[pitstop.types.T_StrAnyMapping],
+    ) -> None:
+        """Call change callbacks, if any key paths **changed**."""
+        if changed:
+            logger.info('strategy.refreshed', changed=len(changed))
+            for callback in list(self._callbacks):
+                callback(changed, snapshot)  # type: ignore
+
+
+@dataclasses.dataclass
+class VersionOneStrategy(
+    BaseVersionOneStrategy, pitstop.strategies.base.BaseStrategy
+):
+    """V1 configuration loading strategy.
+
+    This is a naive strategy that simply maintains a sorted list of
+    configuration backends by priority.
+
+    """
+
+    def _get_entry(
+        self, entry: PlanEntry, default: typing.Any = None
+    ) -> typing.Any:
+        """Read a configuration key as described by a plan **entry**."""
+        if hot_logger.sampled(logging.DEBUG):
+            logger.debug(
+                'strategy.get',
+                path=entry.path,
+                bpo=[b.name for b in entry.backends],
+            )
+        for backend in entry.backends:
+            try:
+                return backend.get(entry.path)
+            except KeyError:
+                continue
+        return self._get_entry_default(entry, default)
+
+    def _get_many_entries(
+        self, entries: typing.Iterable[PlanEntry]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read configuration keys for many plan **entries** in batches.
+
+        Each round hands every backend all unresolved keys for which it
+        is next in precedence in a single
+        :meth:`~.backends.base.BaseObjectBackend.get_many` call, and
+        only keys missing from that backend move on to the next round.
+
+        Returns:
+            dict: A mapping of key paths to values, omitting keys that
+                were not found in any backend.
+
+        """
+        values: pitstop.types.T_StrAnyDict = {}
+        for batches in self._batch_rounds(entries, values):
+            for backend, paths in batches:
+                values.update(backend.get_many(paths))
+        return values
+
+    def refresh(
+        self,
+        backends: typing.Iterable[pitstop.backends.base.BaseObjectBackend],
+    ) -> typing.Set[str]:
+        """Resolve keys again after **backends** changed.
+
+        Only keys that may be read from the given backends are read
+        again. If any of their values changed, a new snapshot replaces
+        the current one, and change callbacks are called.
+
+        Args:
+            backends: Backends that changed, e.g. after reloading.
+
+        Returns:
+            set: Key paths whose values changed.
+
+        """
+        with self._lock:
+            previous = self._resolution
+            if previous is None:
+                self.resolve()
+                changed = set(self.plan.lookup)
+            else:
+                affected = self._affected_entries(backends)
+                with self.resolving():
+                    fresh = self._get_many_entries(affected)
+                changed = self._apply_refresh(previous, affected, fresh)
+            snapshot = self.snapshot
+        self._notify(changed, snapshot)
+        return changed
 
     def get(self, path: str, default: typing.Any = None) -> typing.Any:
         """Read a configuration key **path**.
@@ -75,28 +683,13 @@ class VersionOneStrategy(
                 backend, and a default value is not provided.
 
         """
-        log = logger.bind(path=path)
-        try:
-            bpo = glom.glom(self.bpo_map, path)
-            backends = sorted(
-                (b for b in self.backends if b.name in bpo),
-                key=lambda b: bpo.index(b.name),
-            )
-        except glom.PathAccessError:
-            backends = self.backends
-        log = log.bind(bpo=[b.name for b in backends])
-        log.debug('strategy.get')
-        for backend in backends:
-            try:
-                return backend.get(path)
-            except KeyError:
-                continue
-        if default is None:
-            return self._get_schema_default(path)
-        return default
+        return self._get_entry(self.plan_entry(path), default)
 
     def resolve(
-        self, allow_missing: bool = True
+        self,
+        allow_missing: bool = True,
+        paths: typing.Optional[typing.Iterable[str]] = None,
+        prefix: typing.Optional[str] = None,
     ) -> pitstop.types.T_StrAnyMapping:
         """Resolve a complete configuration object based on schema.
 
@@ -104,11 +697,24 @@ class VersionOneStrategy(
         :attr:`schema`, and resolves each key against all backends,
         returning a nested mapping of current configuration.
 
+        Configuration may be resolved partially, by selecting **paths**
+        or a **prefix** (see :meth:`select`). Backends are then only read
+        for the selected keys, and keys their cross-field rules refer
+        to, and the document is only validated against that part of the
+        schema. Only the selected keys are returned. Partially resolved
+        configuration does not replace :attr:`snapshot`.
+
+            >>> strategy.resolve(prefix='db')  # doctest: +SKIP
+            {'db': {'host': 'localhost', 'port': 5432}}
+
         Args:
             allow_missing (:obj:`bool`, optional): If ``True``, any
                 configuration keys that are present in the schema but
                 missing from all backends will not raise a
                 :class:`KeyError`. Defaults to ``True``.
+            paths (:obj:`typing.Iterable`, optional): Key paths of
+                leaves or fields to resolve.
+            prefix (str, optional): A key path of a field to resolve.
 
         Returns:
             dict: Resolved and expanded configuration mapping.
@@ -116,17 +722,223 @@ class VersionOneStrategy(
         Raises:
             KeyError: If **allow_missing** is ``False``, a
                 :class:`KeyError` is thrown if any configuration key
-                from the :attr:`schema` could not be resolved.
+                from the :attr:`schema` could not be resolved. Also
+                raised if **paths** or **prefix** select no keys.
 
         """
-        document: pitstop.types.T_StrAnyMapping = {}
-        for leaf, schema in pitstop.utils.schema_leaves(self.schema):
+        if paths is not None or prefix is not None:
+            entries, schema, keep = self.select(paths, prefix)
+            with self.resolving():
+                values = self._get_many_entries(entries)
+            return self._build_document(
+                entries, values, allow_missing, schema, keep
+            )
+        entries = self.plan.entries
+        with self.resolving():
+            values = self._get_many_entries(entries)
+        document = self._build_document(entries, values, allow_missing)
+        self._resolution = _Resolution(values=values, document=document)
+        return document
+
+    def lazy(self) -> pitstop.lazy.LazyConfig:
+        """Get a lazy, read-only view of configuration.
+
+        Keys are resolved and validated when first read, rather than up
+        front (see :class:`~.lazy.LazyConfig`).
+
+            >>> config = strategy.lazy()  # doctest: +SKIP
+            >>> config.db.port  # doctest: +SKIP
+            5432
+
+        """
+        return pitstop.lazy.LazyConfig(self)
+
+
+@dataclasses.dataclass
+class AsyncVersionOneStrategy(
+    BaseVersionOneStrategy, pitstop.strategies.base.AsyncBaseStrategy
+):
+    """V1 configuration loading strategy for :mod:`asyncio`.
+
+    Backends may be :class:`~.backends.base.AsyncBaseObjectBackend`
+    instances, or synchronous backends, which are adapted with
+    :class:`~.backends.base.ExecutorBackend` so that they don't block
+    the event loop.
+
+    Args:
+        executor (:class:`concurrent.futures.Executor`, optional): The
+            executor to run synchronous backends in. Defaults to the
+            event loop's default executor.
+
+    """
+
+    executor: typing.Optional[concurrent.futures.Executor] = None
+    _adapters: typing.Dict[
+        int,
+        typing.Tuple[
+            pitstop.backends.base.BaseObjectBackend,
+            pitstop.backends.base.AsyncBaseObjectBackend,
+        ],
+    ] = dataclasses.field(default_factory=dict, init=False, repr=False)
+
+    def _adapt(
+        self,
+        backend: typing.Union[
+            pitstop.backends.base.BaseObjectBackend,
+            pitstop.backends.base.AsyncBaseObjectBackend,
+        ],
+    ) -> pitstop.backends.base.AsyncBaseObjectBackend:
+        """Get an asynchronous interface to **backend**."""
+        if isinstance(backend, pitstop.backends.base.AsyncBaseObjectBackend):
+            return backend
+        cached = self._adapters.get(id(backend))
+        if cached is not None and cached[0] is backend:
+            return cached[1]
+        adapter = pitstop.backends.base.ExecutorBackend.adapt(
+            backend, executor=self.executor
+        )
+        self._adapters[id(backend)] = (backend, adapter)
+        return adapter
+
+    async def connect_all(
+        self,
+        decode: bool = True,
+        timeout: typing.Optional[float] = None,
+        selective: bool = False,
+    ) -> None:
+        """Initialize all backends concurrently.
+
+        Args:
+            decode (:obj:`bool`, optional): If ``True``, decodes
+                configuration payloads from any backends that require
+                decoding. Defaults to ``True``.
+            timeout (:obj:`float`, optional): The number of seconds to
+                wait for each backend. Defaults to ``None`` (no
+                timeout).
+            selective (:obj:`bool`, optional): If ``True``, backends
+                only decode the parts of their configuration payloads
+                containing keys in the schema (see
+                :meth:`.BaseStrategy.connect_all`).
+
+        Raises:
+            BackendErrors: If any backend failed or timed out.
+
+        """
+        logger.debug('connect.all', concurrent=True)
+        include = list(self.schema_index) if selective else None
+        backends = list(self.backends)
+        coros = []
+        for backend in backends:
+            adapter = self._adapt(backend)
+            if isinstance(adapter, pitstop.backends.base.ExecutorBackend):
+                coro = adapter.connect(decode=decode, include=include)
+            else:
+                coro = adapter.connect()
+            coros.append(asyncio.wait_for(coro, timeout))
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        errors = {
+            key: result
+            for key, result in zip(self._backend_keys(backends), results)
+            if isinstance(result, BaseException)
+        }
+        if errors:
+            logger.error('connect.all.failed', backends=sorted(errors))
+            raise pitstop.errors.BackendErrors(errors)
+
+    async def get(
+        self, path: str, default: typing.Any = None
+    ) -> typing.Any:
+        """Read a configuration key **path**.
+
+        See :meth:`VersionOneStrategy.get`.
+
+        """
+        entry = self.plan_entry(path)
+        if hot_logger.sampled(logging.DEBUG):
+            logger.debug(
+                'strategy.get',
+                path=path,
+                bpo=[b.name for b in entry.backends],
+            )
+        for backend in entry.backends:
             try:
-                pitstop.utils.unglom(document, leaf, self.get(leaf))
+                return await self._adapt(backend).get(path)
             except KeyError:
-                if not allow_missing:
-                    raise
-        valid = self.validator.validate(document)
-        if not valid:
-            raise pitstop.errors.ValidationError(self.validator.errors)
-        return self.validator.document
+                continue
+        return self._get_entry_default(entry, default)
+
+    async def resolve(
+        self,
+        allow_missing: bool = True,
+        paths: typing.Optional[typing.Iterable[str]] = None,
+        prefix: typing.Optional[str] = None,
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Resolve a complete configuration object based on schema.
+
+        Each round of batched reads is sent to all backends at once.
+
+        See :meth:`VersionOneStrategy.resolve`.
+
+        """
+        partial = paths is not None or prefix is not None
+        schema: typing.Optional[pitstop.types.T_StrAnyMapping] = None
+        keep: typing.Optional[typing.Tuple[str, ...]] = None
+        if partial:
+            entries, schema, keep = self.select(paths, prefix)
+        else:
+            entries = self.plan.entries
+        with self.resolving():
+            values = await self._get_many_entries(entries)
+        document = self._build_document(
+            entries, values, allow_missing, schema, keep
+        )
+        if partial:
+            return document
+        self._resolution = _Resolution(values=values, document=document)
+        return document
+
+    async def _get_many_entries(
+        self, entries: typing.Iterable[PlanEntry]
+    ) -> pitstop.types.T_StrAnyDict:
+        """Read configuration keys for many plan **entries** in batches.
+
+        Each round of batched reads is sent to all backends at once.
+
+        See :meth:`VersionOneStrategy._get_many_entries`.
+
+        """
+        values: pitstop.types.T_StrAnyDict = {}
+        for batches in self._batch_rounds(entries, values):
+            results = await asyncio.gather(
+                *(
+                    self._adapt(backend).get_many(paths)
+                    for backend, paths in batches
+                )
+            )
+            for result in results:
+                values.update(result)
+        return values
+
+    async def refresh(
+        self,
+        backends: typing.Iterable[pitstop.backends.base.BaseObjectBackend],
+    ) -> typing.Set[str]:
+        """Resolve keys again after **backends** changed.
+
+        See :meth:`VersionOneStrategy.refresh`.
+
+        """
+        previous = self._resolution
+        if previous is None:
+            await self.resolve()
+            changed = set(self.plan.lookup)
+        else:
+            affected = self._affected_entries(backends)
+            with self.resolving():
+                fresh = await self._get_many_entries(affected)
+            with self._lock:
+                changed = self._apply_refresh(
+                    self._resolution or previous, affected, fresh
+                )
+        self._notify(changed, self.snapshot)
+        return changed
@@ -1,5 +1,6 @@
 """Generics and convenient type annotation constants."""
 import functools
+import mmap
 import typing
 
 import sortedcontainers
@@ -8,6 +9,7 @@ import sortedcontainers
 __all__ = (
     'PrioritizedBackendList',
     'PriorityOverridesMap',
+    'T_Source',
     'T_StrAnyDict',
     'T_StrAnyMapping',
 )
@@ -18,3 +20,4 @@ PrioritizedBackendList = functools.partial(
 PriorityOverridesMap = typing.Dict[str, typing.Iterable[str]]
 T_StrAnyMapping = typing.Mapping[str, typing.Any]
 T_StrAnyDict = typing.Dict[str, typing.Any]
+T_Source = typing.Union[str, bytes, bytearray, memoryview, mmap.mmap]
@@ -1,16 +1,19 @@
 """Provides generic utilities."""
 import dataclasses
 import functools
+import os
 import typing
 
-import glom
 import typing_inspect
 
+import pitstop.paths
 from pitstop.types import T_StrAnyMapping
 
 
 __all__ = (
     'schema_leaves',
+    'stat_signature',
+    'T_StatSignature',
     'OptionsBag',
     'OptionsBagMixin',
     'T_OptionsBag',
@@ -19,6 +22,7 @@ __all__ = (
 
 
 T_OptionsBag = typing.TypeVar('T_OptionsBag')
+T_StatSignature = typing.Optional[typing.Tuple[int, int, int]]
 
 
 def schema_leaves(
@@ -56,13 +60,27 @@ def schema_leaves(
             yield (key, value)
 
 
+def stat_signature(path: str) -> T_StatSignature:
+    """Get the modification time, size and inode of a file at **path**.
+
+    Returns:
+        tuple: The signature, or ``None`` if the file does not exist.
+
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def unglom(
     d: T_StrAnyMapping, path: str, value: typing.Any
 ) -> T_StrAnyMapping:
-    """Create nested dictionary structure given a glom compatible path.
+    """Create nested dictionary structure given a dotted key path.
 
-    This is essentially just a wrapper around :func:`glom.assign`, but
-    works with nested paths.
+    Missing intermediate dictionaries are created, see
+    :func:`pitstop.paths.assign`.
 
         >>> unglom({}, 'foo.bar.baz', 'spam')
         {'foo': {'bar': {'baz': 'spam'}}}
@@ -76,11 +94,7 @@ def unglom(
         :obj:`dict`: The original, now mutated dictionary.
 
     """
-    try:
-        return glom.assign(d, path, value)
-    except KeyError:
-        parent, child = path.rsplit(".", 1)
-        return unglom(d, parent, {child: value})
+    return pitstop.paths.assign(d, path, value)
 
 
 @dataclasses.dataclass(frozen=True)
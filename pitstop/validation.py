@@ -0,0 +1,552 @@
+"""Provides validation of resolved configuration.
+
+Validators are built through a process-wide :class:`ValidatorCache`, so
+that identical schemas are only normalized and checked by
+:mod:`cerberus` once.
+
+Resolved documents are validated in units of top-level schema fields.
+Each unit caches the leaf values it was last validated with, and its
+normalized subdocument or errors, so that only units whose values
+changed since the previous validation are validated again.
+
+Cross-field rules (``dependencies`` and ``excludes``) are confined to
+their validation unit: top-level fields referring to each other, or
+referred to with absolute (``^``) paths from within another field, are
+validated together. Rules with custom callables that inspect other
+fields of the document are not detected, and require full validation.
+
+"""
+import collections
+import collections.abc
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import threading
+import typing
+
+import structlog
+
+import pitstop
+import pitstop.cache
+import pitstop.errors
+import pitstop.paths
+import pitstop.types
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import cerberus
+
+
+__all__ = ('IncrementalValidator', 'validator_cache', 'ValidatorCache')
+
+logger = structlog.get_logger()
+
+T_ValidatorFactory = typing.Callable[
+    [pitstop.types.T_StrAnyMapping], 'cerberus.Validator'
+]
+
+_CROSS_FIELD_RULES = ('dependencies', 'excludes')
+_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+def _copy_rules(o: typing.Any) -> typing.Any:
+    """Copy the dictionaries and lists of an expanded schema."""
+    if isinstance(o, dict):
+        return {key: _copy_rules(value) for key, value in o.items()}
+    if isinstance(o, list):
+        return [_copy_rules(value) for value in o]
+    return o
+
+
+def _references(rule: typing.Any) -> typing.Iterator[str]:
+    """Find field references of a ``dependencies`` or ``excludes`` rule."""
+    if isinstance(rule, str):
+        yield rule
+    elif isinstance(rule, collections.abc.Mapping):
+        yield from rule
+    elif isinstance(rule, collections.abc.Iterable):
+        for reference in rule:
+            if isinstance(reference, str):
+                yield reference
+
+
+def _rule_references(
+    rules: typing.Any, nested: bool = True
+) -> typing.Iterator[str]:
+    """Find references of cross-field rules in **rules**.
+
+    Rules of fields nested in a ``schema`` rule are only searched if
+    **nested** is ``True``.
+
+    """
+    stack = [rules]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, collections.abc.Mapping):
+            for name, value in node.items():
+                if name in _CROSS_FIELD_RULES:
+                    yield from _references(value)
+                elif nested or name != 'schema':
+                    stack.append(value)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+
+def _referenced_fields(rules: typing.Any) -> typing.Iterator[str]:
+    """Find top-level fields referenced by cross-field rules in **rules**.
+
+    Relative references are resolved against the top level, which
+    over-approximates references from nested fields to their siblings,
+    but never misses a reference between top-level fields.
+
+    """
+    for reference in _rule_references(rules):
+        yield pitstop.paths.parse(reference.lstrip('^'))[0]
+
+
+def _referenced_paths(
+    schema: pitstop.types.T_StrAnyMapping, path: str
+) -> typing.Iterator[str]:
+    """Find key paths referenced by cross-field rules of a schema leaf.
+
+    Rules of the leaf at **path** and of the fields containing it are
+    searched. Relative references are resolved against the field
+    containing the rule, like :mod:`cerberus` does.
+
+    """
+    rules: typing.Any = {'schema': schema}
+    parents: typing.List[str] = []
+    for key in pitstop.paths.parse(path):
+        rules = rules['schema'][key]
+        for reference in _rule_references(rules, nested=False):
+            if reference.startswith('^'):
+                yield reference[1:]
+            else:
+                yield '.'.join((*parents, reference))
+        parents.append(key)
+
+
+def _unchanged(
+    previous: typing.Optional[typing.Tuple[typing.Any, ...]],
+    values: typing.Tuple[typing.Any, ...],
+) -> bool:
+    """Compare leaf values by identity, or by type and value if scalar.
+
+    **previous** holds references to the values, so identities of values
+    that weren't replaced can't be reused by other objects.
+
+    """
+    if previous is None or len(previous) != len(values):
+        return False
+    for old, new in zip(previous, values):
+        if old is new:
+            continue
+        if type(old) is not type(new) or not isinstance(new, _SCALARS):
+            return False
+        if old != new:
+            return False
+    return True
+
+
+def _read_only(*args: typing.Any, **kwargs: typing.Any) -> typing.NoReturn:
+    raise TypeError('Validated documents are read-only')
+
+
+class _ReadOnlyDict(dict):
+    """A :obj:`dict` of a validated document, which can't be modified.
+
+    Copies are regular dictionaries, so that they can be modified.
+
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+
+    def __copy__(self) -> pitstop.types.T_StrAnyDict:  # noqa: D105
+        return dict(self)
+
+    def __deepcopy__(  # noqa: D105
+        self, memo: typing.Dict[int, typing.Any]
+    ) -> pitstop.types.T_StrAnyDict:
+        return {
+            key: copy.deepcopy(value, memo) for key, value in self.items()
+        }
+
+    def __reduce__(self) -> typing.Any:  # noqa: D105
+        return dict, (dict(self),)
+
+
+class _ReadOnlyList(list):
+    """A :obj:`list` of a validated document, which can't be modified."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = _read_only  # type: ignore
+    __iadd__ = __imul__ = _read_only  # type: ignore
+    append = clear = extend = insert = _read_only  # type: ignore
+    pop = remove = _read_only  # type: ignore
+    reverse = sort = _read_only  # type: ignore
+
+    def __copy__(self) -> typing.List[typing.Any]:  # noqa: D105
+        return list(self)
+
+    def __deepcopy__(  # noqa: D105
+        self, memo: typing.Dict[int, typing.Any]
+    ) -> typing.List[typing.Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> typing.Any:  # noqa: D105
+        return list, (list(self),)
+
+
+def _freeze(value: typing.Any) -> typing.Any:
+    """Copy the dictionaries and lists of **value** as read-only."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict(
+            (key, _freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze(item) for item in value)
+    return value
+
+
+@dataclasses.dataclass
+class _Unit:
+    """Top-level schema fields validated together, and cached results."""
+
+    schema: pitstop.types.T_StrAnyMapping
+    validator: typing.Optional['cerberus.Validator'] = None
+    paths: typing.Tuple[str, ...] = ()
+    values: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+    document: typing.Optional[pitstop.types.T_StrAnyMapping] = None
+    errors: typing.Optional[pitstop.types.T_StrAnyMapping] = None
+
+
+class IncrementalValidator:
+    """Validate resolved configuration, revalidating changed fields only.
+
+    Validated documents are assembled from the cached subdocuments of
+    each unit, which are shared with previously validated documents.
+    Their top-level fields may be replaced, but dictionaries and lists
+    beneath them are read-only, and raise :exc:`TypeError` if modified.
+    Copy them, e.g. with :func:`copy.deepcopy`, to modify them.
+
+    Args:
+        schema (:obj:`dict`): A :mod:`cerberus` schema.
+        validator_factory: A callable building a :mod:`cerberus`
+            validator for a schema, e.g.
+            :class:`~.strategies.v1.Validator`.
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        schema: pitstop.types.T_StrAnyMapping,
+        validator_factory: T_ValidatorFactory,
+    ) -> None:
+        self.schema = schema
+        self.validator_factory = validator_factory
+        groups: typing.Dict[str, typing.List[str]] = {
+            field: [field] for field in schema
+        }
+        for field, rules in schema.items():
+            for other in _referenced_fields(rules):
+                group, other_group = groups[field], groups.get(other)
+                if other_group is None or other_group is group:
+                    continue
+                group.extend(other_group)
+                for name in other_group:
+                    groups[name] = group
+        self._units: typing.List[_Unit] = []
+        self._unit_of: typing.Dict[str, int] = {}
+        for field in schema:
+            if field in self._unit_of:
+                continue
+            members = set(groups[field])
+            for name in members:
+                self._unit_of[name] = len(self._units)
+            self._units.append(
+                _Unit(
+                    schema={
+                        name: rules
+                        for name, rules in schema.items()
+                        if name in members
+                    }
+                )
+            )
+
+    @property
+    def units(self) -> typing.List[typing.Tuple[str, ...]]:
+        """Get the top-level fields of each validation unit."""
+        return [tuple(unit.schema) for unit in self._units]
+
+    def invalidate(self) -> None:
+        """Discard cached results, revalidating all units next time."""
+        for unit in self._units:
+            unit.values = unit.document = unit.errors = None
+
+    def validate(
+        self, leaves: pitstop.types.T_StrAnyMapping
+    ) -> pitstop.types.T_StrAnyMapping:
+        """Expand and validate leaf values.
+
+        Args:
+            leaves (:obj:`dict`): A mapping of schema leaf paths to
+                values.
+
+        Returns:
+            dict: The normalized document.
+
+        Raises:
+            ValidationError: If any unit is invalid.
+
+        """
+        grouped: typing.Dict[
+            int, typing.List[typing.Tuple[str, typing.Any]]
+        ] = {}
+        for path, value in leaves.items():
+            index = self._unit_of[pitstop.paths.parse(path)[0]]
+            grouped.setdefault(index, []).append((path, value))
+        document: pitstop.types.T_StrAnyDict = {}
+        errors: pitstop.types.T_StrAnyDict = {}
+        validated = 0
+        for index in sorted(grouped):
+            unit, items = self._units[index], grouped[index]
+            paths = tuple(path for path, _ in items)
+            values = tuple(value for _, value in items)
+            if paths != unit.paths or not _unchanged(unit.values, values):
+                self._validate_unit(unit, items)
+                unit.paths, unit.values = paths, values
+                validated += 1
+            if unit.errors:
+                errors.update(unit.errors)
+            elif unit.document is not None:
+                document.update(unit.document)
+        logger.debug(
+            'validation.incremental', units=len(grouped), validated=validated
+        )
+        if errors:
+            raise pitstop.errors.ValidationError(errors)
+        return document
+
+    def _validate_unit(
+        self, unit: _Unit, items: typing.List[typing.Tuple[str, typing.Any]]
+    ) -> None:
+        """Validate the leaf values of a **unit**, caching the results."""
+        subdocument: pitstop.types.T_StrAnyDict = {}
+        for path, value in items:
+            pitstop.paths.assign(subdocument, path, value)
+        if unit.validator is None:
+            unit.validator = self.validator_factory(unit.schema)
+        validator = unit.validator
+        if validator.validate(subdocument):
+            unit.document, unit.errors = _freeze(validator.document), None
+        else:
+            unit.document, unit.errors = None, validator.errors
+
+
+@dataclasses.dataclass
+class ValidatorCache:
+    """A cache of compiled :mod:`cerberus` schemas.
+
+    Building a validator normalizes the schema, and validates it against
+    the rules of the validator class, including custom rules. Schemas are
+    keyed by a digest of their canonical JSON representation and the
+    validator class, so that identical schemas are compiled once, and
+    validators are then built around copies of the compiled schema.
+    Every call returns a new validator with its own schema, so neither
+    validators nor schemas are shared between threads.
+
+    With a **directory**, compiled schemas are also persisted to disk,
+    and shared with other processes. Entries are unpickled, and trusted
+    to be valid, so the directory must only be writable by trusted
+    users. Schemas that can't be represented as JSON, e.g. with callable
+    ``coerce`` rules, are never cached.
+
+    Digests of schemas passed as ``frozen`` are memoized by identity, so
+    that validating against the same schema object again doesn't
+    serialize and hash it again.
+
+    Args:
+        directory (str, optional): The cache directory, or ``None`` to
+            only cache compiled schemas in memory.
+        max_frozen (int, optional): The maximum number of memoized
+            digests of frozen schemas. Defaults to ``256``.
+
+    """
+
+    directory: typing.Optional[str] = None
+    max_frozen: int = 256
+    _schemas: typing.Dict[str, typing.Any] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    _digests: typing.Dict[
+        int, typing.Tuple[typing.Any, typing.Any, typing.Optional[str]]
+    ] = dataclasses.field(
+        default_factory=collections.OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = dataclasses.field(  # type: ignore
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    @staticmethod
+    def digest(
+        validator_class: typing.Type['cerberus.Validator'],
+        schema: pitstop.types.T_StrAnyMapping,
+    ) -> typing.Optional[str]:
+        """Compute the digest of a **schema**, or ``None`` if uncacheable."""
+        import cerberus
+
+        try:
+            canonical = json.dumps(
+                schema, sort_keys=True, separators=(',', ':')
+            )
+        except (TypeError, ValueError):
+            return None
+        parts = (
+            pitstop.__version__,
+            cerberus.__version__,
+            f'{validator_class.__module__}.{validator_class.__qualname__}',
+            canonical,
+        )
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    @property
+    def validators_dir(self) -> typing.Optional[str]:
+        """Get the directory holding compiled schemas, if persisted."""
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, 'validators')
+
+    def _frozen_digest(
+        self,
+        validator_class: typing.Type['cerberus.Validator'],
+        schema: pitstop.types.T_StrAnyMapping,
+    ) -> typing.Optional[str]:
+        """Get the digest of a **schema**, memoized by its identity."""
+        key = id(schema)
+        digests = self._digests
+        with self._lock:
+            entry = digests.get(key)
+            # Entries hold their schema, so its id can't be reused.
+            if (
+                entry is not None
+                and entry[0] is schema
+                and entry[1] is validator_class
+            ):
+                digests.move_to_end(key)  # type: ignore
+                return entry[2]
+        digest = self.digest(validator_class, schema)
+        with self._lock:
+            digests[key] = (schema, validator_class, digest)
+            digests.move_to_end(key)  # type: ignore
+            while len(digests) > self.max_frozen:
+                digests.popitem(last=False)  # type: ignore
+        return digest
+
+    def validator(
+        self,
+        validator_class: typing.Type['cerberus.Validator'],
+        schema: pitstop.types.T_StrAnyMapping,
+        frozen: bool = False,
+    ) -> 'cerberus.Validator':
+        """Build a validator of **validator_class** for **schema**.
+
+        The schema is compiled on first use, or loaded from disk if
+        persisted, and every validator is built around its own copy of
+        the compiled schema.
+
+        Args:
+            validator_class (type): The :mod:`cerberus` validator class.
+            schema (:obj:`dict`): The schema to validate against.
+            frozen (bool, optional): If ``True``, **schema** is never
+                changed in place, and its digest is memoized by identity.
+                Defaults to ``False``.
+
+        """
+        if frozen:
+            digest = self._frozen_digest(validator_class, schema)
+        else:
+            digest = self.digest(validator_class, schema)
+        if digest is None:
+            logger.debug('validators.uncacheable')
+            return validator_class(schema)
+        with self._lock:
+            compiled = self._schemas.get(digest)
+        if compiled is None:
+            expanded = self._load(validator_class, digest)
+            if expanded is None:
+                compiled = validator_class(schema).schema
+                self._store(digest, compiled.schema)
+            else:
+                compiled = validator_class(expanded).schema
+            with self._lock:
+                compiled = self._schemas.setdefault(digest, compiled)
+        # Copy the compiled schema rather than compiling the expanded
+        # schema again, which cerberus would expand and hash again.
+        definition = copy.copy(compiled)
+        definition.schema = _copy_rules(compiled.schema)
+        return validator_class(definition)
+
+    def clear(self) -> None:
+        """Discard compiled schemas held in memory."""
+        with self._lock:
+            self._schemas.clear()
+            self._digests.clear()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.validators_dir, f'{digest}.pickle')
+
+    def _load(
+        self, validator_class: typing.Type['cerberus.Validator'], digest: str
+    ) -> typing.Optional[pitstop.types.T_StrAnyDict]:
+        """Load an expanded schema from disk, or ``None`` if not cached."""
+        if self.validators_dir is None:
+            return None
+        try:
+            with open(self._path(digest), 'rb') as f:
+                entry = pickle.load(f)
+            if entry['digest'] != digest:
+                raise KeyError(digest)
+        except (OSError, EOFError, KeyError, TypeError, pickle.PickleError):
+            logger.debug('validators.miss', digest=digest)
+            return None
+        expanded = entry['schema']
+        try:
+            from cerberus.utils import mapping_hash
+
+            # Mark the schema as valid, so that cerberus doesn't validate
+            # it against the rules of the validator class again.
+            validator_class._valid_schemas.add(
+                (
+                    mapping_hash(expanded),
+                    mapping_hash(validator_class.types_mapping),
+                )
+            )
+        except (AttributeError, ImportError):
+            pass
+        logger.debug('validators.hit', digest=digest)
+        return expanded
+
+    def _store(
+        self, digest: str, expanded: pitstop.types.T_StrAnyDict
+    ) -> None:
+        """Persist an expanded schema to disk, if enabled."""
+        if self.validators_dir is None:
+            return
+        entry = {'digest': digest, 'schema': expanded}
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            pitstop.cache.atomic_write(self._path(digest), data)
+        except (OSError, pickle.PickleError, AttributeError) as e:
+            logger.warn('validators.store.failed', error=e)
+
+
+validator_cache = ValidatorCache()
+"""The process-wide :class:`ValidatorCache`.
+
+Set its ``directory`` to persist compiled schemas to disk.
+
+"""
@@ -0,0 +1,223 @@
+"""Provides hot reloading of backends when their sources change.
+
+File changes are detected with inotify on Linux, falling back to
+polling file metadata elsewhere.
+
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import typing
+
+import structlog
+
+import pitstop.backends.base
+import pitstop.strategies.base
+import pitstop.utils
+
+
+__all__ = ('Watcher',)
+
+logger = structlog.get_logger()
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_EVENT = struct.Struct('iIII')
+
+
+class _Inotify:
+    """A minimal :manpage:`inotify(7)` interface using :mod:`ctypes`."""
+
+    MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+    )
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        )
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs: typing.Dict[int, str] = {}
+
+    def watch(self, directory: str) -> None:
+        """Watch a **directory** for changes to files within it."""
+        if directory in self._dirs.values():
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'Cannot watch {directory}')
+        self._dirs[wd] = directory
+
+    def wait(self, timeout: float) -> typing.Set[str]:
+        """Wait up to **timeout** seconds for changes.
+
+        Returns:
+            set: Paths of changed files.
+
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        paths = set()
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = IN_EVENT.unpack_from(data, offset)
+            offset += IN_EVENT.size
+            end = offset + length
+            name = data[offset:end].rstrip(b'\0')
+            offset = end
+            directory = self._dirs.get(wd)
+            if directory is not None and name:
+                paths.add(os.path.join(directory, os.fsdecode(name)))
+        return paths
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self.fd)
+
+
+class Watcher:
+    """Reload a strategy's backends when their sources change.
+
+    Backends with file sources (see
+    :meth:`~.backends.base.ReloadableObjectBackend.sources`) are only
+    reloaded when the modification time, size or inode of a source file
+    changes. Other reloadable backends are reloaded every **interval**
+    seconds, and report changes themselves. Changed backends are passed
+    to the strategy's ``refresh`` method, which resolves affected keys
+    again and swaps its snapshot.
+
+    Args:
+        strategy (:class:`~.strategies.base.BaseStrategy`): A strategy
+            providing ``refresh``, e.g. a
+            :class:`~.strategies.v1.VersionOneStrategy`.
+        interval (float, optional): Seconds between checks. With
+            inotify, file changes are picked up immediately instead.
+            Defaults to ``1``.
+        use_inotify (bool, optional): Whether to use inotify. Defaults
+            to using inotify where available.
+
+    Raises:
+        TypeError: If **strategy** is an :mod:`asyncio` strategy, whose
+            ``refresh`` coroutine can't be awaited by the watcher.
+
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        strategy: pitstop.strategies.base.BaseStrategy,
+        interval: float = 1,
+        use_inotify: typing.Optional[bool] = None,
+    ) -> None:
+        if isinstance(strategy, pitstop.strategies.base.AsyncBaseStrategy):
+            raise TypeError('Watching requires a synchronous strategy')
+        self.strategy = strategy
+        self.interval = interval
+        self._signatures: typing.Dict[
+            str, pitstop.utils.T_StatSignature
+        ] = {}
+        self._inotify: typing.Optional[_Inotify] = None
+        if use_inotify is not False:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError, TypeError):
+                if use_inotify:
+                    raise
+                logger.debug('watch.inotify.unavailable')
+        self._stopped = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        for backend in self._reloadable():
+            for path in backend.sources():
+                path = os.path.abspath(path)
+                self._signatures[path] = pitstop.utils.stat_signature(path)
+                if self._inotify is not None:
+                    self._inotify.watch(os.path.dirname(path))
+
+    def _reloadable(
+        self
+    ) -> typing.List[pitstop.backends.base.ReloadableObjectBackend]:
+        reloadable = pitstop.backends.base.ReloadableObjectBackend
+        return [
+            backend
+            for backend in self.strategy.backends
+            if isinstance(backend, reloadable)
+        ]
+
+    def check(self) -> typing.Set[str]:
+        """Reload changed backends, and refresh the strategy.
+
+        Returns:
+            set: Key paths whose values changed.
+
+        """
+        changed = []
+        for backend in self._reloadable():
+            sources = [os.path.abspath(path) for path in backend.sources()]
+            if sources:
+                modified = False
+                for path in sources:
+                    signature = pitstop.utils.stat_signature(path)
+                    if signature != self._signatures.get(path):
+                        self._signatures[path] = signature
+                        modified = True
+                if not modified:
+                    continue
+            if backend.reload():
+                changed.append(backend)
+        if not changed:
+            return set()
+        logger.info('watch.changed', backends=[b.name for b in changed])
+        return self.strategy.refresh(changed)  # type: ignore
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if self._inotify is not None:
+                self._inotify.wait(self.interval)
+            else:
+                self._stopped.wait(self.interval)
+            if self._stopped.is_set():
+                break
+            try:
+                self.check()
+            except Exception:
+                logger.exception('watch.check.failed')
+
+    def start(self) -> 'Watcher':
+        """Start watching in a background thread."""
+        self._thread = threading.Thread(
+            target=self._run, name='pitstop-watch', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching, waiting for the background thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
@@ -41,3 +41,36 @@ def test_get_nonexistent(
         del os.environ['NONEXISTENT']
     with pytest.raises(KeyError):
         backend.get('NONEXISTENT')
+
+
+def test_get_many(
+    backend: pitstop.backends.env.EnvironmentBackend, monkeypatch
+) -> None:
+    """Read many environment variables, omitting missing ones."""
+    monkeypatch.delenv('NONEXISTENT', raising=False)
+    monkeypatch.setenv('PITSTOP_TEST_FOO', 'bar')
+    assert backend.get_many(['PITSTOP.TEST_FOO', 'NONEXISTENT']) == {
+        'PITSTOP.TEST_FOO': 'bar'
+    }
+
+
+def test_snapshot(monkeypatch) -> None:
+    """Read keys from, and reload, an environment snapshot."""
+    monkeypatch.setenv('PITSTOP_DB_HOST', 'localhost')
+    monkeypatch.setenv('PITSTOP_db_port', '5432')
+    monkeypatch.setenv('OTHER_DB_USER', 'nobody')
+    options = pitstop.backends.env.EnvironmentBackendOptions(
+        prefix='PITSTOP_', snapshot=True
+    )
+    backend = pitstop.backends.env.EnvironmentBackend(  # type: ignore
+        priority=1, name='env', options=options
+    )
+    backend.connect()
+    monkeypatch.setenv('PITSTOP_DB_HOST', 'example.com')
+    assert backend.get('DB.HOST') == 'localhost'
+    assert backend.get('db.host') == 'localhost'
+    assert backend.get_many(['db.port', 'db.user']) == {'db.port': '5432'}
+    assert not backend.get_many(['DB.USER'])
+    assert backend.reload()
+    assert backend.get('DB.HOST') == 'example.com'
+    assert not backend.reload()
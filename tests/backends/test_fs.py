@@ -1,8 +1,48 @@
 """Filesystem backend unit tests."""
+import hashlib
+import mmap
+import os
+
 import pytest
 
 import pitstop.backends.fs
 import pitstop.encodings.json
+import pitstop.encodings.toml
+import pitstop.errors
+
+
+ENCODINGS = {
+    '.json': pitstop.encodings.json.JSONEncoding,
+    '.toml': pitstop.encodings.toml.TOMLEncoding,
+}
+
+
+def fs_backend(
+    tmpdir, contents, filename='config.toml', decode=True, **options
+):
+    """Create a connected backend reading **contents** from a file.
+
+    The file is decoded with the JSON or TOML encoding, by its extension,
+    unless **decode** is ``False``. **options** are passed to
+    :class:`~pitstop.backends.fs.FilesystemBackendOptions`.
+
+    """
+    p = tmpdir.join(filename)
+    if isinstance(contents, bytes):
+        p.write_binary(contents)
+    else:
+        p.write(contents)
+    encoding = ENCODINGS[os.path.splitext(filename)[1]].with_options()
+    options = pitstop.backends.fs.FilesystemBackendOptions(
+        path=str(p), **options
+    )
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=1, name='fs', encoding=encoding()
+    )
+    backend.connect()
+    if decode:
+        backend.decode()
+    return backend
 
 
 @pytest.fixture
@@ -21,3 +61,101 @@ def test_connect(backend):
     """Connect the filesystem backend (read a file)."""
     backend.connect()
     assert backend.fp is not None
+
+
+def test_requires_decoded(tmpdir):
+    """Refuse reads until the configuration is decoded."""
+    backend = fs_backend(
+        tmpdir, '{"foo": "bar"}', filename='config.json', decode=False
+    )
+    with pytest.raises(pitstop.errors.NotDecodedError):
+        backend.get('foo')
+    with pytest.raises(pitstop.errors.NotDecodedError):
+        backend.get_many(['foo'])
+    backend.decode()
+    assert backend.get('foo') == 'bar'
+    assert 'get' not in vars(backend)
+    backend.obj = None
+    with pytest.raises(pitstop.errors.NotDecodedError):
+        backend.get('foo')
+
+
+def test_get_many(tmpdir):
+    """Read many keys from a decoded file, omitting missing ones."""
+    backend = fs_backend(tmpdir, 'foo = "bar"')
+    assert backend.get_many(['foo', 'nonexistent']) == {'foo': 'bar'}
+
+
+def test_index(tmpdir):
+    """Read nested keys through the key index, and rebuild on reload."""
+    backend = fs_backend(tmpdir, '[db]\nhost = "localhost"\nports = [1, 2]\n')
+    assert backend.get('db.host') == 'localhost'
+    assert backend.get('db') == {'host': 'localhost', 'ports': [1, 2]}
+    assert backend.get('db.ports.1') == 2
+    with pytest.raises(KeyError):
+        backend.get('db.user')
+    index = backend.index
+    tmpdir.join('config.toml').write('[db]\nhost = "example.com"\n')
+    assert backend.reload()
+    assert backend.index is not index
+    assert backend.get('db.host') == 'example.com'
+
+
+def test_reload_unchanged(tmpdir, monkeypatch):
+    """Skip reading unchanged files, and decoding identical contents."""
+    backend = fs_backend(tmpdir, 'foo = "bar"')
+    assert backend.checksum == hashlib.sha256(b'foo = "bar"').hexdigest()
+    calls = []
+
+    def spy(name):
+        method = getattr(pitstop.backends.fs.FilesystemBackend, name)
+
+        def wrapper(self):
+            calls.append(name)
+            return method(self)
+
+        return wrapper
+
+    for name in ('connect', 'decode'):
+        monkeypatch.setattr(
+            pitstop.backends.fs.FilesystemBackend, name, spy(name)
+        )
+    assert not backend.reload()
+    assert calls == []
+    path = backend.options.path
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert not backend.reload()
+    assert calls == ['connect']
+
+
+@pytest.mark.parametrize('mmap_threshold', [None, 1])
+def test_decode_buffer(tmpdir, mmap_threshold):
+    """Decode files from buffers, optionally releasing the contents."""
+    backend = fs_backend(
+        tmpdir,
+        'foo = "bär"',
+        decode=False,
+        mmap_threshold=mmap_threshold,
+        retain_source=False,
+    )
+    if mmap_threshold is None:
+        assert backend.s == 'foo = "bär"'.encode()
+    else:
+        assert isinstance(backend.s, mmap.mmap)
+    backend.decode()
+    assert backend.s == b''
+    assert backend.get('foo') == 'bär'
+    tmpdir.join('config.toml').write('foo = "baz"')
+    assert backend.reload()
+    assert backend.s == b''
+    assert backend.get('foo') == 'baz'
+    backend.cleanup()
+
+
+def test_file_encoding(tmpdir):
+    """Decode files in other character encodings to text first."""
+    backend = fs_backend(
+        tmpdir, 'foo = "bär"'.encode('latin-1'), file_encoding='latin-1'
+    )
+    assert backend.get('foo') == 'bär'
@@ -0,0 +1,236 @@
+"""Vault backend unit tests."""
+import asyncio
+import threading
+import types
+
+import hvac.exceptions
+import pytest
+
+import pitstop.backends.vault
+
+
+SECRETS = {
+    'db': {'host': 'localhost', 'password': 'hunter2'},
+    'api': {'token': 'secret'},
+}
+LEASES = {'api': 5}
+
+
+class FakeKV:
+    """A fake KV v2 secrets engine, counting reads."""
+
+    def __init__(self):  # noqa: D107
+        self.reads = []
+
+    def read_secret_version(self, path, mount_point='secret'):
+        """Read a secret from :data:`SECRETS`."""
+        self.reads.append(path)
+        try:
+            return {
+                'data': {'data': SECRETS[path], 'metadata': {}},
+                'lease_duration': LEASES.get(path, 0),
+            }
+        except KeyError:
+            raise hvac.exceptions.InvalidPath()
+
+
+def vault_backend(**options) -> pitstop.backends.vault.VaultBackend:
+    """Create a Vault backend with a fake client."""
+    backend = pitstop.backends.vault.VaultBackend(  # type: ignore
+        priority=1,
+        name='vault',
+        options=pitstop.backends.vault.VaultBackendOptions(**options),
+    )
+    backend.connect()
+    kv = types.SimpleNamespace(v2=FakeKV())
+    backend.client = types.SimpleNamespace(
+        secrets=types.SimpleNamespace(kv=kv)
+    )
+    return backend
+
+
+@pytest.fixture
+def backend() -> pitstop.backends.vault.VaultBackend:
+    """Provide a Vault backend fixture with a fake client."""
+    return vault_backend()
+
+
+class Clock:
+    """A fake monotonic clock."""
+
+    def __init__(self):  # noqa: D107
+        self.now = 0.0
+
+    def __call__(self):  # noqa: D102
+        return self.now
+
+
+def test_get(backend: pitstop.backends.vault.VaultBackend) -> None:
+    """Read secrets, defaults and missing secrets."""
+    assert backend.get('db.host') == 'localhost'
+    assert backend.get('db.nonexistent', default='foo') == 'foo'
+    with pytest.raises(KeyError):
+        backend.get('db.nonexistent')
+    with pytest.raises(KeyError):
+        backend.get('nonexistent.key')
+
+
+def test_get_many(backend: pitstop.backends.vault.VaultBackend) -> None:
+    """Ensure sibling keys are served from a single secret read."""
+    values = backend.get_many(
+        ['db.host', 'db.password', 'db.nonexistent', 'api.token', 'x.y']
+    )
+    assert values == {
+        'db.host': 'localhost',
+        'db.password': 'hunter2',
+        'api.token': 'secret',
+    }
+    assert sorted(backend.client.secrets.kv.v2.reads) == ['api', 'db', 'x']
+
+
+def test_resolving(backend: pitstop.backends.vault.VaultBackend) -> None:
+    """Ensure secrets are read once per resolution pass."""
+    reads = backend.client.secrets.kv.v2.reads
+    with backend.resolving():
+        backend.get('db.host')
+        backend.get('db.password')
+        backend.get_many(['db.host', 'api.token'])
+    assert reads == ['db', 'api']
+    backend.get('db.host')
+    assert reads == ['db', 'api', 'db']
+
+
+def test_resolving_threads(
+    backend: pitstop.backends.vault.VaultBackend,
+) -> None:
+    """Ensure each thread resolves with its own memo."""
+    reads = backend.client.secrets.kv.v2.reads
+    entered, exited = threading.Event(), threading.Event()
+
+    def other():
+        with backend.resolving():
+            backend.get('db.host')
+            entered.set()
+            exited.wait()
+
+    thread = threading.Thread(target=other)
+    with backend.resolving() as memo:
+        thread.start()
+        entered.wait()
+        backend.get('db.host')
+        exited.set()
+        thread.join()
+        backend.get('db.password')
+        assert backend.memo is memo
+    assert reads == ['db', 'db']
+    assert backend.memo is None
+
+
+def test_cache(monkeypatch) -> None:
+    """Ensure secrets and missing secrets are cached until expiry."""
+    clock = Clock()
+    monkeypatch.setattr(pitstop.backends.vault.time, 'monotonic', clock)
+    backend = vault_backend(cache_ttl=60, cache_negative_ttl=10)
+    reads = backend.client.secrets.kv.v2.reads
+    for _ in range(3):
+        backend.get('db.host')
+        backend.get_many(['x.y'])
+    assert reads == ['db', 'x']
+    clock.now = 30
+    backend.get('db.host')
+    backend.get_many(['x.y'])
+    assert reads == ['db', 'x', 'x']
+    clock.now = 61
+    backend.get('db.host')
+    assert reads == ['db', 'x', 'x', 'db']
+    assert backend.cache_stats == {
+        'hits': 5,
+        'stale_hits': 0,
+        'misses': 4,
+        'size': 2,
+    }
+
+
+def test_cache_leases(monkeypatch) -> None:
+    """Ensure secrets aren't cached past their lease duration."""
+    clock = Clock()
+    monkeypatch.setattr(pitstop.backends.vault.time, 'monotonic', clock)
+    backend = vault_backend(cache_ttl=60)
+    reads = backend.client.secrets.kv.v2.reads
+    backend.get('api.token')
+    clock.now = 6
+    backend.get('api.token')
+    assert reads == ['api', 'api']
+    backend = vault_backend(cache_ttl=60, cache_stale_ttl=30)
+    reads = backend.client.secrets.kv.v2.reads
+    backend.get('api.token')
+    clock.now = 12
+    backend.get('api.token')
+    assert reads == ['api', 'api']
+    assert backend.cache.stats()['stale_hits'] == 0
+    backend = vault_backend(cache_ttl=60, cache_respect_leases=False)
+    reads = backend.client.secrets.kv.v2.reads
+    backend.get('api.token')
+    backend.get('api.token')
+    assert reads == ['api']
+
+
+def test_cache_lru() -> None:
+    """Ensure least recently used secrets are evicted."""
+    backend = vault_backend(cache_ttl=60, cache_max_size=1)
+    reads = backend.client.secrets.kv.v2.reads
+    backend.get('db.host')
+    backend.get('api.token')
+    backend.get('db.host')
+    assert reads == ['db', 'api', 'db']
+
+
+def test_cache_stale_while_revalidate(monkeypatch) -> None:
+    """Ensure stale secrets are served while refreshing."""
+    clock = Clock()
+    monkeypatch.setattr(pitstop.backends.vault.time, 'monotonic', clock)
+    threads = []
+    monkeypatch.setattr(
+        pitstop.backends.vault.threading,
+        'Thread',
+        lambda target, args, daemon: threads.append((target, args))
+        or types.SimpleNamespace(start=lambda: None),
+    )
+    backend = vault_backend(cache_ttl=60, cache_stale_ttl=30)
+    reads = backend.client.secrets.kv.v2.reads
+    backend.get('db.host')
+    clock.now = 70
+    assert backend.get('db.host') == 'localhost'
+    assert backend.get('db.host') == 'localhost'
+    assert reads == ['db'] and len(threads) == 1
+    target, args = threads[0]
+    target(*args)
+    assert reads == ['db', 'db']
+    assert backend.get('db.host') == 'localhost'
+    assert backend.cache.stats()['stale_hits'] == 2
+
+
+def test_async_get_many() -> None:
+    """Ensure concurrent async reads of one secret share a request."""
+    backend = pitstop.backends.vault.AsyncVaultBackend.with_options()(
+        priority=1, name='vault'
+    )
+
+    async def main():
+        await backend.connect()
+        backend.backend.client = vault_backend().client
+        values = await asyncio.gather(
+            backend.get('db.host'),
+            backend.get_many(['db.password', 'api.token', 'x.y']),
+            backend.get('db.nonexistent', default='foo'),
+        )
+        with pytest.raises(KeyError):
+            await backend.get('db.nonexistent')
+        return values
+
+    assert asyncio.run(main()) == [
+        'localhost',
+        {'db.password': 'hunter2', 'api.token': 'secret'},
+        'foo',
+    ]
+    assert backend.backend.client.secrets.kv.v2.reads.count('db') == 2
@@ -0,0 +1 @@
+"""Encoding unit tests."""
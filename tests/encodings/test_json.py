@@ -0,0 +1,97 @@
+"""JSON encoding unit tests."""
+import mmap
+
+import pytest
+
+import pitstop.encodings.json
+import pitstop.entrypoints
+
+
+DOCUMENT = {'foo': {'bar': [1, 2.5, 'bär', None, True]}}
+ENCODED = '{"foo": {"bar": [1, 2.5, "b\\u00e4r", null, true]}}'
+
+
+@pytest.mark.parametrize(
+    's', [ENCODED, ENCODED.encode(), bytearray(ENCODED.encode())]
+)
+def test_decode(s) -> None:
+    """Decode strings and buffers with the standard library."""
+    encoding = pitstop.encodings.json.JSONEncoding.with_options()()
+    assert encoding.decode(s) == DOCUMENT
+
+
+@pytest.mark.parametrize('parsers', [('orjson',), ()])
+def test_fast_decode(tmpdir, parsers) -> None:
+    """Decode strings and buffers, with or without an accelerated parser."""
+    if parsers:
+        pytest.importorskip(parsers[0])
+    encoding = pitstop.encodings.json.FastJSONEncoding.with_options(
+        parsers=parsers
+    )()
+    assert encoding.parser.name == (parsers[0] if parsers else 'json')
+    assert encoding.decode(ENCODED) == DOCUMENT
+    assert encoding.decode(ENCODED.encode()) == DOCUMENT
+    assert encoding.decode(memoryview(ENCODED.encode())) == DOCUMENT
+    p = tmpdir.join('config.json')
+    p.write(ENCODED)
+    with open(str(p), 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert encoding.decode(m) == DOCUMENT
+    assert encoding.decode(encoding.encode(DOCUMENT)) == DOCUMENT
+
+
+def test_fast_entrypoint() -> None:
+    """Load the fast JSON encoding by name."""
+    encoding = pitstop.entrypoints.load('pitstop.encodings', 'json-fast')
+    assert encoding is pitstop.encodings.json.FastJSONEncoding
+
+
+@pytest.mark.parametrize('parsers', [('orjson',), ('ujson',), ()])
+def test_dumps(monkeypatch, parsers) -> None:
+    """Encode with any indentation, falling back to the standard library."""
+    if parsers:
+        pytest.importorskip(parsers[0])
+    parser = pitstop.encodings.json.json_parser(parsers)
+    monkeypatch.setattr(
+        pitstop.encodings.json, 'json_parser', lambda: parser
+    )
+    dumps = pitstop.encodings.json.dumps
+    assert dumps({'a': 1}, indent=4) == '{\n    "a": 1\n}'
+    assert dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+    assert dumps({'a': 'x', 'b': [1, 2]}) == '{"a":"x","b":[1,2]}'
+    assert dumps({'a': 2 ** 70}) == '{"a":1180591620717411303424}'
+    assert dumps({1: 'x'}) == '{"1":"x"}'
+
+
+@pytest.mark.parametrize(
+    'encoding_cls',
+    [
+        pitstop.encodings.json.JSONEncoding,
+        pitstop.encodings.json.FastJSONEncoding,
+    ],
+)
+def test_decode_selected(encoding_cls) -> None:
+    """Decode only subtrees containing the given key paths."""
+    s = (
+        '{"a": {"b": 1, "c": [1, {"x": "}\\"{"}], "d": {"e": "f"}},'
+        ' "skip": {"k": ["}", {"z": null}]}, "n": -1.5e3}'
+    )
+    encoding = encoding_cls.with_options()()
+    assert encoding.decode_selected(s.encode(), ['a.b', 'a.c', 'n']) == {
+        'a': {'b': 1, 'c': [1, {'x': '}"{'}]},
+        'n': -1500.0,
+    }
+    assert encoding.decode_selected(s, ['a.d', 'a.d.e', 'x.y']) == {
+        'a': {'d': {'e': 'f'}}
+    }
+    buffer = memoryview('{"\\u00e9": {"\u00e9": 1}, "b": [2]}'.encode())
+    assert encoding.decode_selected(buffer, ['\u00e9', 'b']) == {
+        '\u00e9': {'\u00e9': 1},
+        'b': [2],
+    }
+    with pytest.raises(ValueError):
+        encoding.decode_selected('{"a": 1, "b": [}', ['a'])
+    with pytest.raises(ValueError, match='line 2 column 6'):
+        encoding.decode_selected(b'{"a": 1,\n "b" 2}', ['a'])
+    with pytest.raises(ValueError):
+        encoding.decode_selected('{"a": 1} {}', ['a'])
@@ -0,0 +1 @@
+"""Strategy unit tests."""
@@ -0,0 +1,398 @@
+"""Version 1 strategy unit tests."""
+import asyncio
+import dataclasses
+import time
+import typing
+
+import pytest
+
+import pitstop.backends.base
+import pitstop.backends.fs
+import pitstop.encodings.json
+import pitstop.encodings.toml
+import pitstop.errors
+import pitstop.strategies.v1
+
+
+SCHEMA = {
+    'name': {'type': 'string'},
+    'level': {'type': 'integer', 'default': 42},
+    'db': {
+        'type': 'dict',
+        'schema': {
+            'host': {'type': 'string', 'default': 'localhost'},
+            'port': {'type': 'integer'},
+        },
+    },
+}
+
+
+def fs_backend(tmpdir, name, priority, contents):
+    """Create a connected and decoded TOML filesystem backend."""
+    p = tmpdir.join(f'{name}.toml')
+    p.write(contents)
+    encoding = pitstop.encodings.toml.TOMLEncoding.with_options()
+    options = pitstop.backends.fs.FilesystemBackendOptions(path=str(p))
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=priority, name=name, encoding=encoding()
+    )
+    backend.connect()
+    backend.decode()
+    return backend
+
+
+@pytest.fixture
+def strategy(tmpdir) -> pitstop.strategies.v1.VersionOneStrategy:
+    """Provide a v1 strategy fixture with two filesystem backends."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    strategy.backends.add(
+        fs_backend(tmpdir, 'first', 1, 'name = "first"\n[db]\nport = 1\n')
+    )
+    strategy.backends.add(
+        fs_backend(tmpdir, 'second', 2, 'name = "second"\n[db]\nport = 2\n')
+    )
+    return strategy
+
+
+def test_resolve(strategy: pitstop.strategies.v1.VersionOneStrategy) -> None:
+    """Resolve a document from backends and schema defaults."""
+    assert strategy.resolve() == {
+        'name': 'first',
+        'level': 42,
+        'db': {'host': 'localhost', 'port': 1},
+    }
+
+
+def test_resolve_full_validation(tmpdir) -> None:
+    """Resolve identical documents with incremental and full validation."""
+    documents = []
+    for incremental in (True, False):
+        strategy = pitstop.strategies.v1.VersionOneStrategy.with_options(
+            incremental_validation=incremental
+        )(schema=SCHEMA)
+        strategy.backends.add(
+            fs_backend(tmpdir, 'first', 1, 'name = "first"\n[db]\nport = 1\n')
+        )
+        documents.append(strategy.resolve())
+        strategy.backends[0].obj = {'name': 1}
+        with pytest.raises(pitstop.errors.ValidationError):
+            strategy.resolve()
+    assert documents[0] == documents[1]
+
+
+def test_get(strategy: pitstop.strategies.v1.VersionOneStrategy) -> None:
+    """Read keys from backends, schema defaults and given defaults."""
+    assert strategy.get('db.port') == 1
+    assert strategy.get('level') == 42
+    assert strategy.get('level', default=24) == 24
+    assert strategy.get('unknown', default='foo') == 'foo'
+    with pytest.raises(KeyError):
+        strategy.get('unknown')
+
+
+def test_backend_priority_overrides(
+    strategy: pitstop.strategies.v1.VersionOneStrategy
+) -> None:
+    """Ensure priority overrides reorder backends for a key."""
+    strategy.bpo_map = {'db': {'port': ['second']}}
+    assert strategy.get('db.port') == 2
+    assert strategy.get('name') == 'first'
+    assert strategy.resolve()['db']['port'] == 2
+
+
+def test_plan_recompiled(
+    strategy: pitstop.strategies.v1.VersionOneStrategy, tmpdir
+) -> None:
+    """Ensure the plan is reused, and rebuilt when backends change."""
+    plan = strategy.plan
+    assert strategy.plan is plan
+    assert [e.path for e in plan.entries] == [
+        'name',
+        'level',
+        'db.host',
+        'db.port',
+    ]
+    strategy.backends.add(fs_backend(tmpdir, 'zeroth', 0, 'name = "zero"'))
+    assert strategy.plan is not plan
+    assert strategy.get('name') == 'zero'
+    strategy.schema = {'name': {'type': 'string'}}
+    assert [e.path for e in strategy.plan.entries] == ['name']
+
+
+def test_resolve_batched(
+    strategy: pitstop.strategies.v1.VersionOneStrategy, monkeypatch
+) -> None:
+    """Ensure each backend is read once, with only unresolved keys."""
+    calls = []
+    get_many = pitstop.backends.fs.FilesystemBackend.get_many
+
+    def spy(self, paths):
+        calls.append((self.name, list(paths)))
+        return get_many(self, paths)
+
+    monkeypatch.setattr(pitstop.backends.fs.FilesystemBackend, 'get_many', spy)
+    strategy.resolve()
+    assert calls == [
+        ('first', ['name', 'level', 'db.host', 'db.port']),
+        ('second', ['level', 'db.host']),
+    ]
+
+
+def test_resolve_partial(
+    strategy: pitstop.strategies.v1.VersionOneStrategy, monkeypatch
+) -> None:
+    """Resolve selected keys, reading and validating only those."""
+    calls = []
+    get_many = pitstop.backends.fs.FilesystemBackend.get_many
+
+    def spy(self, paths):
+        calls.append((self.name, list(paths)))
+        return get_many(self, paths)
+
+    monkeypatch.setattr(pitstop.backends.fs.FilesystemBackend, 'get_many', spy)
+    assert strategy.resolve(prefix='db') == {
+        'db': {'host': 'localhost', 'port': 1}
+    }
+    assert calls == [
+        ('first', ['db.host', 'db.port']),
+        ('second', ['db.host']),
+    ]
+    assert strategy.resolve(paths=['db.port', 'name']) == {
+        'name': 'first',
+        'db': {'port': 1},
+    }
+    assert strategy.snapshot is None
+    assert strategy.select(paths=['db'])[0] is strategy.select(prefix='db')[0]
+    strategy.plan.max_selections = 2
+    strategy.select(paths=['name'])
+    assert list(strategy.plan.selections) == [('db',), ('name',)]
+    strategy.select(paths=['db'])
+    strategy.select(paths=['db.host'])
+    assert list(strategy.plan.selections) == [('db',), ('db.host',)]
+    with pytest.raises(KeyError):
+        strategy.resolve(prefix='unknown')
+    strategy.backends[0].obj = {'name': 1, 'db': {'port': 1}}
+    assert strategy.resolve(prefix='db')['db']['port'] == 1
+    with pytest.raises(pitstop.errors.ValidationError):
+        strategy.resolve(paths=['name'])
+
+
+def test_resolve_partial_dependencies() -> None:
+    """Validate selected keys with the keys their rules refer to."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema={
+            'name': {'type': 'string'},
+            'level': {'type': 'integer', 'nullable': True},
+            'cache': {
+                'type': 'dict',
+                'schema': {
+                    'url': {'type': 'string', 'dependencies': '^name'},
+                    'ttl': {'type': 'integer', 'dependencies': 'url'},
+                    'size': {
+                        'type': 'integer',
+                        'nullable': True,
+                        'excludes': '^level',
+                    },
+                },
+            },
+        }
+    )
+    backend = pitstop.backends.base.DictBackend(
+        priority=1,
+        name='dict',
+        obj={'name': 'pitstop', 'cache.url': 'redis://', 'cache.ttl': 1},
+    )
+    strategy.backends.add(backend)
+    entries, _, keep = strategy.select(paths=['cache.ttl'])
+    assert [e.path for e in entries] == ['name', 'cache.url', 'cache.ttl']
+    assert keep == ('cache.ttl',)
+    assert strategy.select(paths=['name'])[2] is None
+    assert strategy.resolve(prefix='cache') == {
+        'cache': {'url': 'redis://', 'ttl': 1, 'size': None}
+    }
+    assert strategy.resolve(paths=['cache.ttl']) == {'cache': {'ttl': 1}}
+    del backend.obj['name']
+    with pytest.raises(pitstop.errors.ValidationError):
+        strategy.resolve(paths=['cache.ttl'])
+
+
+def test_resolve_missing(tmpdir) -> None:
+    """Ensure keys without values or defaults can be required."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema={
+            'name': {'type': 'string'},
+            'extra': {'type': 'string', 'nullable': True},
+        }
+    )
+    strategy.backends.add(fs_backend(tmpdir, 'first', 1, 'name = "first"'))
+    assert strategy.resolve()['extra'] is None
+    with pytest.raises(KeyError):
+        strategy.resolve(allow_missing=False)
+
+
+@dataclasses.dataclass
+class SlowBackend(pitstop.backends.base.DictBackend):
+    """A dictionary backend that is slow, or fails, to connect."""
+
+    delay: float = 0
+    error: typing.Optional[Exception] = None
+
+    def connect(self) -> None:
+        """Sleep for :attr:`delay` seconds and raise :attr:`error`."""
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+
+def test_connect_all_concurrent(tmpdir) -> None:
+    """Connect and decode backends concurrently."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    backend = fs_backend(tmpdir, 'first', 1, 'name = "first"')
+    backend.cleanup()
+    backend.obj = None
+    strategy.backends.add(backend)
+    strategy.backends.add(
+        SlowBackend(priority=2, name='slow', obj={}, delay=0.1)
+    )
+    strategy.connect_all(concurrent=True)
+    assert strategy.get('name') == 'first'
+
+
+def test_connect_all_selective(tmpdir) -> None:
+    """Decode only keys in the schema from JSON backends."""
+    p = tmpdir.join('config.json')
+    p.write('{"name": "json", "db": {"port": 1, "user": "x"}, "extra": [1]}')
+    encoding = pitstop.encodings.json.JSONEncoding.with_options()
+    options = pitstop.backends.fs.FilesystemBackendOptions(path=str(p))
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=1, name='json', encoding=encoding()
+    )
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    strategy.backends.add(backend)
+    strategy.connect_all(selective=True)
+    assert backend.obj == {'name': 'json', 'db': {'port': 1}}
+    assert strategy.resolve() == {
+        'name': 'json',
+        'level': 42,
+        'db': {'host': 'localhost', 'port': 1},
+    }
+    p.write('{"name": "reloaded", "extra": [2]}')
+    assert backend.reload()
+    assert backend.obj == {'name': 'reloaded'}
+
+
+def test_connect_all_errors() -> None:
+    """Ensure errors and timeouts from all backends are raised together."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    strategy.backends.add(
+        SlowBackend(priority=1, name='broken', obj={}, error=OSError())
+    )
+    strategy.backends.add(
+        SlowBackend(priority=2, name='slow', obj={}, delay=1)
+    )
+    strategy.backends.add(SlowBackend(priority=3, name='ok', obj={}))
+    with pytest.raises(pitstop.errors.BackendErrors) as e:
+        strategy.connect_all(concurrent=True, timeout=0.2)
+    assert sorted(e.value.errors) == ['broken', 'slow']
+    assert isinstance(e.value.errors['broken'], OSError)
+
+
+def test_connect_all_timeout_per_backend() -> None:
+    """Time out each backend from when it starts connecting."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    for priority, delay in enumerate((0.15, 0.15, 1, 0)):
+        strategy.backends.add(
+            SlowBackend(priority=priority, name='slow', obj={}, delay=delay)
+        )
+    start = time.monotonic()
+    with pytest.raises(pitstop.errors.BackendErrors) as e:
+        strategy.connect_all(concurrent=True, max_workers=1, timeout=0.3)
+    assert time.monotonic() - start < 0.9
+    assert sorted(e.value.errors) == ['slow[2]', 'slow[3]']
+    assert 'did not start' in str(e.value.errors['slow[3]'])
+
+
+def test_connect_all_timeout_released() -> None:
+    """Run queued backends on threads timed out backends gave back."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    # a times out at 0.3s and finishes at 0.4s, when d takes its thread.
+    # c times out at 0.5s, while e waits for d rather than for a.
+    for priority, (name, delay) in enumerate(
+        (('a', 0.4), ('b', 0.2), ('c', 2), ('d', 0.3), ('e', 0))
+    ):
+        strategy.backends.add(
+            SlowBackend(priority=priority, name=name, obj={}, delay=delay)
+        )
+    with pytest.raises(pitstop.errors.BackendErrors) as e:
+        strategy.connect_all(concurrent=True, max_workers=2, timeout=0.3)
+    assert sorted(e.value.errors) == ['a', 'c']
+
+
+def test_async_resolve(tmpdir) -> None:
+    """Connect, resolve and read keys with the asyncio strategy."""
+    strategy = pitstop.strategies.v1.AsyncVersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    first = fs_backend(tmpdir, 'first', 1, 'name = "first"\n[db]\nport = 1')
+    first.cleanup()
+    first.obj = None
+    strategy.backends.add(first)
+    strategy.backends.add(
+        pitstop.backends.base.DictBackend(
+            priority=2, name='dict', obj={'db.host': 'example.com'}
+        )
+    )
+
+    async def main():
+        await strategy.connect_all()
+        assert await strategy.get('name') == 'first'
+        assert await strategy.get('level') == 42
+        with pytest.raises(KeyError):
+            await strategy.get('unknown')
+        assert await strategy.resolve(prefix='db') == {
+            'db': {'host': 'example.com', 'port': 1}
+        }
+        assert strategy.snapshot is None
+        return await strategy.resolve()
+
+    assert asyncio.run(main()) == {
+        'name': 'first',
+        'level': 42,
+        'db': {'host': 'example.com', 'port': 1},
+    }
+
+
+def test_async_refresh() -> None:
+    """Refresh the asyncio strategy after a backend changed."""
+    strategy = pitstop.strategies.v1.AsyncVersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    backend = pitstop.backends.base.DictBackend(
+        priority=1, name='dict', obj={'name': 'first', 'db.port': 1}
+    )
+    strategy.backends.add(backend)
+    calls = []
+    strategy.on_change(lambda changed, snapshot: calls.append(changed))
+    leaves = {'name', 'level', 'db.host', 'db.port'}
+
+    async def main():
+        await strategy.connect_all()
+        assert await strategy.refresh([backend]) == leaves
+        backend.obj = {'name': 'second', 'db.port': 1}
+        assert await strategy.refresh([backend]) == {'name'}
+
+    asyncio.run(main())
+    assert strategy.snapshot['name'] == 'second'
+    assert calls == [leaves, {'name'}]
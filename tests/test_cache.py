@@ -0,0 +1,138 @@
+"""On-disk cache unit tests."""
+import os
+
+import pytest
+
+import pitstop.backends.fs
+import pitstop.cache
+import pitstop.encodings.toml
+
+
+@pytest.fixture
+def cache(tmpdir) -> pitstop.cache.SnapshotCache:
+    """Provide a snapshot cache fixture."""
+    return pitstop.cache.SnapshotCache(directory=str(tmpdir.join('cache')))
+
+
+def test_snapshot_key(cache, tmpdir, monkeypatch) -> None:
+    """Ensure snapshot keys change with their sources."""
+    metaconfig = tmpdir.join('pitstop.toml')
+    metaconfig.write('')
+    data = tmpdir.join('config.toml')
+    data.write('foo = 1')
+    config = {
+        'backends': [
+            {'driver': 'fs', 'options': {'path': str(data)}},
+            {'driver': 'env', 'options': {'prefix': 'PITSTOP_CACHE_TEST_'}},
+        ],
+        'schema': {'foo': {'type': 'string'}},
+    }
+    key, max_age = cache.key(str(metaconfig), config)
+    assert max_age is None
+    assert cache.key(str(metaconfig), config) == (key, None)
+    assert cache.key(str(metaconfig), config, include=['foo'])[0] != key
+    monkeypatch.setenv('PITSTOP_CACHE_TEST_FOO', 'bar')
+    env_key, _ = cache.key(str(metaconfig), config)
+    assert env_key != key
+    monkeypatch.setenv('PITSTOP_CACHE_TEST_UNUSED', 'bar')
+    assert cache.key(str(metaconfig), config)[0] == env_key
+    data.write('foo = 2')
+    os.utime(str(data), ns=(0, 0))
+    assert cache.key(str(metaconfig), config)[0] not in (key, env_key)
+
+
+def test_snapshot_uncacheable(cache, tmpdir) -> None:
+    """Ensure unknown and Vault backends aren't cached by default."""
+    metaconfig = tmpdir.join('pitstop.toml')
+    metaconfig.write('')
+    vault = {'backends': [{'driver': 'vault', 'options': {}}]}
+    assert cache.key(str(metaconfig), vault) is None
+    assert cache.key(str(metaconfig), {'backends': [{'driver': 'x'}]}) is None
+    cache.vault_max_age = 60
+    assert cache.key(str(metaconfig), vault)[1] == 60
+
+
+def test_snapshot_store(cache) -> None:
+    """Store, load, expire and clear snapshots."""
+    assert cache.load('key') is None
+    cache.store('key', {'foo': 'bar'})
+    assert cache.load('key') == {'foo': 'bar'}
+    assert os.stat(cache._path('key')).st_mode & 0o777 == 0o600
+    assert os.stat(cache.snapshots_dir).st_mode & 0o777 == 0o700
+    assert cache.load('key', max_age=-1) is None
+    cache.clear()
+    assert cache.load('key') is None
+
+
+def test_decode_cache(tmpdir) -> None:
+    """Store, load and evict decoded documents."""
+    cache = pitstop.cache.DecodeCache(
+        directory=str(tmpdir.join('cache')), max_size=150
+    )
+    encoding = pitstop.encodings.toml.TOMLEncoding.with_options()()
+    key = cache.key('digest', encoding)
+    assert cache.key('digest', encoding, ['a']) != key
+    assert cache.key('other', encoding) != key
+    assert cache.load(key) is None
+    cache.store(key, {'foo': 'x' * 50})
+    assert cache.load(key) == {'foo': 'x' * 50}
+    os.utime(cache._path(key), ns=(0, 0))
+    other = cache.key('other', encoding)
+    cache.store(other, {'bar': 'y' * 100})
+    assert cache.load(key) is None
+    assert cache.load(other) == {'bar': 'y' * 100}
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        b'',
+        b'I1\n',
+        b'\x80\x99',
+        b'cnonexistent\nThing\n.',
+        b'cpitstop.cache\nNonexistent\n.',
+    ],
+)
+def test_decode_cache_corrupt(tmpdir, data) -> None:
+    """Treat entries that fail to unpickle as misses."""
+    cache = pitstop.cache.DecodeCache(directory=str(tmpdir))
+    pitstop.cache.atomic_write(cache._path('key'), data)
+    assert cache.load('key') is None
+
+
+def test_decode_cache_touch_failed(tmpdir, monkeypatch) -> None:
+    """Load entries whose access time can't be updated."""
+    cache = pitstop.cache.DecodeCache(directory=str(tmpdir))
+    cache.store('key', {'foo': 'bar'})
+
+    def utime(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, 'utime', utime)
+    assert cache.load('key') == {'foo': 'bar'}
+
+
+def test_decode_cache_backend(tmpdir, monkeypatch) -> None:
+    """Load decoded documents from the cache in filesystem backends."""
+    p = tmpdir.join('config.toml')
+    p.write('foo = "bar"')
+    options = pitstop.backends.fs.FilesystemBackendOptions(
+        path=str(p), decode_cache=True, decode_cache_dir=str(tmpdir)
+    )
+    encoding = pitstop.encodings.toml.TOMLEncoding.with_options()
+    backends = [
+        pitstop.backends.fs.FilesystemBackend(
+            options, priority=1, name='fs', encoding=encoding()
+        )
+        for _ in range(2)
+    ]
+    backends[0].connect()
+    backends[0].decode()
+    monkeypatch.setattr(
+        pitstop.encodings.toml.TOMLEncoding,
+        'decode',
+        lambda self, s: pytest.fail('Decoded again'),
+    )
+    backends[1].connect()
+    backends[1].decode()
+    assert backends[1].get('foo') == 'bar'
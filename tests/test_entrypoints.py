@@ -0,0 +1,29 @@
+"""Entry point registry unit tests."""
+import subprocess
+import sys
+
+import pytest
+
+import pitstop.backends.fs
+import pitstop.entrypoints
+import pitstop.errors
+
+
+def test_load() -> None:
+    """Look up and load installed plugins."""
+    assert {'env', 'fs'} <= pitstop.entrypoints.names('pitstop.backends')
+    backend = pitstop.entrypoints.load('pitstop.backends', 'fs')
+    assert backend is pitstop.backends.fs.FilesystemBackend
+    with pytest.raises(pitstop.errors.EntrypointError):
+        pitstop.entrypoints.load('pitstop.backends', 'nonexistent')
+
+
+def test_lazy_imports() -> None:
+    """Ensure heavy optional modules aren't imported by the CLI."""
+    code = (
+        'import sys, pitstop.cli, pitstop.strategies.v1; '
+        'print(sorted({"cerberus", "glom", "hvac", "pkg_resources"} '
+        '& set(sys.modules)))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode().strip() == '[]'
@@ -0,0 +1,128 @@
+"""Lazy configuration view unit tests."""
+import pytest
+
+import pitstop.backends.base
+import pitstop.errors
+import pitstop.strategies.v1
+import pitstop.validation
+
+
+SCHEMA = {
+    'name': {'type': 'string'},
+    'db': {
+        'type': 'dict',
+        'schema': {
+            'host': {'type': 'string', 'default': 'localhost'},
+            'port': {'type': 'integer'},
+            'password': {'type': 'string'},
+        },
+    },
+}
+
+
+@pytest.fixture
+def strategy(monkeypatch) -> pitstop.strategies.v1.VersionOneStrategy:
+    """Provide a v1 strategy fixture recording keys read from backends."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    strategy.backends.add(
+        pitstop.backends.base.DictBackend(
+            priority=1,
+            name='dict',
+            obj={'name': 'pitstop', 'db.port': 5432, 'db.password': 1},
+        )
+    )
+    strategy.reads = []
+    get_many = pitstop.backends.base.DictBackend.get_many
+
+    def spy(self, paths):
+        strategy.reads.append(list(paths))
+        return get_many(self, paths)
+
+    monkeypatch.setattr(pitstop.backends.base.DictBackend, 'get_many', spy)
+    return strategy
+
+
+def test_lazy(strategy: pitstop.strategies.v1.VersionOneStrategy) -> None:
+    """Resolve keys on first access only, matching the schema tree."""
+    config = strategy.lazy()
+    assert list(config) == ['name', 'db']
+    assert list(config.db) == ['host', 'port', 'password']
+    assert 'port' in config.db and 'user' not in config.db
+    assert strategy.reads == []
+    assert config.db.port == 5432
+    assert config['db']['port'] == 5432
+    assert config.db is config['db']
+    assert strategy.reads == [['db.port']]
+    with pytest.raises(pitstop.errors.ValidationError):
+        config.db.password
+    with pytest.raises(KeyError):
+        config['user']
+    with pytest.raises(AttributeError):
+        config.user
+    with pytest.raises(AttributeError):
+        config.name = 'other'
+
+
+def test_lazy_batch(
+    strategy: pitstop.strategies.v1.VersionOneStrategy
+) -> None:
+    """Resolve remaining keys of a subtree in one batch."""
+    strategy.backends[0].obj['db.password'] = 'secret'
+    config = strategy.lazy()
+    assert config.name == 'pitstop'
+    assert dict(config.db.items()) == {
+        'host': 'localhost',
+        'port': 5432,
+        'password': 'secret',
+    }
+    assert strategy.reads == [['name'], ['db.host', 'db.port', 'db.password']]
+    assert config.to_dict() == {
+        'name': 'pitstop',
+        'db': {'host': 'localhost', 'port': 5432, 'password': 'secret'},
+    }
+    assert config == strategy.resolve()
+    assert len(strategy.reads) == 3
+
+
+def test_lazy_dependencies(
+    strategy: pitstop.strategies.v1.VersionOneStrategy
+) -> None:
+    """Read keys with cross-field rules, validating the keys they refer to."""
+    strategy.schema = {
+        **SCHEMA,
+        'cache': {
+            'type': 'dict',
+            'schema': {'url': {'type': 'string', 'dependencies': '^name'}},
+        },
+    }
+    strategy.backends[0].obj['cache.url'] = 'redis://'
+    config = strategy.lazy()
+    assert config.cache.url == 'redis://'
+    assert strategy.reads == [['name', 'cache.url']]
+    assert config.cache.to_dict() == {'url': 'redis://'}
+    del strategy.backends[0].obj['name']
+    with pytest.raises(pitstop.errors.ValidationError):
+        strategy.lazy().cache.url
+
+
+def test_lazy_validator_digest(
+    strategy: pitstop.strategies.v1.VersionOneStrategy, monkeypatch
+) -> None:
+    """Hash the schema of a leaf once, however many views read it."""
+    calls = []
+    digest = pitstop.validation.ValidatorCache.digest
+
+    def spy(validator_class, schema):
+        calls.append(schema)
+        return digest(validator_class, schema)
+
+    monkeypatch.setattr(
+        pitstop.validation.ValidatorCache, 'digest', staticmethod(spy)
+    )
+    for _ in range(3):
+        assert strategy.lazy().db.port == 5432
+    assert calls == [
+        {'db': {'type': 'dict', 'schema': {'port': {'type': 'integer'}}}}
+    ]
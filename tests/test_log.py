@@ -0,0 +1,83 @@
+"""Hot path logging unit tests."""
+import logging
+import unittest.mock
+
+import pytest
+
+import pitstop.backends.fs
+import pitstop.encodings.json
+import pitstop.log
+
+
+@pytest.fixture
+def fs_logger():
+    """Provide the filesystem backend's logger, restoring its level."""
+    logger = logging.getLogger('pitstop.backends.fs')
+    level = logger.level
+    yield logger
+    logger.setLevel(level)
+
+
+@pytest.fixture
+def sample_rate():
+    """Restore the sample rate after a test."""
+    rate = pitstop.log.sample_rate()
+    yield
+    pitstop.log.set_sample_rate(rate)
+
+
+def test_sampled(sample_rate):
+    """Guard events by the logger's level and the sample rate."""
+    logging.getLogger('pitstop.tests').setLevel(logging.INFO)
+    hot = pitstop.log.HotLogger('pitstop.tests')
+    assert hot.enabled(logging.INFO)
+    assert hot.sampled(logging.WARN)
+    assert not hot.enabled(logging.DEBUG)
+    assert not hot.sampled(logging.DEBUG)
+    pitstop.log.set_sample_rate(0)
+    assert hot.enabled(logging.INFO)
+    assert not hot.sampled(logging.INFO)
+    with pytest.raises(ValueError):
+        pitstop.log.set_sample_rate(2)
+
+
+@pytest.mark.parametrize('value', ['0.25', 'often', '2', 'nan'])
+def test_sample_rate_environment(value, sample_rate, monkeypatch):
+    """Ignore invalid sample rates from the environment with a warning."""
+    logger = unittest.mock.Mock()
+    monkeypatch.setattr(pitstop.log, 'logger', logger)
+    monkeypatch.setenv('PITSTOP_LOG_SAMPLE_RATE', value)
+    pitstop.log.set_sample_rate(0.5)
+    pitstop.log._load_sample_rate()
+    if value == '0.25':
+        assert pitstop.log.sample_rate() == 0.25
+        assert not logger.method_calls
+    else:
+        assert pitstop.log.sample_rate() == 1
+        logger.warning.assert_called_once_with(
+            'log.sample_rate.invalid', value=value
+        )
+
+
+def test_backend_get_disabled(tmpdir, monkeypatch, fs_logger):
+    """Ensure disabled per-key events don't reach structlog."""
+    p = tmpdir.join('config.json')
+    p.write('{"foo": "bar"}')
+    encoding = pitstop.encodings.json.JSONEncoding.with_options()
+    options = pitstop.backends.fs.FilesystemBackendOptions(path=str(p))
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=1, name='fs', encoding=encoding()
+    )
+    backend.connect()
+    backend.decode()
+    assert backend.index.paths
+    logger = unittest.mock.Mock()
+    monkeypatch.setattr(pitstop.backends.fs, 'logger', logger)
+    fs_logger.setLevel(logging.ERROR)
+    assert backend.get('foo') == 'bar'
+    with pytest.raises(KeyError):
+        backend.get('baz')
+    assert not logger.method_calls
+    fs_logger.setLevel(logging.INFO)
+    backend.get('foo')
+    logger.info.assert_called_once_with('backend.get.succeeded', path='foo')
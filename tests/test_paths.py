@@ -0,0 +1,39 @@
+"""Dotted key path unit tests."""
+import types
+
+import pytest
+
+import pitstop.paths
+
+
+def test_get():
+    """Get nested values from mappings, sequences and objects."""
+    document = {
+        'db': {'replicas': [{'host': 'replica-0'}], 'port': 5432},
+        'app': types.SimpleNamespace(name='pitstop'),
+    }
+    assert pitstop.paths.get(document, 'db.port') == 5432
+    assert pitstop.paths.get(document, 'db.replicas.0.host') == 'replica-0'
+    assert pitstop.paths.get(document, 'app.name') == 'pitstop'
+    for path in ('db.user', 'db.replicas.1', 'db.replicas.x', 'db.port.x'):
+        with pytest.raises(KeyError):
+            pitstop.paths.get(document, path)
+        assert pitstop.paths.get(document, path, None) is None
+    assert pitstop.paths.parse('db.port') is pitstop.paths.parse('db.port')
+
+
+def test_assign():
+    """Assign nested values, creating missing intermediate mappings."""
+    document = {'db': {'replicas': [{}]}}
+    pitstop.paths.assign(document, 'db.primary.host', 'localhost')
+    pitstop.paths.assign(document, 'db.replicas.0.host', 'replica-0')
+    pitstop.paths.assign(document, 'name', 'pitstop')
+    assert document == {
+        'db': {
+            'primary': {'host': 'localhost'},
+            'replicas': [{'host': 'replica-0'}],
+        },
+        'name': 'pitstop',
+    }
+    with pytest.raises(KeyError):
+        pitstop.paths.assign(document, 'db.replicas.1.host', 'replica-1')
@@ -0,0 +1,71 @@
+"""Schema index unit tests."""
+import pytest
+
+import pitstop.schema
+
+
+SCHEMA = {
+    'name': {'type': 'string'},
+    'db': {
+        'type': 'dict',
+        'schema': {
+            'port': {'type': 'integer'},
+            'host': {'type': 'string', 'default': 'localhost'},
+        },
+    },
+    'dbx': {'type': 'string'},
+}
+
+
+@pytest.fixture
+def index() -> pitstop.schema.SchemaIndex:
+    """Provide a schema index fixture."""
+    return pitstop.schema.SchemaIndex(SCHEMA)
+
+
+def test_leaves(index: pitstop.schema.SchemaIndex) -> None:
+    """Ensure leaves are indexed in schema order."""
+    assert list(index) == ['name', 'db.port', 'db.host', 'dbx']
+    assert index['db.port'].type == 'integer'
+    assert index['db.port'].schema == {'type': 'integer'}
+
+
+def test_default(index: pitstop.schema.SchemaIndex) -> None:
+    """Read default values, and ensure unknown paths are rejected."""
+    assert index.default('db.host') == 'localhost'
+    assert index.default('db.port') is None
+    with pytest.raises(KeyError):
+        index.default('db')
+    with pytest.raises(KeyError):
+        index.default('nonexistent')
+
+
+def test_under(index: pitstop.schema.SchemaIndex) -> None:
+    """Find leaves beneath a key path prefix."""
+    assert [leaf.path for leaf in index.under('db')] == ['db.port', 'db.host']
+    assert [leaf.path for leaf in index.under('dbx')] == ['dbx']
+    assert [leaf.path for leaf in index.under('db.host')] == ['db.host']
+    assert index.under('nonexistent') == []
+    assert len(index.under('')) == len(index)
+
+
+def test_children(index: pitstop.schema.SchemaIndex) -> None:
+    """Find fields beneath a key path prefix."""
+    assert index.children('') == {'name': True, 'db': False, 'dbx': True}
+    assert index.children('db') == {'port': True, 'host': True}
+    assert index.children('nonexistent') == {}
+
+
+def test_subschema(index: pitstop.schema.SchemaIndex) -> None:
+    """Prune the schema to selected leaves."""
+    assert index.subschema(['db.host', 'name']) == {
+        'db': {
+            'type': 'dict',
+            'schema': {'host': {'type': 'string', 'default': 'localhost'}},
+        },
+        'name': {'type': 'string'},
+    }
+    assert index.subschema([]) == {}
+    assert index.subschema(index) == SCHEMA
+    with pytest.raises(KeyError):
+        index.subschema(['db'])
@@ -0,0 +1,143 @@
+"""Configuration daemon unit tests."""
+import dataclasses
+import errno
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+import pitstop.backends.base
+import pitstop.client
+import pitstop.server
+import pitstop.strategies.v1
+
+
+@dataclasses.dataclass
+class ReloadableDictBackend(
+    pitstop.backends.base.ReloadableObjectBackend,
+    pitstop.backends.base.DictBackend,
+):
+    """A dictionary backend that reports a change on every reload."""
+
+    def reload(self) -> bool:
+        """Report a change."""
+        return True
+
+
+def make_strategy() -> pitstop.strategies.v1.VersionOneStrategy:
+    """Create a strategy reading from a reloadable dictionary backend."""
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema={
+            'name': {'type': 'string'},
+            'db': {'type': 'dict', 'schema': {'port': {'type': 'integer'}}},
+        }
+    )
+    strategy.backends.add(
+        ReloadableDictBackend(
+            priority=1, name='dict', obj={'name': 'foo', 'db.port': 1}
+        )
+    )
+    return strategy
+
+
+@pytest.fixture
+def server(tmpdir):
+    """Provide a running configuration daemon fixture."""
+    server = pitstop.server.Server(
+        make_strategy(),
+        socket_path=str(tmpdir.join('s.sock')),
+        reload_interval=0,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_requests(server: pitstop.server.Server) -> None:
+    """Resolve and read keys through the daemon."""
+    path = server.socket_path
+    assert pitstop.client.request('PING', path) == 'pong'
+    assert pitstop.client.request('RESOLVE', path) == {
+        'name': 'foo',
+        'db': {'port': 1},
+    }
+    assert pitstop.client.request('GET db.port', path) == 1
+    with pytest.raises(pitstop.client.ClientError):
+        pitstop.client.request('GET db.host', path)
+    with pytest.raises(pitstop.client.ClientError):
+        pitstop.client.request('FROB', path)
+
+
+def test_error_framing(server: pitstop.server.Server, monkeypatch) -> None:
+    """Keep error replies on a single line."""
+    dispatch = server.dispatch
+
+    def spy(command, arg):
+        if command == 'FROB':
+            raise ValueError('bad\nrequest')
+        return dispatch(command, arg)
+
+    monkeypatch.setattr(server, 'dispatch', spy)
+    with pytest.raises(pitstop.client.ClientError) as e:
+        pitstop.client.request('FROB', server.socket_path)
+    assert str(e.value) == 'ValueError: bad\nrequest'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.socket_path)
+        sock.sendall(b'FROB\nPING\n')
+        with sock.makefile('rb') as f:
+            f.readline()
+            assert f.readline() == b'OK "pong"\n'
+
+
+def test_refresh(server: pitstop.server.Server) -> None:
+    """Ensure configuration is resolved again when backends change."""
+    backend = server.strategy.backends[0]
+    backend.obj['name'] = 'bar'
+    assert server.refresh()
+    assert pitstop.client.request('GET name', server.socket_path) == 'bar'
+
+
+def test_client_main(server: pitstop.server.Server, capsys) -> None:
+    """Print values with the client entrypoint."""
+    path = server.socket_path
+    assert pitstop.client.main(['-s', path, 'get', 'name']) == 0
+    assert pitstop.client.main(['-s', path, 'get', 'db']) == 0
+    assert capsys.readouterr().out == 'foo\n{"port": 1}\n'
+    assert pitstop.client.main(['-s', path, 'get', 'nonexistent']) == 1
+    assert pitstop.client.main(['frob']) == 2
+
+
+def test_socket_permissions(server: pitstop.server.Server) -> None:
+    """Ensure only the owner can access the socket."""
+    mode = os.stat(server.socket_path).st_mode
+    assert stat.S_ISSOCK(mode)
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_existing_socket_path(
+    server: pitstop.server.Server, tmpdir
+) -> None:
+    """Replace stale sockets only, never files or a running server."""
+    with pytest.raises(OSError) as excinfo:
+        pitstop.server.Server(make_strategy(), socket_path=server.socket_path)
+    assert excinfo.value.errno == errno.EADDRINUSE
+    assert pitstop.client.request('PING', server.socket_path) == 'pong'
+
+    path = tmpdir.join('file')
+    path.write('data')
+    with pytest.raises(FileExistsError):
+        pitstop.server.Server(make_strategy(), socket_path=str(path))
+    assert path.read() == 'data'
+
+    stale = str(tmpdir.join('stale.sock'))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(stale)
+    sock.close()
+    replaced = pitstop.server.Server(make_strategy(), socket_path=stale)
+    replaced.server_close()
+    assert not os.path.exists(stale)
@@ -0,0 +1,146 @@
+"""Incremental validation unit tests."""
+import copy
+import json
+
+import pytest
+
+import pitstop.errors
+import pitstop.strategies.v1
+import pitstop.validation
+
+
+SCHEMA = {
+    'name': {'type': 'string'},
+    'db': {
+        'type': 'dict',
+        'schema': {
+            'host': {'type': 'string', 'default': 'localhost'},
+            'port': {'type': 'integer', 'coerce': int},
+        },
+    },
+    'cache': {
+        'type': 'dict',
+        'schema': {'url': {'type': 'string', 'dependencies': '^name'}},
+    },
+    'debug': {'type': 'boolean', 'excludes': 'level'},
+    'level': {'type': 'integer'},
+}
+
+
+@pytest.fixture
+def validator():
+    """Provide an incremental validator counting validated units."""
+    calls = []
+    validator_class = pitstop.strategies.v1.Validator
+
+    def factory(schema):
+        validator = validator_class(schema)
+        validate = validator.validate
+
+        def counting_validate(document, *args, **kwargs):
+            calls.append(tuple(schema))
+            return validate(document, *args, **kwargs)
+
+        validator.validate = counting_validate
+        return validator
+
+    validator = pitstop.validation.IncrementalValidator(SCHEMA, factory)
+    validator.calls = calls
+    return validator
+
+
+def test_units(validator):
+    """Group top-level fields linked by cross-field rules."""
+    assert validator.units == [('name', 'cache'), ('db',), ('debug', 'level')]
+
+
+def test_validate(validator):
+    """Revalidate only units whose leaf values changed."""
+    leaves = {
+        'name': 'pitstop',
+        'db.host': None,
+        'db.port': '5432',
+        'cache.url': 'redis://',
+        'debug': None,
+        'level': 1,
+    }
+    full = pitstop.strategies.v1.Validator(SCHEMA)
+    document = {
+        'name': 'pitstop',
+        'db': {'host': None, 'port': '5432'},
+        'cache': {'url': 'redis://'},
+        'debug': None,
+        'level': 1,
+    }
+    with pytest.raises(pitstop.errors.ValidationError):
+        validator.validate(leaves)
+    assert not full.validate(document)
+    leaves['debug'] = document['debug'] = False
+    del leaves['level'], document['level']
+    assert full.validate(document)
+    assert validator.validate(leaves) == full.document
+    assert validator.validate(leaves)['db']['port'] == 5432
+    assert len(validator.calls) == 4
+    leaves['db.port'] = '5433'
+    assert validator.validate(dict(leaves))['db']['port'] == 5433
+    assert validator.calls[-1] == ('db',)
+    assert len(validator.calls) == 5
+    validator.invalidate()
+    validator.validate(leaves)
+    assert len(validator.calls) == 8
+
+
+def test_validate_read_only(validator):
+    """Share unchanged units read-only, rather than copying them again."""
+    leaves = {'name': 'pitstop', 'db.port': '5432', 'debug': False}
+    document = validator.validate(leaves)
+    document['name'] = 'other'
+    with pytest.raises(TypeError):
+        document['db']['port'] = 0
+    with pytest.raises(TypeError):
+        document['db'].update(user='root')
+    later = validator.validate(leaves)
+    assert later == {
+        'name': 'pitstop',
+        'db': {'host': 'localhost', 'port': 5432},
+        'debug': False,
+    }
+    assert later['db'] is document['db']
+    assert len(validator.calls) == 3
+    copied = copy.deepcopy(later)
+    copied['db']['port'] = 0
+    assert type(copied['db']) is dict
+    assert json.loads(json.dumps(later)) == later
+
+
+def test_validator_cache(tmpdir, monkeypatch):
+    """Share compiled schemas between validators and processes."""
+    validator_class = pitstop.strategies.v1.Validator
+    schema = {
+        'name': {'type': 'string', 'isentrypoint': 'pitstop.backends'},
+        'db': {
+            'type': 'dict',
+            'schema': {'host': {'type': 'string', 'default': 'localhost'}},
+        },
+    }
+    cache = pitstop.validation.ValidatorCache(directory=str(tmpdir))
+    first = cache.validator(validator_class, schema)
+    second = cache.validator(validator_class, dict(schema))
+    assert first is not second
+    assert first.schema is not second.schema
+    assert first.schema.schema == second.schema.schema
+    first.schema['name']['type'] = 'integer'
+    assert second.schema['name']['type'] == 'string'
+    assert cache.validator(validator_class, schema).validate({'name': 'fs'})
+    assert len(tmpdir.join('validators').listdir()) == 1
+    uncached = [cache.validator(validator_class, SCHEMA) for _ in range(2)]
+    assert uncached[0].schema is not uncached[1].schema
+    assert len(tmpdir.join('validators').listdir()) == 1
+
+    other = pitstop.validation.ValidatorCache(directory=str(tmpdir))
+    monkeypatch.setattr(other, '_store', None)
+    validator = other.validator(validator_class, schema)
+    assert validator.schema is not first.schema
+    assert validator.validate({'name': 'fs', 'db': {}})
+    assert validator.document['db']['host'] == 'localhost'
+    assert not validator.validate({'name': 'nonexistent', 'db': {}})
@@ -0,0 +1,87 @@
+"""Backend watcher unit tests."""
+import os
+import time
+
+import pytest
+
+import pitstop.backends.fs
+import pitstop.encodings.toml
+import pitstop.strategies.v1
+import pitstop.watch
+
+
+SCHEMA = {
+    'name': {'type': 'string'},
+    'db': {'type': 'dict', 'schema': {'port': {'type': 'integer'}}},
+}
+
+
+@pytest.fixture
+def config(tmpdir):
+    """Provide a configuration file path fixture."""
+    p = tmpdir.join('config.toml')
+    p.write('name = "foo"\n[db]\nport = 1\n')
+    return p
+
+
+@pytest.fixture
+def strategy(config) -> pitstop.strategies.v1.VersionOneStrategy:
+    """Provide a resolved v1 strategy fixture with a filesystem backend."""
+    encoding = pitstop.encodings.toml.TOMLEncoding.with_options()
+    options = pitstop.backends.fs.FilesystemBackendOptions(path=str(config))
+    backend = pitstop.backends.fs.FilesystemBackend(
+        options, priority=1, name='fs', encoding=encoding()
+    )
+    backend.connect()
+    backend.decode()
+    strategy = pitstop.strategies.v1.VersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    strategy.backends.add(backend)
+    strategy.resolve()
+    return strategy
+
+
+def write(p, contents: str) -> None:
+    """Write **contents**, making sure the file signature changes."""
+    p.write(contents)
+    st = os.stat(str(p))
+    os.utime(str(p), ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.mark.parametrize('use_inotify', [False, None])
+def test_check(strategy, config, use_inotify) -> None:
+    """Refresh changed keys, and swap the snapshot."""
+    watcher = pitstop.watch.Watcher(strategy, use_inotify=use_inotify)
+    calls = []
+    strategy.on_change(lambda changed, snapshot: calls.append(changed))
+    before = strategy.snapshot
+    assert watcher.check() == set()
+    write(config, 'name = "foo"\n[db]\nport = 2\n')
+    assert watcher.check() == {'db.port'}
+    assert calls == [{'db.port'}]
+    assert before == {'name': 'foo', 'db': {'port': 1}}
+    assert strategy.snapshot == {'name': 'foo', 'db': {'port': 2}}
+    watcher.stop()
+
+
+def test_start(strategy, config) -> None:
+    """Pick up file changes in the background."""
+    watcher = pitstop.watch.Watcher(strategy, interval=0.05).start()
+    try:
+        write(config, 'name = "bar"\n[db]\nport = 1\n')
+        deadline = time.monotonic() + 5
+        while strategy.snapshot['name'] != 'bar':
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+
+def test_async_strategy() -> None:
+    """Ensure asyncio strategies, which refresh in coroutines, are rejected."""
+    strategy = pitstop.strategies.v1.AsyncVersionOneStrategy.with_options()(
+        schema=SCHEMA
+    )
+    with pytest.raises(TypeError):
+        pitstop.watch.Watcher(strategy, use_inotify=False)